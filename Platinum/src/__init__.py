@@ -32,6 +32,8 @@ from Platinum.src.banking_stub import BankingStub
 from Platinum.src.odoo_client import OdooClient
 from Platinum.src.health_monitor import HealthMonitor
 from Platinum.src.a2a_interface import A2AMessage, A2ATransport, FileBasedTransport
+from Platinum.src.a2a_log import LogTransport
+from Platinum.src.a2a_sqlite import SQLiteTransport
 from Platinum.src.sync_daemon import SyncDaemon
 
 __all__ = [
@@ -57,6 +59,8 @@ __all__ = [
     "A2AMessage",
     "A2ATransport",
     "FileBasedTransport",
+    "LogTransport",
+    "SQLiteTransport",
     # Daemons
     "SyncDaemon",
 ]
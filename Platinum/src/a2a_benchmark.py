@@ -0,0 +1,105 @@
+"""
+A2A transport benchmark - messages/second for send and receive+ack.
+
+Runs each transport against a fresh temporary vault: send N messages one
+at a time, then drain the inbox in batches (receive, then acknowledge
+every message).
+
+Usage:
+    python -m Platinum.src.a2a_benchmark --messages 5000 --batch 100
+"""
+
+import time
+import logging
+import tempfile
+from typing import Callable, Dict, List
+
+from Platinum.src.a2a_interface import A2AMessage, A2ATransport, FileBasedTransport
+from Platinum.src.a2a_log import LogTransport
+from Platinum.src.a2a_sqlite import SQLiteTransport
+
+TRANSPORTS: Dict[str, Callable[[str], A2ATransport]] = {
+    "file": FileBasedTransport,
+    "log": LogTransport,
+    "sqlite": SQLiteTransport,
+}
+
+
+def _drain(transport: A2ATransport, agent: str, batch: int) -> int:
+    if isinstance(transport, LogTransport):
+        received = 0
+        while True:
+            records = transport.receive_many(agent, batch)
+            if not records:
+                return received
+            transport.ack_many(agent, [r.position for r in records])
+            received += len(records)
+    if isinstance(transport, SQLiteTransport):
+        received = 0
+        while True:
+            messages = transport.receive_many(agent, batch, ack=True)
+            if not messages:
+                return received
+            received += len(messages)
+
+    received = 0
+    while True:
+        messages = transport.receive(agent, batch)
+        if not messages:
+            return received
+        for msg in messages:
+            transport.acknowledge(msg.message_id)
+        received += len(messages)
+
+
+def run_benchmark(messages: int = 5000, batch: int = 100,
+                  transports: List[str] = None) -> Dict[str, dict]:
+    """Benchmark the given transports (default: all).
+
+    Returns:
+        {name: {"send_per_sec": float, "receive_per_sec": float, "received": int}}
+    """
+    results = {}
+    for name in transports or list(TRANSPORTS):
+        with tempfile.TemporaryDirectory(prefix=f"a2a-{name}-") as vault:
+            transport = TRANSPORTS[name](vault)
+            start = time.perf_counter()
+            for i in range(messages):
+                transport.send(A2AMessage(sender="cloud", recipient="local", payload={"i": i}))
+            send_elapsed = time.perf_counter() - start
+
+            start = time.perf_counter()
+            received = _drain(transport, "local", batch)
+            receive_elapsed = time.perf_counter() - start
+
+            if hasattr(transport, "close"):
+                transport.close()
+        results[name] = {
+            "send_per_sec": round(messages / max(send_elapsed, 1e-9), 1),
+            "receive_per_sec": round(received / max(receive_elapsed, 1e-9), 1),
+            "received": received,
+        }
+    return results
+
+
+def main():
+    """Entry point: print a messages/second table."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark A2A transports")
+    parser.add_argument("--messages", type=int, default=5000, help="Messages per transport")
+    parser.add_argument("--batch", type=int, default=100, help="Receive batch size")
+    parser.add_argument("--transport", action="append", choices=sorted(TRANSPORTS),
+                        help="Transport to run (repeatable; default: all)")
+    args = parser.parse_args()
+
+    # Per-message INFO logs would dominate the timings
+    logging.disable(logging.INFO)
+    results = run_benchmark(args.messages, args.batch, args.transport)
+    print(f"{'transport':<10} {'send msg/s':>12} {'recv+ack msg/s':>16}")
+    for name, r in results.items():
+        print(f"{name:<10} {r['send_per_sec']:>12,.0f} {r['receive_per_sec']:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,12 +8,15 @@ Usage:
     transport = FileBasedTransport("/path/to/vault")
     msg = A2AMessage(sender="cloud", recipient="local", payload={"action": "request_approval"})
     transport.send(msg)
-    messages = transport.receive("local")
+    messages = transport.receive("local", timeout=5)   # block up to 5s
+    reply = transport.request_and_wait("cloud", "local", "approve_draft", timeout=30)
 """
 
 import json
+import time
 import uuid
 import logging
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -74,12 +77,19 @@ class A2ATransport(ABC):
     """Abstract base class for A2A message transport.
 
     Implementations may use:
-    - File-based (current: Platinum/Signals/)
+    - File-based (current: Platinum/Signals/; FileBasedTransport, LogTransport)
+    - SQLite, for agents sharing a host or volume (SQLiteTransport)
     - Redis pub/sub
     - HTTP webhooks
     - Message queue (RabbitMQ, etc.)
     """
 
+    # agent_name -> (VaultWatcher, Event), started by blocking receives.
+    # Created on first use so subclasses need not call super().__init__().
+    _watchers: Optional[Dict[str, tuple]] = None
+    # Shared by all transports; only held while starting or stopping watchers
+    _watchers_lock = threading.Lock()
+
     @abstractmethod
     def send(self, message: A2AMessage) -> bool:
         """Send a message to another agent.
@@ -93,12 +103,15 @@ class A2ATransport(ABC):
         ...
 
     @abstractmethod
-    def receive(self, agent_name: str, limit: int = 10) -> List[A2AMessage]:
+    def receive(self, agent_name: str, limit: int = 10,
+                timeout: Optional[float] = None) -> List[A2AMessage]:
         """Receive messages for an agent.
 
         Args:
             agent_name: Name of the receiving agent.
             limit: Maximum messages to return.
+            timeout: If the inbox is empty, block up to this many seconds
+                for a message to arrive (None or 0: return immediately).
 
         Returns:
             List of A2AMessage objects.
@@ -122,6 +135,180 @@ class A2ATransport(ABC):
         """Get count of pending messages for an agent."""
         ...
 
+    # ---- blocking receive ----
+
+    # Seconds between inbox checks when watchdog is unavailable
+    poll_interval: float = 0.1
+
+    def _watch_dir(self, agent_name: str) -> Optional[Path]:
+        """Directory whose changes signal new mail for an agent (None: poll only)."""
+        return None
+
+    def _inbox_signature(self, agent_name: str):
+        """Cheap value that changes whenever the agent's inbox changes."""
+        return self.get_pending_count(agent_name)
+
+    def _change_event(self, agent_name: str) -> Optional[threading.Event]:
+        """Event set by a filesystem watcher on the agent's inbox, if one can run."""
+        from Platinum.src.vault_watcher import VaultWatcher, WATCHDOG_AVAILABLE
+
+        watch_dir = self._watch_dir(agent_name)
+        if watch_dir is None or not WATCHDOG_AVAILABLE:
+            return None
+        with self._watchers_lock:
+            if self._watchers is None:
+                self._watchers = {}
+            if agent_name not in self._watchers:
+                event = threading.Event()
+                watcher = VaultWatcher(watch_dir, lambda _path: event.set(), use_watchdog=True)
+                watcher.start()
+                self._watchers[agent_name] = (watcher, event)
+            return self._watchers[agent_name][1]
+
+    def stop_watchers(self) -> None:
+        """Stop the inbox watchers started by blocking receives."""
+        with self._watchers_lock:
+            watchers, self._watchers = self._watchers or {}, {}
+        for watcher, _ in watchers.values():
+            watcher.stop()
+
+    def close(self) -> None:
+        """Release the transport's resources (stops inbox watchers)."""
+        self.stop_watchers()
+
+    def _wait_for(self, agent_name: str, fetch, timeout: Optional[float]) -> list:
+        """Call fetch() until it returns something or `timeout` seconds pass.
+
+        fetch() is retried when the inbox watcher fires or, without one,
+        when _inbox_signature() changes.
+        """
+        result = fetch()
+        if result or not timeout:
+            return result
+
+        deadline = time.monotonic() + timeout
+        event = self._change_event(agent_name)
+        signature = None if event is not None else self._inbox_signature(agent_name)
+        # Anything that landed while the watcher was starting
+        result = fetch()
+        while not result:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return []
+            if event is not None:
+                # Re-check at least once a second in case an event was missed
+                if event.wait(min(remaining, 1.0)):
+                    event.clear()
+            else:
+                time.sleep(min(remaining, self.poll_interval))
+                current = self._inbox_signature(agent_name)
+                if current == signature:
+                    continue
+                signature = current
+            result = fetch()
+        return result
+
+    def wait_for_response(self, agent_name: str, correlation_id: str,
+                          timeout: float = 30) -> Optional[A2AMessage]:
+        """Block until the response to `correlation_id` reaches `agent_name`.
+
+        The response is acknowledged; other queued messages are left alone.
+
+        Returns:
+            The response message, or None on timeout.
+        """
+        def fetch():
+            response = self._find_response(agent_name, correlation_id)
+            return [response] if response else []
+
+        matches = self._wait_for(agent_name, fetch, timeout)
+        if not matches:
+            return None
+        self.acknowledge(matches[0].message_id)
+        return matches[0]
+
+    def _find_response(self, agent_name: str, correlation_id: str) -> Optional[A2AMessage]:
+        """The queued response to `correlation_id`, looking through the whole inbox.
+
+        Transports override this with a lookup that doesn't parse every message.
+        """
+        limit = max(self.get_pending_count(agent_name), 1)
+        for m in self.receive(agent_name, limit=limit):
+            if m.message_type == "response" and m.correlation_id == correlation_id:
+                return m
+        return None
+
+    def request_and_wait(
+        self,
+        sender: str,
+        recipient: str,
+        action: str,
+        data: Optional[dict] = None,
+        timeout: float = 30,
+    ) -> Optional[A2AMessage]:
+        """Send a request and block until its response arrives.
+
+        The recipient answers with send_response(correlation_id=request.message_id).
+
+        Returns:
+            The response message, or None on timeout.
+        """
+        request = self.send_request(sender, recipient, action, data)
+        return self.wait_for_response(sender, request.message_id, timeout)
+
+    def send_request(
+        self,
+        sender: str,
+        recipient: str,
+        action: str,
+        data: Optional[dict] = None,
+    ) -> A2AMessage:
+        """Helper: Send a request message."""
+        msg = A2AMessage(
+            sender=sender,
+            recipient=recipient,
+            message_type="request",
+            payload={"action": action, "data": data or {}},
+        )
+        self.send(msg)
+        return msg
+
+    def send_response(
+        self,
+        sender: str,
+        recipient: str,
+        correlation_id: str,
+        status: str,
+        data: Optional[dict] = None,
+    ) -> A2AMessage:
+        """Helper: Send a response message."""
+        msg = A2AMessage(
+            sender=sender,
+            recipient=recipient,
+            message_type="response",
+            correlation_id=correlation_id,
+            payload={"status": status, "data": data or {}},
+        )
+        self.send(msg)
+        return msg
+
+    def send_notification(
+        self,
+        sender: str,
+        recipient: str,
+        event: str,
+        data: Optional[dict] = None,
+    ) -> A2AMessage:
+        """Helper: Send a notification message."""
+        msg = A2AMessage(
+            sender=sender,
+            recipient=recipient,
+            message_type="notification",
+            payload={"event": event, "data": data or {}},
+        )
+        self.send(msg)
+        return msg
+
 
 class FileBasedTransport(A2ATransport):
     """File-based A2A transport using Platinum/Signals/ directory.
@@ -148,10 +335,13 @@ class FileBasedTransport(A2ATransport):
         try:
             inbox = self._agent_inbox(message.recipient)
             msg_file = inbox / f"MSG-{message.message_id}.json"
-            msg_file.write_text(
+            # Write then rename, so a receiver never sees a half-written message
+            tmp = msg_file.with_name(msg_file.name + ".tmp")
+            tmp.write_text(
                 json.dumps(message.to_dict(), indent=2),
                 encoding="utf-8"
             )
+            tmp.replace(msg_file)
             logger.info(
                 f"A2A message sent: {message.sender} -> {message.recipient} "
                 f"({message.message_type})"
@@ -161,8 +351,19 @@ class FileBasedTransport(A2ATransport):
             logger.error(f"Failed to send A2A message: {e}")
             return False
 
-    def receive(self, agent_name: str, limit: int = 10) -> List[A2AMessage]:
-        """Receive messages from agent's inbox."""
+    def _watch_dir(self, agent_name: str) -> Optional[Path]:
+        return self._agent_inbox(agent_name)
+
+    def _inbox_signature(self, agent_name: str):
+        # New message files bump the directory mtime
+        return self._agent_inbox(agent_name).stat().st_mtime_ns
+
+    def receive(self, agent_name: str, limit: int = 10,
+                timeout: Optional[float] = None) -> List[A2AMessage]:
+        """Receive messages from agent's inbox, optionally blocking up to `timeout` seconds."""
+        return self._wait_for(agent_name, lambda: self._receive_now(agent_name, limit), timeout)
+
+    def _receive_now(self, agent_name: str, limit: Optional[int]) -> List[A2AMessage]:
         inbox = self._agent_inbox(agent_name)
         messages = []
 
@@ -183,6 +384,12 @@ class FileBasedTransport(A2ATransport):
 
         return messages
 
+    def _find_response(self, agent_name: str, correlation_id: str) -> Optional[A2AMessage]:
+        for msg in self._receive_now(agent_name, None):
+            if msg.message_type == "response" and msg.correlation_id == correlation_id:
+                return msg
+        return None
+
     def acknowledge(self, message_id: str) -> bool:
         """Delete a processed message file."""
         # Search all inboxes
@@ -215,56 +422,3 @@ class FileBasedTransport(A2ATransport):
                     except Exception:
                         pass
         return deleted
-
-    def send_request(
-        self,
-        sender: str,
-        recipient: str,
-        action: str,
-        data: Optional[dict] = None,
-    ) -> A2AMessage:
-        """Helper: Send a request message."""
-        msg = A2AMessage(
-            sender=sender,
-            recipient=recipient,
-            message_type="request",
-            payload={"action": action, "data": data or {}},
-        )
-        self.send(msg)
-        return msg
-
-    def send_response(
-        self,
-        sender: str,
-        recipient: str,
-        correlation_id: str,
-        status: str,
-        data: Optional[dict] = None,
-    ) -> A2AMessage:
-        """Helper: Send a response message."""
-        msg = A2AMessage(
-            sender=sender,
-            recipient=recipient,
-            message_type="response",
-            correlation_id=correlation_id,
-            payload={"status": status, "data": data or {}},
-        )
-        self.send(msg)
-        return msg
-
-    def send_notification(
-        self,
-        sender: str,
-        recipient: str,
-        event: str,
-        data: Optional[dict] = None,
-    ) -> A2AMessage:
-        """Helper: Send a notification message."""
-        msg = A2AMessage(
-            sender=sender,
-            recipient=recipient,
-            message_type="notification",
-            payload={"event": event, "data": data or {}},
-        )
-        self.send(msg)
-        return msg
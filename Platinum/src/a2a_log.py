@@ -0,0 +1,478 @@
+"""
+LogTransport - A2A transport on segmented append-only logs.
+
+Each sender appends to its own stream in the recipient's inbox:
+
+    Platinum/Signals/{recipient}/{sender}/seg-00000001.jsonl
+    Platinum/Signals/{recipient}/{sender}/seg-00000002.jsonl   (after rollover)
+
+one compact JSON message per line. Only the sender ever writes a stream
+and only the recipient ever deletes from it (fully consumed, sealed
+segments), so streams sync through VaultSync without merge conflicts.
+
+The recipient keeps a committed read cursor per stream in a local SQLite
+sidecar (Platinum/.state/a2a_log.db), together with acks that arrived out
+of order and a pending counter that is updated incrementally as new bytes
+appear. receive_many() reads forward from the cursor, ack() by
+(recipient, position) is O(1), and get_pending_count() only reads bytes
+appended since the last call. Delivery is at-least-once: if the sidecar is
+lost, unacked and not-yet-deleted messages are delivered again.
+
+Usage:
+    transport = LogTransport("/path/to/vault")
+    transport.send(A2AMessage(sender="cloud", recipient="local", payload={}))
+    for record in transport.receive_many("local", limit=100):
+        handle(record.message)
+        transport.ack("local", record.position)
+"""
+
+import os
+import re
+import json
+import sqlite3
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from pathlib import Path
+
+from Platinum.src.a2a_interface import A2AMessage, A2ATransport
+
+logger = logging.getLogger("platinum.a2a_log")
+
+SEGMENT_BYTES = 1 << 20
+_SEGMENT_RE = re.compile(r"^seg-(\d{8})\.jsonl$")
+_READ_CHUNK = 1 << 16
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS streams (
+    recipient    TEXT NOT NULL,
+    stream       TEXT NOT NULL,
+    cur_segment  INTEGER NOT NULL,
+    cur_offset   INTEGER NOT NULL,
+    scan_segment INTEGER NOT NULL,
+    scan_offset  INTEGER NOT NULL,
+    pending      INTEGER NOT NULL,
+    PRIMARY KEY (recipient, stream)
+);
+CREATE TABLE IF NOT EXISTS acked (
+    recipient   TEXT NOT NULL,
+    stream      TEXT NOT NULL,
+    segment     INTEGER NOT NULL,
+    offset      INTEGER NOT NULL,
+    next_offset INTEGER NOT NULL,
+    PRIMARY KEY (recipient, stream, segment, offset)
+);
+"""
+
+
+@dataclass(frozen=True)
+class LogPosition:
+    """Location of one message: stream (sender), segment number, byte range."""
+    stream: str
+    segment: int
+    offset: int
+    length: int
+
+    @property
+    def end(self) -> int:
+        return self.offset + self.length
+
+
+@dataclass
+class LogRecord:
+    """A received message and the position to ack it by."""
+    position: LogPosition
+    message: A2AMessage
+
+
+@dataclass
+class _StreamState:
+    cur_segment: int
+    cur_offset: int
+    scan_segment: int
+    scan_offset: int
+    pending: int
+
+
+def _segment_name(segment: int) -> str:
+    return f"seg-{segment:08d}.jsonl"
+
+
+def _stream_name(sender: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", sender) or "_"
+
+
+class LogTransport(A2ATransport):
+    """A2A transport storing each inbox as per-sender segmented logs."""
+
+    def __init__(self, vault_path: str, segment_bytes: int = SEGMENT_BYTES,
+                 state_path: Optional[Path] = None):
+        self.vault_path = Path(vault_path)
+        self.signals_dir = self.vault_path / "Platinum" / "Signals"
+        self.signals_dir.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self.state_path = Path(state_path) if state_path else self.vault_path / "Platinum" / ".state" / "a2a_log.db"
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._ids: Dict[str, Tuple[str, LogPosition]] = {}
+        self._conn = sqlite3.connect(
+            str(self.state_path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    # ---- layout ----
+
+    def _stream_dir(self, recipient: str, stream: str) -> Path:
+        return self.signals_dir / recipient / stream
+
+    @staticmethod
+    def _segments(stream_dir: Path) -> List[int]:
+        try:
+            names = os.listdir(stream_dir)
+        except OSError:
+            return []
+        return sorted(int(m.group(1)) for m in map(_SEGMENT_RE.match, names) if m)
+
+    def _streams(self, recipient: str) -> List[str]:
+        inbox = self.signals_dir / recipient
+        try:
+            with os.scandir(inbox) as it:
+                return sorted(e.name for e in it if e.is_dir())
+        except OSError:
+            return []
+
+    # ---- writing ----
+
+    def send(self, message: A2AMessage) -> bool:
+        """Append the message to the sender's stream in the recipient's inbox."""
+        try:
+            stream_dir = self._stream_dir(message.recipient, _stream_name(message.sender))
+            stream_dir.mkdir(parents=True, exist_ok=True)
+            segments = self._segments(stream_dir)
+            segment = segments[-1] if segments else 1
+            path = stream_dir / _segment_name(segment)
+            try:
+                if path.stat().st_size >= self.segment_bytes:
+                    path = stream_dir / _segment_name(segment + 1)
+            except FileNotFoundError:
+                pass
+
+            line = json.dumps(message.to_dict(), separators=(",", ":")).encode("utf-8") + b"\n"
+            # One O_APPEND write per message: concurrent senders never interleave
+            fd = os.open(str(path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+            logger.info(
+                f"A2A message sent: {message.sender} -> {message.recipient} "
+                f"({message.message_type})"
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to send A2A message: {e}")
+            return False
+
+    # ---- reading ----
+
+    def _iter_records(self, stream_dir: Path, stream: str, segment: int,
+                      offset: int) -> Iterator[Tuple[LogPosition, bytes]]:
+        """Yield complete lines from (segment, offset) onwards, across segments."""
+        for seg in self._segments(stream_dir):
+            if seg < segment:
+                continue
+            pos = offset if seg == segment else 0
+            try:
+                f = open(stream_dir / _segment_name(seg), "rb")
+            except FileNotFoundError:
+                continue
+            with f:
+                f.seek(pos)
+                tail = b""
+                while True:
+                    chunk = f.read(_READ_CHUNK)
+                    if not chunk:
+                        break
+                    lines = (tail + chunk).split(b"\n")
+                    tail = lines.pop()
+                    for line in lines:
+                        length = len(line) + 1
+                        yield LogPosition(stream, seg, pos, length), line
+                        pos += length
+            if tail:
+                # Partial last line: still being written (or synced); stop here
+                return
+
+    def _state(self, recipient: str, stream: str) -> _StreamState:
+        row = self._conn.execute(
+            "SELECT cur_segment, cur_offset, scan_segment, scan_offset, pending "
+            "FROM streams WHERE recipient = ? AND stream = ?",
+            (recipient, stream),
+        ).fetchone()
+        if row:
+            return _StreamState(*row)
+        segments = self._segments(self._stream_dir(recipient, stream))
+        first = segments[0] if segments else 1
+        return _StreamState(first, 0, first, 0, 0)
+
+    def _save_state(self, recipient: str, stream: str, st: _StreamState) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO streams "
+            "(recipient, stream, cur_segment, cur_offset, scan_segment, scan_offset, pending) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (recipient, stream, st.cur_segment, st.cur_offset,
+             st.scan_segment, st.scan_offset, st.pending),
+        )
+
+    def _acked(self, recipient: str, stream: str) -> Dict[Tuple[int, int], int]:
+        return {
+            (seg, off): nxt
+            for seg, off, nxt in self._conn.execute(
+                "SELECT segment, offset, next_offset FROM acked WHERE recipient = ? AND stream = ?",
+                (recipient, stream),
+            )
+        }
+
+    def _scan(self, recipient: str, stream: str, st: _StreamState) -> None:
+        """Count records appended since the last scan into st.pending."""
+        if (st.scan_segment, st.scan_offset) < (st.cur_segment, st.cur_offset):
+            st.scan_segment, st.scan_offset = st.cur_segment, st.cur_offset
+        stream_dir = self._stream_dir(recipient, stream)
+        for pos, _ in self._iter_records(stream_dir, stream, st.scan_segment, st.scan_offset):
+            st.pending += 1
+            st.scan_segment, st.scan_offset = pos.segment, pos.end
+
+    def _watch_dir(self, agent_name: str) -> Optional[Path]:
+        inbox = self.signals_dir / agent_name
+        inbox.mkdir(parents=True, exist_ok=True)
+        return inbox
+
+    def _inbox_signature(self, agent_name: str):
+        signature = []
+        for stream in self._streams(agent_name):
+            stream_dir = self._stream_dir(agent_name, stream)
+            segments = self._segments(stream_dir)
+            if segments:
+                try:
+                    size = (stream_dir / _segment_name(segments[-1])).stat().st_size
+                except OSError:
+                    size = -1
+                signature.append((stream, segments[-1], size))
+        return tuple(signature)
+
+    def receive_many(self, agent_name: str, limit: int = 100,
+                     timeout: Optional[float] = None) -> List[LogRecord]:
+        """Return up to `limit` unacknowledged messages, oldest first.
+
+        Messages stay pending until acked; expired and unreadable ones are
+        acked (dropped) as they are encountered. With `timeout`, block up to
+        that many seconds for a message when the inbox is empty.
+        """
+        return self._wait_for(agent_name, lambda: self._receive_now(agent_name, limit), timeout)
+
+    def _receive_now(self, agent_name: str, limit: int) -> List[LogRecord]:
+        records: List[LogRecord] = []
+        with self._lock:
+            for stream in self._streams(agent_name):
+                st = self._state(agent_name, stream)
+                acked = self._acked(agent_name, stream)
+                drop = []
+                taken = 0
+                stream_dir = self._stream_dir(agent_name, stream)
+                for pos, line in self._iter_records(stream_dir, stream, st.cur_segment, st.cur_offset):
+                    if (pos.segment, pos.offset) in acked:
+                        continue
+                    try:
+                        msg = A2AMessage.from_dict(json.loads(line))
+                    except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError) as e:
+                        logger.warning(f"Dropping invalid message at {stream_dir}@{pos.segment}:{pos.offset}: {e}")
+                        drop.append(pos)
+                        continue
+                    if msg.is_expired():
+                        logger.debug(f"Expired message dropped: {msg.message_id}")
+                        drop.append(pos)
+                        continue
+                    records.append(LogRecord(pos, msg))
+                    self._ids[msg.message_id] = (agent_name, pos)
+                    taken += 1
+                    if taken >= limit:
+                        break
+                if drop:
+                    self.ack_many(agent_name, drop)
+
+        records.sort(key=lambda r: r.message.timestamp)
+        return records[:limit]
+
+    def receive(self, agent_name: str, limit: int = 10,
+                timeout: Optional[float] = None) -> List[A2AMessage]:
+        """Receive messages for an agent (acknowledge by message_id)."""
+        return [r.message for r in self.receive_many(agent_name, limit, timeout)]
+
+    def _find_response(self, agent_name: str, correlation_id: str) -> Optional[A2AMessage]:
+        # Lines are compact JSON: only lines carrying the correlation_id are parsed
+        needle = ('"correlation_id":' + json.dumps(correlation_id)).encode("utf-8")
+        with self._lock:
+            for stream in self._streams(agent_name):
+                st = self._state(agent_name, stream)
+                acked = self._acked(agent_name, stream)
+                stream_dir = self._stream_dir(agent_name, stream)
+                for pos, line in self._iter_records(stream_dir, stream, st.cur_segment, st.cur_offset):
+                    if needle not in line or (pos.segment, pos.offset) in acked:
+                        continue
+                    try:
+                        msg = A2AMessage.from_dict(json.loads(line))
+                    except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError):
+                        continue
+                    if (msg.message_type == "response" and msg.correlation_id == correlation_id
+                            and not msg.is_expired()):
+                        self._ids[msg.message_id] = (agent_name, pos)
+                        return msg
+        return None
+
+    # ---- acknowledging ----
+
+    def ack(self, recipient: str, position: LogPosition) -> bool:
+        """Acknowledge one message by its position."""
+        return self.ack_many(recipient, [position]) == 1
+
+    def ack_many(self, recipient: str, positions: Iterable[LogPosition]) -> int:
+        """Acknowledge several messages in one transaction. Returns how many were newly acked."""
+        by_stream: Dict[str, List[LogPosition]] = {}
+        for pos in positions:
+            by_stream.setdefault(pos.stream, []).append(pos)
+
+        count = 0
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for stream, group in by_stream.items():
+                    st = self._state(recipient, stream)
+                    self._scan(recipient, stream, st)
+                    for pos in group:
+                        if (pos.segment, pos.offset) < (st.cur_segment, st.cur_offset):
+                            continue
+                        if (pos.segment, pos.end) > (st.scan_segment, st.scan_offset):
+                            continue  # Not a record we have seen
+                        cur = self._conn.execute(
+                            "INSERT OR IGNORE INTO acked "
+                            "(recipient, stream, segment, offset, next_offset) VALUES (?, ?, ?, ?, ?)",
+                            (recipient, stream, pos.segment, pos.offset, pos.end),
+                        )
+                        if cur.rowcount:
+                            st.pending -= 1
+                            count += 1
+                    self._advance(recipient, stream, st)
+                    self._save_state(recipient, stream, st)
+                self._conn.execute("COMMIT")
+            except (sqlite3.Error, OSError):
+                self._conn.execute("ROLLBACK")
+                raise
+        return count
+
+    def _advance(self, recipient: str, stream: str, st: _StreamState) -> None:
+        """Move the cursor over acked records and drop fully consumed sealed segments."""
+        stream_dir = self._stream_dir(recipient, stream)
+        segments = None
+        while True:
+            row = self._conn.execute(
+                "SELECT next_offset FROM acked "
+                "WHERE recipient = ? AND stream = ? AND segment = ? AND offset = ?",
+                (recipient, stream, st.cur_segment, st.cur_offset),
+            ).fetchone()
+            if row:
+                self._conn.execute(
+                    "DELETE FROM acked WHERE recipient = ? AND stream = ? AND segment = ? AND offset = ?",
+                    (recipient, stream, st.cur_segment, st.cur_offset),
+                )
+                st.cur_offset = row[0]
+                continue
+
+            if segments is None:
+                segments = self._segments(stream_dir)
+            later = [s for s in segments if s > st.cur_segment]
+            if not later:
+                return
+            path = stream_dir / _segment_name(st.cur_segment)
+            try:
+                size = path.stat().st_size
+            except FileNotFoundError:
+                size = st.cur_offset
+            if st.cur_offset < size:
+                return
+            # Sealed (the sender has rolled over) and fully consumed
+            path.unlink(missing_ok=True)
+            st.cur_segment, st.cur_offset = later[0], 0
+            if (st.scan_segment, st.scan_offset) < (st.cur_segment, st.cur_offset):
+                st.scan_segment, st.scan_offset = st.cur_segment, st.cur_offset
+
+    def acknowledge(self, message_id: str) -> bool:
+        """Acknowledge a message by ID (positions are remembered from receive)."""
+        with self._lock:
+            entry = self._ids.pop(message_id, None)
+            if entry is None:
+                entry = self._find(message_id)
+            if entry is None:
+                return False
+            recipient, position = entry
+            acked = self.ack(recipient, position)
+        if acked:
+            logger.debug(f"Message acknowledged: {message_id}")
+        return acked
+
+    def _find(self, message_id: str) -> Optional[Tuple[str, LogPosition]]:
+        """Locate a pending message not seen by receive() (scans pending records)."""
+        needle = f'"message_id":"{message_id}"'.encode("utf-8")
+        for inbox in sorted(p.name for p in self.signals_dir.iterdir() if p.is_dir()):
+            for stream in self._streams(inbox):
+                st = self._state(inbox, stream)
+                stream_dir = self._stream_dir(inbox, stream)
+                for pos, line in self._iter_records(stream_dir, stream, st.cur_segment, st.cur_offset):
+                    if needle in line:
+                        return inbox, pos
+        return None
+
+    # ---- housekeeping ----
+
+    def get_pending_count(self, agent_name: str) -> int:
+        """Count pending messages, reading only bytes appended since the last call."""
+        total = 0
+        with self._lock:
+            for stream in self._streams(agent_name):
+                st = self._state(agent_name, stream)
+                before = (st.scan_segment, st.scan_offset, st.pending)
+                self._scan(agent_name, stream, st)
+                if (st.scan_segment, st.scan_offset, st.pending) != before:
+                    self._save_state(agent_name, stream, st)
+                total += st.pending
+        return total
+
+    def cleanup_expired(self) -> int:
+        """Drop expired pending messages from every inbox. Returns count dropped."""
+        dropped = 0
+        with self._lock:
+            for inbox in sorted(p.name for p in self.signals_dir.iterdir() if p.is_dir()):
+                for stream in self._streams(inbox):
+                    st = self._state(inbox, stream)
+                    acked = self._acked(inbox, stream)
+                    stream_dir = self._stream_dir(inbox, stream)
+                    expired = []
+                    for pos, line in self._iter_records(stream_dir, stream, st.cur_segment, st.cur_offset):
+                        if (pos.segment, pos.offset) in acked:
+                            continue
+                        try:
+                            if A2AMessage.from_dict(json.loads(line)).is_expired():
+                                expired.append(pos)
+                        except Exception:
+                            pass
+                    if expired:
+                        dropped += self.ack_many(inbox, expired)
+        return dropped
+
+    def close(self) -> None:
+        """Close the state database connection."""
+        self.stop_watchers()
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,209 @@
+"""
+SQLiteTransport - A2A transport for agents sharing a host or volume.
+
+All inboxes live in one SQLite database in WAL mode, so readers never
+block the writer:
+
+- messages are indexed by (recipient, timestamp), and receive is a single
+  `SELECT ... ORDER BY timestamp LIMIT n` on that index;
+- receive_many(ack=True) reads and deletes a batch in one transaction, so
+  a batch is handed out exactly once;
+- TTL expiry is a range delete on the expires_at index.
+
+Unlike FileBasedTransport and LogTransport the database is not synced by
+VaultSync; use it only when both agents can open the same file.
+
+Usage:
+    transport = SQLiteTransport("/path/to/vault")
+    transport.send(A2AMessage(sender="cloud", recipient="local", payload={}))
+    batch = transport.receive_many("local", limit=100, ack=True)
+"""
+
+import json
+import time
+import sqlite3
+import logging
+import threading
+from datetime import datetime
+from typing import Iterable, List, Optional
+from pathlib import Path
+
+from Platinum.src.a2a_interface import A2AMessage, A2ATransport
+
+logger = logging.getLogger("platinum.a2a_sqlite")
+
+_EPOCH = datetime(1970, 1, 1)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    seq        INTEGER PRIMARY KEY AUTOINCREMENT,
+    message_id TEXT NOT NULL UNIQUE,
+    recipient  TEXT NOT NULL,
+    timestamp  TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    body       TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_messages_inbox ON messages (recipient, timestamp, seq);
+CREATE INDEX IF NOT EXISTS idx_messages_expiry ON messages (expires_at);
+"""
+
+
+def _expires_at(message: A2AMessage) -> float:
+    try:
+        created = (datetime.fromisoformat(message.timestamp) - _EPOCH).total_seconds()
+    except ValueError:
+        created = time.time()
+    return created + message.ttl_seconds
+
+
+class SQLiteTransport(A2ATransport):
+    """A2A transport backed by a shared SQLite database."""
+
+    def __init__(self, vault_path: str, db_path: Optional[Path] = None):
+        self.vault_path = Path(vault_path)
+        self.db_path = Path(db_path) if db_path else self.vault_path / "Platinum" / ".state" / "a2a.db"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, isolation_level=None, timeout=30
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._local_writes = 0
+
+    def send(self, message: A2AMessage) -> bool:
+        """Insert the message into the recipient's inbox."""
+        return self.send_many([message]) == 1
+
+    def send_many(self, messages: Iterable[A2AMessage]) -> int:
+        """Insert several messages in one transaction. Returns the number sent."""
+        rows = [
+            (m.message_id, m.recipient, m.timestamp, _expires_at(m),
+             json.dumps(m.to_dict(), separators=(",", ":")))
+            for m in messages
+        ]
+        try:
+            with self._lock:
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO messages "
+                        "(message_id, recipient, timestamp, expires_at, body) VALUES (?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                    self._conn.execute("COMMIT")
+                except sqlite3.Error:
+                    self._conn.execute("ROLLBACK")
+                    raise
+                self._local_writes += 1
+        except sqlite3.Error as e:
+            logger.error(f"Failed to send A2A messages: {e}")
+            return 0
+        logger.debug(f"A2A messages sent: {len(rows)}")
+        return len(rows)
+
+    def _inbox_signature(self, agent_name: str):
+        # data_version moves when another connection commits; our own
+        # sends are counted locally
+        with self._lock:
+            version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        return version, self._local_writes
+
+    def receive_many(self, agent_name: str, limit: int = 100, ack: bool = False,
+                     timeout: Optional[float] = None) -> List[A2AMessage]:
+        """Return up to `limit` unexpired messages, oldest first.
+
+        Args:
+            agent_name: Receiving agent.
+            limit: Batch size.
+            ack: Delete the returned batch in the same transaction.
+            timeout: Block up to this many seconds for a message when the
+                inbox is empty.
+        """
+        return self._wait_for(
+            agent_name, lambda: self._receive_now(agent_name, limit, ack), timeout
+        )
+
+    def _receive_now(self, agent_name: str, limit: int, ack: bool) -> List[A2AMessage]:
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE" if ack else "BEGIN")
+            try:
+                rows = self._conn.execute(
+                    "SELECT seq, body FROM messages "
+                    "WHERE recipient = ? AND expires_at >= ? "
+                    "ORDER BY timestamp, seq LIMIT ?",
+                    (agent_name, now, limit),
+                ).fetchall()
+                if ack and rows:
+                    self._conn.executemany(
+                        "DELETE FROM messages WHERE seq = ?", [(r[0],) for r in rows]
+                    )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+        return [A2AMessage.from_dict(json.loads(body)) for _, body in rows]
+
+    def receive(self, agent_name: str, limit: int = 10,
+                timeout: Optional[float] = None) -> List[A2AMessage]:
+        """Receive messages for an agent (they stay queued until acknowledged)."""
+        return self.receive_many(agent_name, limit, timeout=timeout)
+
+    def _find_response(self, agent_name: str, correlation_id: str) -> Optional[A2AMessage]:
+        # Bodies are compact JSON, so the correlation_id pair narrows the scan in SQL
+        needle = '"correlation_id":' + json.dumps(correlation_id)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT body FROM messages "
+                "WHERE recipient = ? AND expires_at >= ? AND instr(body, ?) > 0 "
+                "ORDER BY timestamp, seq",
+                (agent_name, time.time(), needle),
+            ).fetchall()
+        for (body,) in rows:
+            msg = A2AMessage.from_dict(json.loads(body))
+            if msg.message_type == "response" and msg.correlation_id == correlation_id:
+                return msg
+        return None
+
+    def acknowledge(self, message_id: str) -> bool:
+        """Delete a processed message."""
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM messages WHERE message_id = ?", (message_id,))
+        return cur.rowcount > 0
+
+    def acknowledge_many(self, message_ids: Iterable[str]) -> int:
+        """Delete several processed messages in one transaction."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                cur = self._conn.executemany(
+                    "DELETE FROM messages WHERE message_id = ?", [(m,) for m in message_ids]
+                )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+        return cur.rowcount
+
+    def get_pending_count(self, agent_name: str) -> int:
+        """Count unexpired messages queued for an agent."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM messages WHERE recipient = ? AND expires_at >= ?",
+                (agent_name, time.time()),
+            ).fetchone()
+        return row[0]
+
+    def cleanup_expired(self) -> int:
+        """Remove all expired messages. Returns count deleted."""
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM messages WHERE expires_at < ?", (time.time(),))
+        return cur.rowcount
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.stop_watchers()
+        with self._lock:
+            self._conn.close()
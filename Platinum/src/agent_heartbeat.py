@@ -1,9 +1,14 @@
 """
 AgentHeartbeat - Agent health monitoring and status tracking.
 
-Reusable Platinum Skill: Tracks agent liveness via periodic heartbeat
-files written to the Updates/ directory. Supports background threading
-for continuous heartbeat emission.
+Reusable Platinum Skill: Tracks agent liveness via periodic heartbeats.
+Supports background threading for continuous heartbeat emission.
+
+Every beat is recorded in the local HeartbeatStore. A compact copy is
+published to Updates/<agent>_heartbeat.json for the agent on the other
+side of VaultSync, but only when the agent's status changes or every
+`publish_interval` seconds (default: 10 beats), so heartbeats no longer
+produce a git commit every sync cycle.
 
 Usage:
     hb = AgentHeartbeat("cloud_agent", "/path/to/vault")
@@ -14,85 +19,117 @@ Usage:
 import json
 import threading
 import time
-from datetime import datetime, timedelta
-from typing import Optional, List
+from datetime import datetime
+from typing import Dict, Optional, List
 from pathlib import Path
 
+from Platinum.src.heartbeat_store import HeartbeatStore
+
 
 class AgentHeartbeat:
-    """Agent health monitoring via periodic heartbeat files."""
+    """Agent health monitoring via periodic heartbeats."""
 
-    def __init__(self, agent_name: str, vault_path: str, interval: int = 30):
+    def __init__(self, agent_name: str, vault_path: str, interval: int = 30,
+                 publish_interval: Optional[int] = None):
         self.agent_name = agent_name
         self.vault_path = Path(vault_path)
         self.interval = interval
+        self.publish_interval = publish_interval if publish_interval is not None else interval * 10
         self.updates_dir = self.vault_path / "Platinum" / "Updates"
         self.updates_dir.mkdir(parents=True, exist_ok=True)
+        self.store = HeartbeatStore.for_vault(str(self.vault_path))
         self._background_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        self._published_at: Optional[float] = None
+        self._published_status: Optional[str] = None
 
     def _heartbeat_path(self, agent_name: str) -> Path:
         return self.updates_dir / f"{agent_name}_heartbeat.json"
 
-    def beat(self, current_task: Optional[str] = None) -> None:
-        """Write a heartbeat file for this agent."""
+    def beat(self, current_task: Optional[str] = None, status: str = "online") -> None:
+        """Record a heartbeat for this agent."""
         heartbeat_data = {
             "agent_name": self.agent_name,
-            "status": "online",
+            "status": status,
             "current_task": current_task,
             "timestamp": datetime.utcnow().isoformat(),
             "interval": self.interval,
         }
+        self.store.put(heartbeat_data)
+
+        now = time.monotonic()
+        if (
+            status != self._published_status
+            or self._published_at is None
+            or now - self._published_at >= self.publish_interval
+        ):
+            self._publish(heartbeat_data)
+            self._published_at = now
+            self._published_status = status
+
+    def _publish(self, heartbeat_data: dict) -> None:
+        """Write the compact copy other machines see through VaultSync."""
+        # Remote readers judge staleness by how often this file is refreshed
+        published = dict(heartbeat_data, interval=max(self.interval, self.publish_interval))
         path = self._heartbeat_path(self.agent_name)
-        path.write_text(json.dumps(heartbeat_data, indent=2), encoding="utf-8")
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(published, separators=(",", ":")), encoding="utf-8")
+        tmp.replace(path)
 
-    def is_alive(self, agent_name: str, timeout: int = 60) -> bool:
-        """Check if an agent is responsive (heartbeat within timeout seconds)."""
-        path = self._heartbeat_path(agent_name)
-        if not path.exists():
-            return False
+    @staticmethod
+    def read_all(vault_path: str) -> Dict[str, dict]:
+        """Return the last heartbeat of every known agent, keyed by agent name.
 
+        Picks up heartbeats published by the other agent, then reads all
+        agents from the local store in one query.
+        """
+        store = HeartbeatStore.for_vault(vault_path)
+        store.ingest_published(Path(vault_path) / "Platinum" / "Updates")
+        return store.read_all()
+
+    @staticmethod
+    def _age_seconds(record: dict) -> Optional[float]:
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-            last_beat = datetime.fromisoformat(data["timestamp"])
-            return (datetime.utcnow() - last_beat) < timedelta(seconds=timeout)
-        except (json.JSONDecodeError, KeyError, ValueError):
+            last_beat = datetime.fromisoformat(record["timestamp"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        return (datetime.utcnow() - last_beat).total_seconds()
+
+    def is_alive(self, agent_name: str, timeout: int = 60) -> bool:
+        """Check if an agent is responsive (heartbeat within timeout seconds)."""
+        record = self.read_all(str(self.vault_path)).get(agent_name)
+        if record is None:
             return False
+        age = self._age_seconds(record)
+        return age is not None and age < timeout
+
+    def _status_from_record(self, record: dict) -> dict:
+        data = dict(record)
+        age = self._age_seconds(record)
+        if age is None:
+            data.update(status="error", current_task=None, timestamp=None)
+        elif age > max(self.interval, data.get("interval") or 0) * 2:
+            data["status"] = "stale"
+        return data
 
     def get_status(self, agent_name: str) -> dict:
         """Get the last heartbeat data for an agent."""
-        path = self._heartbeat_path(agent_name)
-        if not path.exists():
+        record = self.read_all(str(self.vault_path)).get(agent_name)
+        if record is None:
             return {
                 "agent_name": agent_name,
                 "status": "offline",
                 "current_task": None,
                 "timestamp": None,
             }
-
-        try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-            # Check if stale
-            last_beat = datetime.fromisoformat(data["timestamp"])
-            if (datetime.utcnow() - last_beat) > timedelta(seconds=self.interval * 2):
-                data["status"] = "stale"
-            return data
-        except (json.JSONDecodeError, KeyError, ValueError):
-            return {
-                "agent_name": agent_name,
-                "status": "error",
-                "current_task": None,
-                "timestamp": None,
-            }
+        return self._status_from_record(record)
 
     def get_all_agents(self) -> List[dict]:
-        """Get status of all known agents from heartbeat files."""
-        agents = []
-        if self.updates_dir.exists():
-            for f in self.updates_dir.glob("*_heartbeat.json"):
-                agent_name = f.stem.replace("_heartbeat", "")
-                agents.append(self.get_status(agent_name))
-        return agents
+        """Get status of all known agents."""
+        return [
+            self._status_from_record(record)
+            for record in self.read_all(str(self.vault_path)).values()
+        ]
 
     @classmethod
     def get_health_summary(cls, vault_path: str, interval: int = 30) -> dict:
@@ -101,31 +138,26 @@ class AgentHeartbeat:
         Returns:
             Dict with agent names as keys and health status dicts as values.
         """
-        updates_dir = Path(vault_path) / "Platinum" / "Updates"
         summary = {}
-        if updates_dir.exists():
-            for f in updates_dir.glob("*_heartbeat.json"):
-                agent_name = f.stem.replace("_heartbeat", "")
-                try:
-                    data = json.loads(f.read_text(encoding="utf-8"))
-                    last_beat = datetime.fromisoformat(data["timestamp"])
-                    age_seconds = (datetime.utcnow() - last_beat).total_seconds()
-                    is_stale = age_seconds > interval * 2
-                    summary[agent_name] = {
-                        "status": "stale" if is_stale else data.get("status", "unknown"),
-                        "current_task": data.get("current_task"),
-                        "last_heartbeat": data["timestamp"],
-                        "age_seconds": round(age_seconds, 1),
-                        "healthy": not is_stale and data.get("status") == "online",
-                    }
-                except (json.JSONDecodeError, KeyError, ValueError):
-                    summary[agent_name] = {
-                        "status": "error",
-                        "current_task": None,
-                        "last_heartbeat": None,
-                        "age_seconds": None,
-                        "healthy": False,
-                    }
+        for agent_name, record in cls.read_all(vault_path).items():
+            age_seconds = cls._age_seconds(record)
+            if age_seconds is None:
+                summary[agent_name] = {
+                    "status": "error",
+                    "current_task": None,
+                    "last_heartbeat": None,
+                    "age_seconds": None,
+                    "healthy": False,
+                }
+                continue
+            is_stale = age_seconds > max(interval, record.get("interval") or 0) * 2
+            summary[agent_name] = {
+                "status": "stale" if is_stale else record.get("status", "unknown"),
+                "current_task": record.get("current_task"),
+                "last_heartbeat": record["timestamp"],
+                "age_seconds": round(age_seconds, 1),
+                "healthy": not is_stale and record.get("status") == "online",
+            }
         return summary
 
     def start_background(self) -> None:
@@ -152,13 +184,7 @@ class AgentHeartbeat:
             self._background_thread.join(timeout=5)
             self._background_thread = None
 
-        # Write offline status
-        path = self._heartbeat_path(self.agent_name)
-        if path.exists():
-            try:
-                data = json.loads(path.read_text(encoding="utf-8"))
-                data["status"] = "offline"
-                data["timestamp"] = datetime.utcnow().isoformat()
-                path.write_text(json.dumps(data, indent=2), encoding="utf-8")
-            except (json.JSONDecodeError, KeyError):
-                pass
+        # Record offline status (a status change is always published)
+        last = self.store.get(self.agent_name)
+        if last is not None:
+            self.beat(current_task=last.get("current_task"), status="offline")
@@ -0,0 +1,407 @@
+"""
+AuditLog - Rotating, indexed JSONL sink for structured agent logs.
+
+Records are appended to an active segment, <stream>.jsonl. Once it
+reaches max_bytes, or its first record is older than max_age seconds, the
+next write seals it: the segment is compressed to
+<stream>-<seq>.jsonl.zst (left as .jsonl when zstandard is not installed)
+and described in a small index, <stream>.index.json:
+
+    {"segments": [{"file": "execution_log-000001.jsonl.zst", "count": 812,
+                   "first_ts": 1760781600.0, "last_ts": 1760785199.2,
+                   "keys": {"draft_id": ["d1", "d2", ...]}}]}
+
+Sealed segments never change, so VaultSync only pushes the new ones plus
+the active segment and the index. query() opens only the segments whose
+time range and indexed key values can match.
+
+A stream has a single writer (one AuditLog per process and stream).
+
+An active segment written before AuditLog (records without "ts", such as
+the old execution_log.jsonl) is imported on open: each record gets a "ts"
+from its ISO "timestamp" field, or from the file's mtime.
+
+Usage:
+    audit = AuditLog(vault / "Platinum" / "Logs", "execution_log", index_fields=("draft_id",))
+    audit.write({"draft_id": "d1", "action": "execute_email"})
+    list(audit.query(draft_id="d1"))
+    list(audit.query(since=time.time() - 3600))
+"""
+
+import io
+import json
+import os
+import time
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional
+from pathlib import Path
+
+try:
+    import zstandard as zstd
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger("platinum.audit_log")
+
+TIME_FIELD = "ts"
+MAX_KEY_VALUES = 1000  # Distinct values indexed per field per segment
+
+
+class _SegmentMeta:
+    """Time range, count and indexed key values of one segment."""
+
+    def __init__(self, index_fields: Iterable[str]):
+        self.count = 0
+        self.first_ts: Optional[float] = None
+        self.last_ts: Optional[float] = None
+        # None once a field has too many distinct values to be worth indexing
+        self.keys: Dict[str, Optional[set]] = {f: set() for f in index_fields}
+
+    def add(self, record: dict) -> None:
+        ts = record[TIME_FIELD]
+        self.count += 1
+        if self.first_ts is None or ts < self.first_ts:
+            self.first_ts = ts
+        if self.last_ts is None or ts > self.last_ts:
+            self.last_ts = ts
+        for field, values in self.keys.items():
+            if values is None or field not in record:
+                continue
+            values.add(str(record[field]))
+            if len(values) > MAX_KEY_VALUES:
+                self.keys[field] = None
+
+    def to_dict(self, file_name: str) -> dict:
+        return {
+            "file": file_name,
+            "count": self.count,
+            "first_ts": self.first_ts,
+            "last_ts": self.last_ts,
+            "keys": {f: sorted(v) if v is not None else None for f, v in self.keys.items()},
+        }
+
+
+def _legacy_ts(record: dict, fallback: float) -> float:
+    """Epoch seconds for a record written without "ts" (naive timestamps are UTC)."""
+    value = record.get("timestamp")
+    if isinstance(value, str):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return fallback
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+    return fallback
+
+
+def _may_match(entry: dict, since: Optional[float], until: Optional[float],
+               equals: Dict[str, str]) -> bool:
+    """False if a segment (index entry) cannot hold a matching record."""
+    if not entry.get("count"):
+        return False
+    if since is not None and entry["last_ts"] < since:
+        return False
+    if until is not None and entry["first_ts"] > until:
+        return False
+    keys = entry.get("keys", {})
+    for field, value in equals.items():
+        values = keys.get(field)
+        if values is not None and value not in values:
+            return False
+    return True
+
+
+class AuditLog:
+    """Append-only JSONL stream split into sealed, compressed, indexed segments."""
+
+    def __init__(
+        self,
+        directory: str,
+        stream: str,
+        max_bytes: int = 4 * 1024 * 1024,
+        max_age: float = 3600.0,
+        index_fields: Iterable[str] = (),
+        compress: bool = True,
+    ):
+        """
+        Args:
+            directory: Directory holding the segments and index.
+            stream: File name stem; the active segment is <stream>.jsonl.
+            max_bytes: Seal the active segment once it reaches this size.
+            max_age: Seal the active segment once its first record is this
+                many seconds old.
+            index_fields: Record fields whose values are indexed per segment.
+            compress: zstd-compress sealed segments (if zstandard is installed).
+        """
+        self.directory = Path(directory)
+        self.stream = stream
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.index_fields = tuple(index_fields)
+        self.compress = compress and ZSTD_AVAILABLE
+        self.active_path = self.directory / f"{stream}.jsonl"
+        self.index_path = self.directory / f"{stream}.index.json"
+        self._lock = threading.Lock()
+        self._file = None
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._segments: List[dict] = self._load_index()
+        self._finish_interrupted_seals()
+        self._import_legacy_active()
+        self._active = self._scan_active()
+
+    # ---- index ----------------------------------------------------------
+
+    def _load_index(self) -> List[dict]:
+        if not self.index_path.exists():
+            return []
+        try:
+            return json.loads(self.index_path.read_text(encoding="utf-8")).get("segments", [])
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.warning(f"Unreadable audit index {self.index_path}, rebuilding: {e}")
+            return self._rebuild_index()
+
+    def _rebuild_index(self) -> List[dict]:
+        segments = []
+        for path in sorted(self.directory.glob(f"{self.stream}-[0-9]*.jsonl*")):
+            if path.name.endswith(".sealing"):
+                continue
+            meta = _SegmentMeta(self.index_fields)
+            for record in self._read_file(path):
+                meta.add(record)
+            segments.append(meta.to_dict(path.name))
+        return segments
+
+    def _save_index(self) -> None:
+        tmp = self.index_path.with_name(self.index_path.name + ".tmp")
+        tmp.write_text(json.dumps({"stream": self.stream, "segments": self._segments},
+                                  separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, self.index_path)
+
+    def _next_seq(self) -> int:
+        seqs = [int(s["file"][len(self.stream) + 1:].split(".", 1)[0]) for s in self._segments]
+        return max(seqs, default=0) + 1
+
+    # ---- active segment ---------------------------------------------------
+
+    def _import_legacy_active(self) -> None:
+        """Give records without "ts" in the active segment one, rewriting it in place."""
+        if not self.active_path.exists():
+            return
+        with open(self.active_path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+        fallback = self.active_path.stat().st_mtime
+        out = []
+        imported = 0
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                out.append(line)  # Left for _read_file to skip, as before
+                continue
+            if isinstance(record, dict) and TIME_FIELD not in record:
+                record = {TIME_FIELD: _legacy_ts(record, fallback), **record}
+                line = json.dumps(record, separators=(",", ":"), default=str) + "\n"
+                imported += 1
+            out.append(line if line.endswith("\n") else line + "\n")
+        if not imported:
+            return
+        tmp = self.active_path.with_name(self.active_path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.writelines(out)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.active_path)
+        logger.info(f"Imported {imported} records without timestamps into {self.active_path.name}")
+
+    def _scan_active(self) -> _SegmentMeta:
+        meta = _SegmentMeta(self.index_fields)
+        if self.active_path.exists():
+            for record in self._read_file(self.active_path):
+                meta.add(record)
+        return meta
+
+    def _open(self):
+        if self._file is None:
+            self._file = open(self.active_path, "a", encoding="utf-8")
+        return self._file
+
+    def _due(self, incoming: int, now: float) -> bool:
+        if not self._active.count:
+            return False
+        if self.active_path.stat().st_size + incoming > self.max_bytes:
+            return True
+        return now - self._active.first_ts >= self.max_age
+
+    def write(self, record: dict) -> None:
+        """Append one record (a "ts" epoch timestamp is added if missing)."""
+        self.write_many([record])
+
+    def write_many(self, records: Iterable[dict]) -> int:
+        """Append several records with one flush. Returns the number written."""
+        now = time.time()
+        lines = []
+        stamped = []
+        for record in records:
+            if TIME_FIELD not in record:
+                record = {TIME_FIELD: now, **record}
+            stamped.append(record)
+            lines.append(json.dumps(record, separators=(",", ":"), default=str) + "\n")
+        if not lines:
+            return 0
+
+        with self._lock:
+            if self._due(sum(len(line) for line in lines), now):
+                self._seal()
+            f = self._open()
+            f.write("".join(lines))
+            f.flush()
+            for record in stamped:
+                self._active.add(record)
+        return len(lines)
+
+    # ---- sealing ----------------------------------------------------------
+
+    def seal(self) -> Optional[str]:
+        """Seal the active segment now. Returns the sealed file name, if any."""
+        with self._lock:
+            return self._seal() if self._active.count else None
+
+    def rotate_if_due(self) -> Optional[str]:
+        """Seal the active segment if it is over max_age (for idle streams)."""
+        with self._lock:
+            return self._seal() if self._due(0, time.time()) else None
+
+    def _seal(self) -> str:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        name = f"{self.stream}-{self._next_seq():06d}.jsonl"
+        # Rename first: a crash part-way leaves a .sealing file that the
+        # next start finishes, instead of records in both places
+        sealing = self.directory / (name + ".sealing")
+        os.replace(self.active_path, sealing)
+        name = self._finish_seal(sealing, self._active)
+        self._active = _SegmentMeta(self.index_fields)
+        return name
+
+    def _finish_seal(self, sealing: Path, meta: _SegmentMeta) -> str:
+        name = sealing.name[:-len(".sealing")]
+        target = self.directory / (name + ".zst" if self.compress else name)
+        tmp = target.with_name(target.name + ".tmp")
+        with open(sealing, "rb") as src, open(tmp, "wb") as dst:
+            if self.compress:
+                zstd.ZstdCompressor(level=10).copy_stream(src, dst)
+            else:
+                dst.write(src.read())
+            dst.flush()
+            os.fsync(dst.fileno())
+        os.replace(tmp, target)
+
+        self._segments.append(meta.to_dict(target.name))
+        self._save_index()
+        sealing.unlink()
+        logger.debug(f"Sealed {meta.count} audit records into {target.name}")
+        return target.name
+
+    def _finish_interrupted_seals(self) -> None:
+        for sealing in sorted(self.directory.glob(f"{self.stream}-*.jsonl.sealing")):
+            stem = sealing.name[:-len(".sealing")]
+            if any(s["file"].startswith(stem) for s in self._segments):
+                sealing.unlink()  # Index already has it; only the cleanup was lost
+                continue
+            meta = _SegmentMeta(self.index_fields)
+            for record in self._read_file(sealing):
+                meta.add(record)
+            self._finish_seal(sealing, meta)
+
+    # ---- reading ----------------------------------------------------------
+
+    @staticmethod
+    def _read_file(path: Path) -> Iterator[dict]:
+        with open(path, "rb") as raw:
+            if path.name.endswith(".zst"):
+                text = io.TextIOWrapper(zstd.ZstdDecompressor().stream_reader(raw), encoding="utf-8")
+            else:
+                text = io.TextIOWrapper(raw, encoding="utf-8")
+            for line in text:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Torn final line from a crash mid-write
+                if isinstance(record, dict) and TIME_FIELD in record:
+                    yield record
+
+    def segments(self) -> List[dict]:
+        """Index entries of the sealed segments, oldest first."""
+        with self._lock:
+            return list(self._segments)
+
+    def query(self, since: Optional[float] = None, until: Optional[float] = None,
+              **equals) -> Iterator[dict]:
+        """Yield records with since <= ts <= until whose fields equal `equals`, oldest first.
+
+        Only segments whose index entry can match are read; for fields not
+        in index_fields every segment in the time range is read.
+        """
+        wanted = {k: str(v) for k, v in equals.items()}
+        with self._lock:
+            entries = list(self._segments)
+            if self._file is not None:
+                self._file.flush()
+            active = self._active.to_dict(self.active_path.name)
+
+        paths = [self.directory / e["file"] for e in entries if _may_match(e, since, until, wanted)]
+        if _may_match(active, since, until, wanted):
+            paths.append(self.active_path)
+
+        for path in paths:
+            for record in self._read_file(path):
+                ts = record[TIME_FIELD]
+                if since is not None and ts < since:
+                    continue
+                if until is not None and ts > until:
+                    continue
+                if all(str(record.get(k)) == v for k, v in wanted.items()):
+                    yield record
+
+    def close(self) -> None:
+        """Close the active segment file (it stays active for the next start)."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class AuditLogHandler(logging.Handler):
+    """logging.Handler that writes records into an AuditLog as JSON objects.
+
+    The message is rendered by the handler's formatter, so a sanitizing
+    formatter (e.g. SecureLogger's) redacts it before it is stored.
+    """
+
+    def __init__(self, audit_log: AuditLog, level: int = logging.NOTSET):
+        super().__init__(level)
+        self.audit_log = audit_log
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.audit_log.write({
+                TIME_FIELD: record.created,
+                "level": record.levelname,
+                "logger": record.name,
+                "message": self.format(record),
+            })
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        self.audit_log.close()
+        super().close()
@@ -0,0 +1,212 @@
+"""
+ClaimIndex - Persistent index of the Platinum task queue.
+
+Backs ClaimManager with a local SQLite sidecar so that "next N available
+tasks in domain X" and "who owns file F" are answered from a B-tree index
+instead of rescanning Needs_Action/ and In_Progress/ on every call.
+
+Each indexed directory's mtime is recorded alongside its entries. When a
+directory changes underneath the index (a git pull, a task written by the
+API or inbox triage, the other agent claiming a file), its mtime no longer
+matches and only that directory is rescanned on next access. After its
+own moves ClaimManager rescans the directories they touched, so a task
+written there by someone else meanwhile is never hidden behind the new
+mtime. rebuild() discards everything and reconciles the whole tree from
+disk.
+
+The sidecar lives in Platinum/.state/ and is never synced between agents.
+
+Usage:
+    index = ClaimIndex(Path("/path/to/vault/Platinum"))
+    index.refresh("Needs_Action", "email")
+    print(index.available("email", limit=10))
+"""
+
+import os
+import sqlite3
+import threading
+from typing import List, Optional, Tuple
+from pathlib import Path
+
+NEEDS_ACTION = "Needs_Action"
+IN_PROGRESS = "In_Progress"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    location TEXT NOT NULL,
+    bucket   TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    PRIMARY KEY (location, bucket, filename)
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_filename ON tasks (filename, location);
+CREATE TABLE IF NOT EXISTS dirs (
+    path     TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL
+);
+"""
+
+
+class ClaimIndex:
+    """SQLite-backed index of task files by queue location and bucket.
+
+    A bucket is the domain for Needs_Action/ and the agent name for
+    In_Progress/.
+    """
+
+    def __init__(self, platinum_dir: Path, db_path: Optional[Path] = None):
+        self.platinum_dir = Path(platinum_dir)
+        self.db_path = Path(db_path) if db_path else self.platinum_dir / ".state" / "claim_index.db"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    @staticmethod
+    def _key(location: str, bucket: str) -> str:
+        return f"{location}/{bucket}"
+
+    def _disk_mtime(self, key: str) -> Optional[int]:
+        try:
+            return os.stat(self.platinum_dir / key).st_mtime_ns
+        except OSError:
+            return None
+
+    def _stored_mtime(self, key: str) -> Optional[int]:
+        row = self._conn.execute("SELECT mtime_ns FROM dirs WHERE path = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def refresh(self, location: str, bucket: str) -> bool:
+        """Rescan Platinum/<location>/<bucket>/ if it changed since it was indexed.
+
+        Returns:
+            True if the directory was rescanned.
+        """
+        return self._scan(location, bucket, force=False)
+
+    def _scan(self, location: str, bucket: str, force: bool) -> bool:
+        key = self._key(location, bucket)
+        # Stat before scanning: anything created after the stat bumps the
+        # mtime again and is picked up on the next refresh.
+        mtime = self._disk_mtime(key)
+        with self._lock:
+            if not force and mtime == self._stored_mtime(key):
+                return False
+
+            names = set()
+            if mtime is not None:
+                try:
+                    with os.scandir(self.platinum_dir / key) as it:
+                        names = {e.name for e in it if e.is_file()}
+                except OSError:
+                    names = set()
+            indexed = {r[0] for r in self._conn.execute(
+                "SELECT filename FROM tasks WHERE location = ? AND bucket = ?", (location, bucket)
+            )}
+
+            # Only the difference is written, so a rescan after our own
+            # moves costs a directory listing, not a rewrite of the bucket
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "DELETE FROM tasks WHERE location = ? AND bucket = ? AND filename = ?",
+                    [(location, bucket, n) for n in indexed - names],
+                )
+                self._conn.executemany(
+                    "INSERT INTO tasks (location, bucket, filename) VALUES (?, ?, ?)",
+                    [(location, bucket, n) for n in names - indexed],
+                )
+                if mtime is None:
+                    self._conn.execute("DELETE FROM dirs WHERE path = ?", (key,))
+                else:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO dirs (path, mtime_ns) VALUES (?, ?)", (key, mtime)
+                    )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+        return True
+
+    def record_move(self, filename: str, src: Tuple[str, str], dst: Tuple[str, str]) -> None:
+        """Record a file move performed by the caller.
+
+        Args:
+            filename: Name of the moved file.
+            src: (location, bucket) the file was moved out of.
+            dst: (location, bucket) the file was moved into.
+        """
+        self.record_moves([(filename, src, dst)])
+
+    def record_moves(self, moves: List[Tuple[str, Tuple[str, str], Tuple[str, str]]]) -> None:
+        """Record several (filename, src, dst) moves.
+
+        Each directory touched is rescanned rather than just re-stamped with
+        its new mtime: another process may have written a task into it while
+        the moves were being made, and that change would otherwise be hidden.
+        """
+        touched = set()
+        for _, src, dst in moves:
+            touched.add(src)
+            touched.add(dst)
+        for location, bucket in sorted(touched):
+            self._scan(location, bucket, force=True)
+
+    def available(self, domain: str, limit: Optional[int] = None,
+                  after: Optional[str] = None) -> List[str]:
+        """Return up to `limit` task filenames queued in Needs_Action/<domain>/, sorted by name.
+
+        `after` continues from a previous page: only names sorting after it are returned.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT filename FROM tasks "
+                "WHERE location = ? AND bucket = ? AND filename LIKE '%.json' AND filename > ? "
+                "ORDER BY filename LIMIT ?",
+                (NEEDS_ACTION, domain, after or "", -1 if limit is None else limit),
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def owner(self, filename: str) -> Optional[str]:
+        """Return the agent whose In_Progress/ holds `filename`, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT bucket FROM tasks WHERE filename = ? AND location = ? LIMIT 1",
+                (filename, IN_PROGRESS),
+            ).fetchone()
+        return row[0] if row else None
+
+    def files(self, location: str, bucket: str) -> List[str]:
+        """Return all filenames indexed under Platinum/<location>/<bucket>/."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT filename FROM tasks WHERE location = ? AND bucket = ? ORDER BY filename",
+                (location, bucket),
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def rebuild(self) -> int:
+        """Discard the index and reconcile it from disk.
+
+        Returns:
+            Number of files indexed.
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM tasks")
+            self._conn.execute("DELETE FROM dirs")
+        for location in (NEEDS_ACTION, IN_PROGRESS):
+            base = self.platinum_dir / location
+            if base.exists():
+                for d in base.iterdir():
+                    if d.is_dir():
+                        self.refresh(location, d.name)
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -5,28 +5,56 @@ Reusable Platinum Skill: Prevents double-work between agents by using
 atomic file moves. The first agent to move a task file from Needs_Action/
 to In_Progress/<agent>/ owns the task.
 
+Queue lookups are served from a ClaimIndex sidecar that is kept in step
+with claim/release moves and rescans a directory only when it has changed
+on disk. Call rebuild_index() after anything that may have rewritten the
+tree wholesale (e.g. a git pull that resolved conflicts).
+
 Usage:
     cm = ClaimManager("/path/to/vault")
     available = cm.list_available("email")
     if cm.claim("DRAFT-ABC123.json", "cloud_agent"):
         print("Task claimed!")
+
+    batch = cm.claim_batch("email", "cloud", max_n=50)
+    for task in batch.claimed:
+        handle(task.data)
 """
 
 import os
 import shutil
 import json
 from datetime import datetime
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
 from pathlib import Path
 
+from Platinum.src.claim_index import ClaimIndex, NEEDS_ACTION, IN_PROGRESS
+
+
+@dataclass
+class ClaimedTask:
+    """A task claimed by claim_batch(), with its already-parsed contents."""
+    task_file: str  # Relative path from Platinum/ after the claim (In_Progress/<agent>/...)
+    source_file: str  # Relative path from Platinum/ before the claim (Needs_Action/<domain>/...)
+    data: dict
+
+
+@dataclass
+class BatchClaimResult:
+    """Result of a claim_batch() call."""
+    claimed: List[ClaimedTask] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)  # source_file -> reason
+
 
 class ClaimManager:
     """Claim-by-move task ownership for preventing double-work between agents."""
 
-    def __init__(self, vault_path: str):
+    def __init__(self, vault_path: str, index_path: Optional[str] = None):
         self.vault_path = Path(vault_path)
         self.platinum_dir = self.vault_path / "Platinum"
         self._ensure_dirs()
+        self._index = ClaimIndex(self.platinum_dir, Path(index_path) if index_path else None)
 
     def _ensure_dirs(self):
         """Ensure required directories exist."""
@@ -35,24 +63,31 @@ class ClaimManager:
         for agent in ("cloud", "local"):
             (self.platinum_dir / "In_Progress" / agent).mkdir(parents=True, exist_ok=True)
 
-    def list_available(self, domain: Optional[str] = None) -> List[str]:
-        """List task files available in Needs_Action/."""
+    def list_available(self, domain: Optional[str] = None,
+                       limit: Optional[int] = None) -> List[str]:
+        """List task files available in Needs_Action/, sorted by filename.
+
+        Args:
+            domain: Restrict to one domain (default: all domains).
+            limit: Maximum number of tasks to return (default: all).
+        """
         available = []
-        needs_action = self.platinum_dir / "Needs_Action"
+        needs_action = self.platinum_dir / NEEDS_ACTION
 
         if domain:
             domains = [domain]
         else:
-            domains = [
+            domains = sorted(
                 d.name for d in needs_action.iterdir() if d.is_dir()
-            ] if needs_action.exists() else []
+            ) if needs_action.exists() else []
 
         for d in domains:
-            domain_dir = needs_action / d
-            if domain_dir.exists():
-                for f in domain_dir.iterdir():
-                    if f.is_file() and f.suffix == ".json":
-                        available.append(str(f.relative_to(self.platinum_dir)))
+            remaining = None if limit is None else limit - len(available)
+            if remaining is not None and remaining <= 0:
+                break
+            self._index.refresh(NEEDS_ACTION, d)
+            for name in self._index.available(d, remaining):
+                available.append(f"{NEEDS_ACTION}/{d}/{name}")
 
         return available
 
@@ -73,7 +108,9 @@ class ClaimManager:
         if not source.exists():
             return False
 
-        dest_dir = self.platinum_dir / "In_Progress" / agent_name
+        src_key = (NEEDS_ACTION, source.parent.name)
+        dst_key = (IN_PROGRESS, agent_name)
+        dest_dir = self.platinum_dir / IN_PROGRESS / agent_name
         dest_dir.mkdir(parents=True, exist_ok=True)
         dest = dest_dir / source.name
 
@@ -95,17 +132,123 @@ class ClaimManager:
 
             # Atomic move (claim-by-move rule)
             shutil.move(str(source), str(dest))
+            self._index.record_move(dest.name, src_key, dst_key)
             return True
         except (OSError, shutil.Error):
             return False
 
+    def claim_batch(self, domain: str, agent_name: str, max_n: int = 50,
+                    accept: Optional[Callable[[str], bool]] = None) -> BatchClaimResult:
+        """Claim up to max_n available tasks from Needs_Action/<domain>/ in one pass.
+
+        Each task is claimed by moving it into In_Progress/<agent>/ first, so
+        losing a race to another agent costs nothing. The owner/claimed_at
+        metadata is then written once in place and the parsed task dict is
+        returned, so callers never need to re-read the file. A task that is
+        not a JSON object is claimed as is, like claim() does, and returned
+        with placeholder data. If the metadata cannot be written, the task
+        is moved back to Needs_Action/ and reported as failed.
+
+        Rejected or already-claimed tasks do not use up the batch: the queue
+        is read page by page until max_n tasks are claimed or it runs out.
+
+        Args:
+            domain: Domain to claim from (e.g. "email").
+            agent_name: Name of the claiming agent ("cloud" or "local").
+            max_n: Maximum number of tasks to claim.
+            accept: Optional predicate on the task's relative path; tasks it
+                rejects are left in place and reported as failed.
+
+        Returns:
+            BatchClaimResult with the claimed tasks and per-file failures.
+        """
+        result = BatchClaimResult()
+        src_key = (NEEDS_ACTION, domain)
+        dst_key = (IN_PROGRESS, agent_name)
+        dest_dir = self.platinum_dir / IN_PROGRESS / agent_name
+        dest_dir.mkdir(parents=True, exist_ok=True)
+
+        self._index.refresh(NEEDS_ACTION, domain)
+        moves = []
+        now = datetime.utcnow().isoformat()
+        after = None
+
+        while len(result.claimed) < max_n:
+            page = self._index.available(domain, max_n - len(result.claimed), after=after)
+            if not page:
+                break
+            after = page[-1]
+            self._claim_page(page, domain, agent_name, dest_dir, accept, now, result, moves)
+
+        self._index.record_moves(moves)
+        return result
+
+    def _claim_page(self, names: List[str], domain: str, agent_name: str, dest_dir: Path,
+                    accept: Optional[Callable[[str], bool]], now: str,
+                    result: BatchClaimResult, moves: list) -> None:
+        src_key = (NEEDS_ACTION, domain)
+        dst_key = (IN_PROGRESS, agent_name)
+        for name in names:
+            task_file = f"{NEEDS_ACTION}/{domain}/{name}"
+            if accept is not None and not accept(task_file):
+                result.failed[task_file] = "rejected"
+                continue
+
+            source = self.platinum_dir / task_file
+            dest = dest_dir / source.name
+            if dest.exists():
+                result.failed[task_file] = "already claimed"
+                continue
+
+            # Atomic move (claim-by-move rule)
+            try:
+                shutil.move(str(source), str(dest))
+            except FileNotFoundError:
+                result.failed[task_file] = "already claimed"
+                continue
+            except (OSError, shutil.Error) as e:
+                result.failed[task_file] = f"move failed: {e}"
+                continue
+            moves.append((dest.name, src_key, dst_key))
+
+            # The task is ours now; stamp ownership with a single rewrite
+            try:
+                data = json.loads(dest.read_text(encoding="utf-8"))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                data = None
+            if isinstance(data, dict):
+                stamped = dict(data, owner=agent_name, claimed_at=now, status="claimed")
+                # Write then rename, so a failed write never truncates the task
+                tmp = dest.with_name(dest.name + ".tmp")
+                try:
+                    tmp.write_text(json.dumps(stamped, indent=2), encoding="utf-8")
+                    tmp.replace(dest)
+                    data = stamped
+                except OSError as e:
+                    tmp.unlink(missing_ok=True)
+                    # Hand the untouched task back to the queue
+                    try:
+                        shutil.move(str(dest), str(source))
+                    except (OSError, shutil.Error):
+                        # Still ours: return it with its old metadata
+                        pass
+                    else:
+                        moves.pop()
+                        result.failed[task_file] = f"metadata write failed: {e}"
+                        continue
+            else:
+                # Leave unparsable content untouched; draft from a placeholder
+                data = {"domain": domain, "title": dest.name, "body": ""}
+
+            result.claimed.append(ClaimedTask(
+                task_file=f"{IN_PROGRESS}/{agent_name}/{dest.name}",
+                source_file=task_file,
+                data=data,
+            ))
+
     def is_claimed(self, task_file: str) -> bool:
         """Check if a task file has been claimed (exists in In_Progress/)."""
-        filename = Path(task_file).name
-        for agent_dir in (self.platinum_dir / "In_Progress").iterdir():
-            if agent_dir.is_dir() and (agent_dir / filename).exists():
-                return True
-        return False
+        return self.get_owner(task_file) is not None
 
     def release(self, task_file: str, agent_name: str) -> bool:
         """Release a claimed task back to Needs_Action/.
@@ -118,7 +261,7 @@ class ClaimManager:
             True if release was successful.
         """
         filename = Path(task_file).name
-        source = self.platinum_dir / "In_Progress" / agent_name / filename
+        source = self.platinum_dir / IN_PROGRESS / agent_name / filename
         if not source.exists():
             return False
 
@@ -135,12 +278,15 @@ class ClaimManager:
             except (json.JSONDecodeError, TypeError):
                 pass
 
-        dest_dir = self.platinum_dir / "Needs_Action" / domain
+        dest_dir = self.platinum_dir / NEEDS_ACTION / domain
         dest_dir.mkdir(parents=True, exist_ok=True)
         dest = dest_dir / filename
 
+        src_key = (IN_PROGRESS, agent_name)
+        dst_key = (NEEDS_ACTION, domain)
         try:
             shutil.move(str(source), str(dest))
+            self._index.record_move(filename, src_key, dst_key)
             return True
         except (OSError, shutil.Error):
             return False
@@ -148,16 +294,29 @@ class ClaimManager:
     def get_owner(self, task_file: str) -> Optional[str]:
         """Get the agent that owns a task file."""
         filename = Path(task_file).name
-        in_progress = self.platinum_dir / "In_Progress"
-        if in_progress.exists():
-            for agent_dir in in_progress.iterdir():
-                if agent_dir.is_dir() and (agent_dir / filename).exists():
-                    return agent_dir.name
-        return None
+        self._refresh_in_progress()
+        return self._index.owner(filename)
 
     def list_claimed_by(self, agent_name: str) -> List[str]:
         """List all tasks claimed by a specific agent."""
-        agent_dir = self.platinum_dir / "In_Progress" / agent_name
+        agent_dir = self.platinum_dir / IN_PROGRESS / agent_name
         if not agent_dir.exists():
             return []
-        return [f.name for f in agent_dir.iterdir() if f.is_file()]
+        self._index.refresh(IN_PROGRESS, agent_name)
+        return self._index.files(IN_PROGRESS, agent_name)
+
+    def rebuild_index(self) -> int:
+        """Reconcile the claim index with the files on disk.
+
+        Returns:
+            Number of task files indexed.
+        """
+        return self._index.rebuild()
+
+    def _refresh_in_progress(self) -> None:
+        """Bring every In_Progress/<agent>/ directory in the index up to date."""
+        in_progress = self.platinum_dir / IN_PROGRESS
+        if in_progress.exists():
+            for agent_dir in in_progress.iterdir():
+                if agent_dir.is_dir():
+                    self._index.refresh(IN_PROGRESS, agent_dir.name)
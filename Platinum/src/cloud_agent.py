@@ -35,6 +35,8 @@ class CloudAgent:
     """Always-on Cloud Agent - drafts responses, never executes sends."""
 
     AGENT_NAME = "cloud"
+    DOMAINS = ("email", "social", "accounting", "monitoring")
+    CLAIM_BATCH_SIZE = 100  # Max tasks claimed per domain per cycle
 
     def __init__(self, vault_path: str = None, settings=None):
         self.settings = settings or get_settings(AGENT_ROLE="cloud")
@@ -87,7 +89,7 @@ class CloudAgent:
     def scan_needs_action(self) -> list:
         """Check all Needs_Action/ domains for available tasks."""
         available = []
-        for domain in ("email", "social", "accounting", "monitoring"):
+        for domain in self.DOMAINS:
             tasks = self.claim_manager.list_available(domain)
             available.extend(tasks)
         return available
@@ -112,7 +114,6 @@ class CloudAgent:
             return None
 
         self._log_action("claimed", f"Claimed {task_file}")
-        self.heartbeat.beat(current_task=task_file)
 
         # Read task data
         filename = Path(task_file).name
@@ -122,6 +123,39 @@ class CloudAgent:
         except (json.JSONDecodeError, FileNotFoundError):
             task_data = {"domain": "email", "title": filename, "body": ""}
 
+        return self._draft_and_submit(task_file, task_data)
+
+    def process_batch(self, domain: str, max_n: Optional[int] = None) -> list:
+        """Claim up to max_n tasks from one domain in a single pass and draft each.
+
+        Uses ClaimManager.claim_batch so every task file is moved and
+        rewritten once, and drafts straight from the returned task dicts.
+
+        Returns:
+            List of draft IDs submitted for approval.
+        """
+        batch = self.claim_manager.claim_batch(
+            domain, self.AGENT_NAME,
+            max_n=max_n or self.CLAIM_BATCH_SIZE,
+            accept=self.secret_guard.can_access,
+        )
+        for task_file, reason in batch.failed.items():
+            if reason == "rejected":
+                self._log_action("blocked", f"Secret guard blocked access to {task_file}")
+            else:
+                self._log_action("claim_failed", f"Could not claim {task_file}: {reason}")
+
+        draft_ids = []
+        for task in batch.claimed:
+            self._log_action("claimed", f"Claimed {task.source_file}")
+            draft_id = self._draft_and_submit(task.source_file, task.data)
+            if draft_id:
+                draft_ids.append(draft_id)
+        return draft_ids
+
+    def _draft_and_submit(self, task_file: str, task_data: dict) -> Optional[str]:
+        """Create a draft for a claimed task and submit it for approval."""
+        self.heartbeat.beat(current_task=task_file)
         domain = task_data.get("domain", "email")
 
         # Generate draft based on domain
@@ -250,20 +284,16 @@ class CloudAgent:
             return []
 
     def run_once(self) -> list:
-        """Single iteration: triage inbox, scan, claim, draft, submit. Returns list of draft IDs."""
+        """Single iteration: triage inbox, batch-claim, draft, submit. Returns list of draft IDs."""
         self.heartbeat.beat()
         draft_ids = []
 
         # Triage email inbox first
         self.triage_inbox()
 
-        available = self.scan_needs_action()
-        self._log_action("scan", f"Found {len(available)} available tasks")
-
-        for task_file in available:
-            draft_id = self.process_task(task_file)
-            if draft_id:
-                draft_ids.append(draft_id)
+        for domain in self.DOMAINS:
+            draft_ids.extend(self.process_batch(domain))
+        self._log_action("scan", f"Drafted {len(draft_ids)} tasks")
 
         return draft_ids
 
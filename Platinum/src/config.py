@@ -69,16 +69,30 @@ class PlatinumSettings(BaseSettings):
     HEALTH_ALERT_EMAIL: str = Field(default="", description="Email to send health alerts to")
     HEALTH_CLOUD_URL: str = Field(default="", description="Cloud VM URL for HTTP ping")
     HEALTH_API_URL: str = Field(default="http://localhost:8000", description="API base URL")
+    HEALTH_CYCLE_TIMEOUT: float = Field(default=20.0, description="Deadline for one full round of health checks")
+    HEALTH_MAX_WORKERS: int = Field(default=4, description="Health checks run in parallel")
+    HEALTH_SNAPSHOT_MAX_AGE: float = Field(default=180.0, description="API serves cached health up to this age (s)")
+    HEALTH_RENOTIFY_BASE: int = Field(default=900, description="First re-notification delay for an open incident (s)")
+    HEALTH_RENOTIFY_MAX: int = Field(default=86400, description="Longest re-notification delay for an open incident (s)")
 
     # === Vault Sync ===
     GIT_REMOTE: str = Field(default="origin", description="Git remote name")
     GIT_BRANCH: str = Field(default="main", description="Git branch name")
     GIT_SSH_KEY: str = Field(default="", description="Path to SSH private key for git sync")
-    SYNC_INTERVAL: int = Field(default=300, description="Sync interval in seconds")
+    SYNC_INTERVAL: int = Field(default=300, description="Sync interval in seconds (idle ceiling in event mode)")
+    SYNC_MODE: str = Field(default="event", description="Sync trigger: event | interval")
+    SYNC_MIN_INTERVAL: int = Field(default=15, description="Idle sync interval right after activity (event mode)")
+    SYNC_DEBOUNCE: float = Field(default=2.0, description="Quiet period before syncing a burst of changes")
+    SYNC_MAX_DELAY: float = Field(default=10.0, description="Longest a change waits while a burst continues")
+    SYNC_POLL_INTERVAL: float = Field(default=2.0, description="Change scan interval when watchdog is unavailable")
 
     # === Heartbeat ===
     HEARTBEAT_INTERVAL: int = Field(default=30, description="Heartbeat interval in seconds")
 
+    # === Audit Log ===
+    AUDIT_SEGMENT_MAX_BYTES: int = Field(default=4 * 1024 * 1024, description="Seal an audit log segment at this size")
+    AUDIT_SEGMENT_MAX_AGE: int = Field(default=3600, description="Seal an audit log segment after this many seconds")
+
     model_config = {
         "env_prefix": "PLATINUM_",
         "env_file": ".env",
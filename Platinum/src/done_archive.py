@@ -0,0 +1,173 @@
+"""
+DoneArchive - Date-partitioned Done/ archive with daily compaction.
+
+Approved drafts are written to Done/YYYY/MM/DD/<draft_id>.json instead of
+one flat directory. Once a day is closed, compact() rolls its directory
+into a single JSONL segment plus a small offset index:
+
+    Done/2026/10/17.jsonl         one compact JSON draft per line
+    Done/2026/10/17.index.json    {"segment": "17.jsonl", "offsets": {draft_id: [offset, length]}}
+
+Both files are plain text so they sync through VaultSync like any other
+vault file, and a draft is read back with a single seek + read.
+
+Usage:
+    archive = DoneArchive("/path/to/vault/Platinum")
+    archive.compact()                       # compact every day before today
+    python -m Platinum.src.done_archive --vault /path/to/vault
+"""
+
+import json
+import os
+import logging
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+
+logger = logging.getLogger("platinum.done_archive")
+
+SEGMENT_SUFFIX = ".jsonl"
+INDEX_SUFFIX = ".index.json"
+
+
+class DoneArchive:
+    """Date-partitioned storage for approved drafts in Platinum/Done/."""
+
+    def __init__(self, platinum_dir: str):
+        self.platinum_dir = Path(platinum_dir)
+        self.done_dir = self.platinum_dir / "Done"
+
+    def day_dir(self, day: Optional[date] = None) -> Path:
+        """Return Done/YYYY/MM/DD/ for a day (default: today, UTC)."""
+        day = day or datetime.utcnow().date()
+        return self.done_dir / f"{day.year:04d}" / f"{day.month:02d}" / f"{day.day:02d}"
+
+    def list_days(self) -> List[Tuple[date, Path]]:
+        """List (day, directory) for every uncompacted day directory, oldest first."""
+        days = []
+        for path in sorted(self.done_dir.glob("[0-9][0-9][0-9][0-9]/[0-9][0-9]/[0-9][0-9]")):
+            if not path.is_dir():
+                continue
+            try:
+                day = date(int(path.parent.parent.name), int(path.parent.name), int(path.name))
+            except ValueError:
+                continue
+            days.append((day, path))
+        return days
+
+    @staticmethod
+    def segment_paths(day_dir: Path) -> Tuple[Path, Path]:
+        """Return the (segment, index) file paths a day directory compacts into."""
+        return (
+            day_dir.parent / f"{day_dir.name}{SEGMENT_SUFFIX}",
+            day_dir.parent / f"{day_dir.name}{INDEX_SUFFIX}",
+        )
+
+    @staticmethod
+    def load_index(index_path: Path) -> Dict[str, List[int]]:
+        """Return the {draft_id: [offset, length]} map of a segment index."""
+        data = json.loads(Path(index_path).read_text(encoding="utf-8"))
+        return data.get("offsets", {})
+
+    @staticmethod
+    def read_entry(segment_path: Path, offset: int, length: int) -> dict:
+        """Read one draft from a segment."""
+        with open(segment_path, "rb") as f:
+            f.seek(offset)
+            return json.loads(f.read(length).decode("utf-8"))
+
+    def _read_segment(self, segment_path: Path, index_path: Path) -> Dict[str, dict]:
+        entries = {}
+        if segment_path.exists() and index_path.exists():
+            for draft_id, (offset, length) in self.load_index(index_path).items():
+                entries[draft_id] = self.read_entry(segment_path, offset, length)
+        return entries
+
+    def compact_day(self, day_dir: Path) -> int:
+        """Roll one day directory into its segment. Returns the number of drafts compacted.
+
+        Drafts already in an existing segment for that day are kept, so late
+        arrivals (e.g. pulled from the other agent) are merged in.
+        """
+        day_dir = Path(day_dir)
+        loose = sorted(day_dir.glob("*.json"))
+        segment_path, index_path = self.segment_paths(day_dir)
+
+        entries = self._read_segment(segment_path, index_path)
+        compacted = []
+        for f in loose:
+            try:
+                entries[f.stem] = json.loads(f.read_text(encoding="utf-8"))
+                compacted.append(f)
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                logger.warning(f"Skipping unreadable draft {f}: {e}")
+
+        offsets = {}
+        offset = 0
+        tmp_segment = segment_path.with_name(segment_path.name + ".tmp")
+        with open(tmp_segment, "wb") as out:
+            for draft_id in sorted(entries):
+                line = json.dumps(entries[draft_id], separators=(",", ":")).encode("utf-8")
+                out.write(line + b"\n")
+                offsets[draft_id] = [offset, len(line)]
+                offset += len(line) + 1
+            out.flush()
+            os.fsync(out.fileno())
+
+        tmp_index = index_path.with_name(index_path.name + ".tmp")
+        tmp_index.write_text(json.dumps({
+            "segment": segment_path.name,
+            "count": len(offsets),
+            "compacted_at": datetime.utcnow().isoformat(),
+            "offsets": offsets,
+        }, indent=2), encoding="utf-8")
+
+        # Segment first, then index: a reader never sees offsets into a stale segment
+        os.replace(tmp_segment, segment_path)
+        os.replace(tmp_index, index_path)
+
+        for f in compacted:
+            f.unlink()
+        try:
+            day_dir.rmdir()
+        except OSError:
+            pass  # Something new landed in the meantime; next compaction picks it up
+
+        logger.info(f"Compacted {len(compacted)} drafts into {segment_path.relative_to(self.platinum_dir)}")
+        return len(compacted)
+
+    def compact(self, before: Optional[date] = None) -> int:
+        """Compact every day directory strictly before `before` (default: today, UTC).
+
+        Returns:
+            Total number of drafts compacted.
+        """
+        before = before or datetime.utcnow().date()
+        total = 0
+        for day, path in self.list_days():
+            if day < before:
+                total += self.compact_day(path)
+        return total
+
+
+def main():
+    """Entry point: compact closed days in Platinum/Done/."""
+    import argparse
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
+    )
+    parser = argparse.ArgumentParser(description="Compact closed days in Platinum/Done/")
+    parser.add_argument("--vault", default=".", help="Vault root directory")
+    parser.add_argument("--before", help="Compact days before YYYY-MM-DD (default: today)")
+    args = parser.parse_args()
+
+    before = date.fromisoformat(args.before) if args.before else None
+    archive = DoneArchive(str(Path(args.vault) / "Platinum"))
+    count = archive.compact(before)
+    logger.info(f"Compaction complete: {count} drafts")
+
+
+if __name__ == "__main__":
+    main()
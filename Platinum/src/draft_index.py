@@ -0,0 +1,352 @@
+"""
+DraftIndex - Persistent draft_id -> location index for DraftManager.
+
+Replaces the os.walk over Needs_Action/, Pending_Approval/, In_Progress/,
+Done/ and Plans/ that every draft lookup used to perform. Locations are
+held in an in-memory cache backed by a SQLite sidecar in Platinum/.state/,
+so a lookup is a dict hit plus one stat to confirm the file is still there.
+
+DraftManager records its own moves as it makes them. Changes made by
+anyone else (the other agent via git pull, manual edits) are detected
+through directory mtimes: a cache miss re-stats the indexed directories
+and rescans only those whose mtime moved, so cost depends on the number
+of directories, not on how many drafts have been archived.
+
+Drafts compacted into Done/ segments (see DoneArchive) are indexed from
+the segment's offset index, so locate() can point straight at the bytes.
+Each entry also records the segment's size and mtime: a segment rewritten
+since (recompacted with late arrivals, by this or another agent) moves its
+offsets, so a mismatch sends the lookup back through a rescan. read()
+also checks that the bytes at the offset are the requested draft, which
+covers a rewrite caught between DoneArchive's segment and index replaces.
+
+Usage:
+    index = DraftIndex(Path("/path/to/vault/Platinum"))
+    path = index.lookup("DRAFT-ABC12345")
+"""
+
+import os
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Set, Tuple
+from pathlib import Path
+
+from Platinum.src.done_archive import DoneArchive, INDEX_SUFFIX, SEGMENT_SUFFIX
+
+SCHEMA_VERSION = 3
+SEARCH_ROOTS = ("Needs_Action", "Pending_Approval", "In_Progress", "Done", "Plans")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS drafts (
+    draft_id TEXT PRIMARY KEY,
+    rel_dir  TEXT NOT NULL,
+    segment  TEXT,
+    offset   INTEGER,
+    length   INTEGER,
+    seg_mtime_ns INTEGER,
+    seg_size INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_drafts_dir ON drafts (rel_dir);
+CREATE TABLE IF NOT EXISTS dirs (
+    path     TEXT PRIMARY KEY,
+    parent   TEXT,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_dirs_parent ON dirs (parent);
+"""
+
+
+@dataclass
+class DraftLocation:
+    """Where a draft lives: a loose JSON file, or a byte range in a Done/ segment."""
+    path: Path
+    offset: Optional[int] = None
+    length: Optional[int] = None
+
+    @property
+    def archived(self) -> bool:
+        return self.offset is not None
+
+    def read(self) -> dict:
+        """Load the draft's JSON data."""
+        if self.archived:
+            return DoneArchive.read_entry(self.path, self.offset, self.length)
+        return json.loads(self.path.read_text(encoding="utf-8"))
+
+
+class DraftIndex:
+    """Maps draft IDs to the directory (relative to Platinum/) holding them."""
+
+    def __init__(self, platinum_dir: Path, db_path: Optional[Path] = None):
+        self.platinum_dir = Path(platinum_dir)
+        self.db_path = Path(db_path) if db_path else self.platinum_dir / ".state" / "draft_index.db"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        # draft_id -> (rel_dir, segment, offset, length, seg_mtime_ns, seg_size)
+        self._cache: Dict[str, Tuple] = {}
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            # The index is a cache of the tree: on a layout change just start over
+            self._conn.executescript("DROP TABLE IF EXISTS drafts; DROP TABLE IF EXISTS dirs;")
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._conn.executescript(_SCHEMA)
+
+    def _rel(self, directory: Path) -> str:
+        return Path(directory).relative_to(self.platinum_dir).as_posix()
+
+    def _disk_mtime(self, rel_dir: str) -> Optional[int]:
+        try:
+            st = os.stat(self.platinum_dir / rel_dir)
+        except OSError:
+            return None
+        return st.st_mtime_ns
+
+    def _stored_mtime(self, rel_dir: str) -> Optional[int]:
+        row = self._conn.execute("SELECT mtime_ns FROM dirs WHERE path = ?", (rel_dir,)).fetchone()
+        return row[0] if row else None
+
+    def _get(self, draft_id: str):
+        entry = self._cache.get(draft_id)
+        if entry is None:
+            row = self._conn.execute(
+                "SELECT rel_dir, segment, offset, length, seg_mtime_ns, seg_size "
+                "FROM drafts WHERE draft_id = ?",
+                (draft_id,),
+            ).fetchone()
+            if row:
+                entry = self._cache[draft_id] = tuple(row)
+        return entry
+
+    def _resolve(self, draft_id: str) -> Optional[DraftLocation]:
+        entry = self._get(draft_id)
+        if entry is None:
+            return None
+        rel_dir, segment, offset, length, seg_mtime_ns, seg_size = entry
+        if segment is None:
+            location = DraftLocation(self.platinum_dir / rel_dir / f"{draft_id}.json")
+            if location.path.is_file():
+                return location
+        else:
+            location = DraftLocation(self.platinum_dir / rel_dir / segment, offset, length)
+            try:
+                st = os.stat(location.path)
+            except OSError:
+                st = None
+            if st is not None and (st.st_mtime_ns, st.st_size) == (seg_mtime_ns, seg_size):
+                return location
+            if st is not None:
+                # Segment rewritten since it was indexed: rescan its directory
+                self._conn.execute("UPDATE dirs SET mtime_ns = -1 WHERE path = ?", (rel_dir,))
+        self._cache.pop(draft_id, None)
+        return None
+
+    def locate(self, draft_id: str) -> Optional[DraftLocation]:
+        """Return where a draft is stored, or None if it does not exist."""
+        with self._lock:
+            location = self._resolve(draft_id)
+            if location is None:
+                # Miss or stale entry: pick up whatever changed on disk
+                self.refresh()
+                location = self._resolve(draft_id)
+        return location
+
+    def lookup(self, draft_id: str) -> Optional[Path]:
+        """Return the path of a loose `<draft_id>.json`, or None.
+
+        Drafts that have been compacted into a Done/ segment are read-only
+        and are not returned here; use read() to load them.
+        """
+        location = self.locate(draft_id)
+        if location is None or location.archived:
+            return None
+        return location.path
+
+    def read(self, draft_id: str) -> Optional[dict]:
+        """Return a draft's JSON data, or None if it does not exist."""
+        for attempt in range(2):
+            location = self.locate(draft_id)
+            if location is None:
+                return None
+            try:
+                data = location.read()
+            except (OSError, ValueError):
+                if not location.archived:
+                    raise
+                data = None
+            if not location.archived or (isinstance(data, dict) and data.get("draft_id") == draft_id):
+                return data
+            # Offsets no longer match the segment: rescan its directory and retry
+            with self._lock:
+                rel_dir = self._rel(location.path.parent)
+                self._conn.execute("UPDATE dirs SET mtime_ns = -1 WHERE path = ?", (rel_dir,))
+                self._cache.pop(draft_id, None)
+        return None
+
+    def refresh(self) -> None:
+        """Rescan every indexed directory whose mtime changed since it was indexed."""
+        with self._lock:
+            for root in SEARCH_ROOTS:
+                self._refresh_dir(root, None)
+
+    def count(self, root: str) -> int:
+        """Number of drafts under Platinum/<root>/ (e.g. "Done"), after a refresh of that root."""
+        if root not in SEARCH_ROOTS:
+            raise ValueError(f"Not an indexed root: {root}")
+        prefix = root + "/"
+        with self._lock:
+            self._refresh_dir(root, None)
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM drafts WHERE rel_dir = ? OR substr(rel_dir, 1, ?) = ?",
+                (root, len(prefix), prefix),
+            ).fetchone()[0]
+
+    def _refresh_dir(self, rel_dir: str, parent: Optional[str]) -> None:
+        mtime = self._disk_mtime(rel_dir)
+        if mtime is None:
+            self._purge(rel_dir)
+            return
+
+        if mtime == self._stored_mtime(rel_dir):
+            children = [r[0] for r in self._conn.execute(
+                "SELECT path FROM dirs WHERE parent = ?", (rel_dir,)
+            )]
+        else:
+            drafts, segments, children = [], [], []
+            try:
+                with os.scandir(self.platinum_dir / rel_dir) as it:
+                    for entry in it:
+                        if entry.is_dir():
+                            children.append(f"{rel_dir}/{entry.name}")
+                        elif entry.name.endswith(INDEX_SUFFIX):
+                            segments.append(entry.path)
+                        elif entry.name.endswith(".json"):
+                            drafts.append(entry.name[:-5])
+            except OSError:
+                return
+
+            rows = []
+            for index_path in segments:
+                segment = Path(index_path).name[:-len(INDEX_SUFFIX)] + SEGMENT_SUFFIX
+                try:
+                    # Stat before reading the index: a rewrite in between
+                    # then leaves a stale mtime that mismatches on lookup
+                    st = os.stat(self.platinum_dir / rel_dir / segment)
+                    data = json.loads(Path(index_path).read_text(encoding="utf-8"))
+                except (OSError, json.JSONDecodeError):
+                    continue
+                for draft_id, (offset, length) in data.get("offsets", {}).items():
+                    rows.append((draft_id, rel_dir, segment, offset, length, st.st_mtime_ns, st.st_size))
+            # Loose files win over segment entries for the same draft
+            rows.extend((d, rel_dir, None, None, None, None, None) for d in drafts)
+
+            known = {r[0] for r in self._conn.execute(
+                "SELECT path FROM dirs WHERE parent = ?", (rel_dir,)
+            )}
+            for gone in known - set(children):
+                self._purge(gone)
+
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute("DELETE FROM drafts WHERE rel_dir = ?", (rel_dir,))
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO drafts "
+                    "(draft_id, rel_dir, segment, offset, length, seg_mtime_ns, seg_size) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO dirs (path, parent, mtime_ns) VALUES (?, ?, ?)",
+                    (rel_dir, parent, mtime),
+                )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+            for row in rows:
+                self._cache[row[0]] = row[1:]
+
+        for child in children:
+            self._refresh_dir(child, rel_dir)
+
+    def _purge(self, rel_dir: str) -> None:
+        """Forget a directory and everything indexed beneath it."""
+        prefix = rel_dir + "/"
+        n = len(prefix)
+        self._conn.execute(
+            "DELETE FROM drafts WHERE rel_dir = ? OR substr(rel_dir, 1, ?) = ?",
+            (rel_dir, n, prefix),
+        )
+        self._conn.execute(
+            "DELETE FROM dirs WHERE path = ? OR substr(path, 1, ?) = ?",
+            (rel_dir, n, prefix),
+        )
+        self._cache = {k: v for k, v in self._cache.items()
+                       if v[0] != rel_dir and not v[0].startswith(prefix)}
+
+    def fresh_dirs(self, *dirs: Path) -> Set[str]:
+        """Return the relative paths of the given directories whose index is current."""
+        fresh = set()
+        with self._lock:
+            for d in dirs:
+                rel_dir = self._rel(d)
+                stored = self._stored_mtime(rel_dir)
+                if stored is not None and stored == self._disk_mtime(rel_dir):
+                    fresh.add(rel_dir)
+        return fresh
+
+    def record(self, draft_id: str, path: Path, fresh: Iterable[str] = (),
+               touched: Iterable[Path] = ()) -> None:
+        """Record that `draft_id` now lives at `path`.
+
+        Args:
+            draft_id: Draft whose location changed.
+            path: New location of the draft file.
+            fresh: Result of fresh_dirs() taken before the write/move.
+            touched: Directories the caller modified. Those that were fresh
+                are re-stamped with their new mtime; the rest are rescanned
+                on the next miss.
+        """
+        rel_dir = self._rel(Path(path).parent)
+        fresh = set(fresh)
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO drafts "
+                    "(draft_id, rel_dir, segment, offset, length, seg_mtime_ns, seg_size) "
+                    "VALUES (?, ?, NULL, NULL, NULL, NULL, NULL)",
+                    (draft_id, rel_dir),
+                )
+                for d in touched:
+                    key = self._rel(d)
+                    if key in fresh:
+                        mtime = self._disk_mtime(key)
+                        if mtime is not None:
+                            self._conn.execute(
+                                "UPDATE dirs SET mtime_ns = ? WHERE path = ?", (mtime, key)
+                            )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._cache[draft_id] = (rel_dir, None, None, None, None, None)
+
+    def rebuild(self) -> int:
+        """Discard the index and rebuild it from disk. Returns the number of drafts indexed."""
+        with self._lock:
+            self._conn.execute("DELETE FROM drafts")
+            self._conn.execute("DELETE FROM dirs")
+            self._cache.clear()
+            self.refresh()
+            return self._conn.execute("SELECT COUNT(*) FROM drafts").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -5,6 +5,11 @@ Reusable Platinum Skill: Manages the lifecycle of drafts from creation
 through approval or rejection. Drafts are stored as JSON files in the
 vault's delegation directories.
 
+Draft lookups go through a DraftIndex (draft_id -> directory), so finding
+a draft costs the same whether Done/ holds ten files or a million.
+Approved drafts are filed under Done/YYYY/MM/DD/ and closed days can be
+rolled into JSONL segments with compact_done().
+
 Usage:
     dm = DraftManager("/path/to/vault")
     draft = dm.create_draft("email", "Re: Invoice", "Dear...", "cloud_agent")
@@ -13,7 +18,6 @@ Usage:
 """
 
 import json
-import os
 import shutil
 import uuid
 from datetime import datetime
@@ -21,6 +25,9 @@ from dataclasses import dataclass, field, asdict
 from typing import List, Optional
 from pathlib import Path
 
+from Platinum.src.draft_index import DraftIndex
+from Platinum.src.done_archive import DoneArchive
+
 
 @dataclass
 class Draft:
@@ -51,10 +58,12 @@ class Draft:
 class DraftManager:
     """Manages draft creation and approval workflows via file-based delegation."""
 
-    def __init__(self, vault_path: str):
+    def __init__(self, vault_path: str, index_path: Optional[str] = None):
         self.vault_path = Path(vault_path)
         self.platinum_dir = self.vault_path / "Platinum"
         self._ensure_dirs()
+        self._index = DraftIndex(self.platinum_dir, Path(index_path) if index_path else None)
+        self.done_archive = DoneArchive(str(self.platinum_dir))
 
     def _ensure_dirs(self):
         """Ensure required directories exist."""
@@ -69,21 +78,39 @@ class DraftManager:
         return f"{draft_id}.json"
 
     def _find_draft_file(self, draft_id: str) -> Optional[Path]:
-        """Search for a draft file across all directories."""
-        filename = self._draft_filename(draft_id)
-        search_dirs = [
-            self.platinum_dir / "Needs_Action",
-            self.platinum_dir / "Pending_Approval",
-            self.platinum_dir / "In_Progress",
-            self.platinum_dir / "Done",
-            self.platinum_dir / "Plans",
-        ]
-        for base_dir in search_dirs:
-            if base_dir.exists():
-                for root, _, files in os.walk(str(base_dir)):
-                    if filename in files:
-                        return Path(root) / filename
-        return None
+        """Locate a draft file via the draft index."""
+        return self._index.lookup(draft_id)
+
+    def _write_draft(self, draft: Draft, dest_file: Path, source_file: Optional[Path] = None) -> None:
+        """Write a draft to dest_file, remove source_file if it moved, and update the index."""
+        touched = [dest_file.parent]
+        if source_file is not None and source_file != dest_file:
+            touched.append(source_file.parent)
+        fresh = self._index.fresh_dirs(*touched)
+
+        dest_file.write_text(draft.to_json(), encoding="utf-8")
+        if source_file is not None and source_file != dest_file:
+            source_file.unlink()
+
+        self._index.record(draft.draft_id, dest_file, fresh, touched)
+
+    def rebuild_index(self) -> int:
+        """Rebuild the draft index from disk. Returns the number of drafts indexed."""
+        return self._index.rebuild()
+
+    def compact_done(self, before=None) -> int:
+        """Roll closed Done/YYYY/MM/DD/ directories into JSONL segments.
+
+        Args:
+            before: Compact days strictly before this date (default: today, UTC).
+
+        Returns:
+            Number of drafts compacted.
+        """
+        count = self.done_archive.compact(before)
+        if count:
+            self._index.refresh()
+        return count
 
     def create_draft(self, domain: str, title: str, body: str, author: str) -> Draft:
         """Create a new draft in the Plans directory."""
@@ -110,7 +137,7 @@ class DraftManager:
         plans_dir = self.platinum_dir / "Plans" / domain
         plans_dir.mkdir(parents=True, exist_ok=True)
         draft_file = plans_dir / self._draft_filename(draft_id)
-        draft_file.write_text(draft.to_json(), encoding="utf-8")
+        self._write_draft(draft, draft_file)
 
         return draft
 
@@ -135,10 +162,7 @@ class DraftManager:
         dest_dir = self.platinum_dir / "Pending_Approval" / draft.domain
         dest_dir.mkdir(parents=True, exist_ok=True)
         dest_file = dest_dir / self._draft_filename(draft_id)
-
-        dest_file.write_text(draft.to_json(), encoding="utf-8")
-        if draft_file != dest_file:
-            draft_file.unlink()
+        self._write_draft(draft, dest_file, draft_file)
 
         return True
 
@@ -164,7 +188,7 @@ class DraftManager:
         return pending
 
     def approve(self, draft_id: str, approver: str) -> Optional[Draft]:
-        """Approve a draft and move to Done/."""
+        """Approve a draft and move to Done/YYYY/MM/DD/."""
         draft_file = self._find_draft_file(draft_id)
         if not draft_file or not draft_file.exists():
             return None
@@ -181,13 +205,11 @@ class DraftManager:
             "timestamp": now,
         })
 
-        # Move to Done/
-        done_dir = self.platinum_dir / "Done"
+        # Move to today's Done/ partition
+        done_dir = self.done_archive.day_dir()
         done_dir.mkdir(parents=True, exist_ok=True)
         dest_file = done_dir / self._draft_filename(draft_id)
-        dest_file.write_text(draft.to_json(), encoding="utf-8")
-        if draft_file != dest_file:
-            draft_file.unlink()
+        self._write_draft(draft, dest_file, draft_file)
 
         return draft
 
@@ -216,12 +238,9 @@ class DraftManager:
         return draft
 
     def get_draft(self, draft_id: str) -> Optional[Draft]:
-        """Retrieve a draft by ID."""
-        draft_file = self._find_draft_file(draft_id)
-        if not draft_file or not draft_file.exists():
-            return None
-        data = json.loads(draft_file.read_text(encoding="utf-8"))
-        return Draft.from_dict(data)
+        """Retrieve a draft by ID (including drafts compacted into Done/ segments)."""
+        data = self._index.read(draft_id)
+        return Draft.from_dict(data) if data is not None else None
 
     def get_audit_trail(self, draft_id: str) -> List[dict]:
         """Get the full audit trail for a draft."""
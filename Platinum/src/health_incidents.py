@@ -0,0 +1,156 @@
+"""
+IncidentTracker - Groups repeated health alerts into incidents.
+
+One incident per failing check name. The first failure opens it; later
+failures only bump its counter and last-seen time; the first healthy
+result resolves it. While an incident stays open it asks for a
+re-notification after `renotify_base` seconds, then twice that, four
+times that, ... capped at `renotify_max`.
+
+State lives in a SQLite sidecar (Platinum/.state/health_incidents.db) so a
+daemon restart does not re-open every ongoing incident.
+
+Usage:
+    tracker = IncidentTracker(Path("/path/to/vault/Platinum/.state/health_incidents.db"))
+    for event in tracker.observe(checks):
+        print(event.kind, event.incident["check"])
+"""
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+from pathlib import Path
+
+OPENED = "opened"
+REPEATED = "repeated"
+RENOTIFY = "renotify"
+RESOLVED = "resolved"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS incidents (
+    check_name    TEXT PRIMARY KEY,
+    incident_id   TEXT NOT NULL,
+    opened_at     REAL NOT NULL,
+    last_seen     REAL NOT NULL,
+    count         INTEGER NOT NULL,
+    message       TEXT,
+    last_notified REAL NOT NULL,
+    notify_count  INTEGER NOT NULL
+);
+"""
+
+_COLUMNS = (
+    "check_name", "incident_id", "opened_at", "last_seen",
+    "count", "message", "last_notified", "notify_count",
+)
+
+
+@dataclass
+class IncidentEvent:
+    """Something the caller should act on (or log) for one incident."""
+    kind: str
+    incident: dict
+
+
+def _iso(ts: float) -> str:
+    return datetime.utcfromtimestamp(ts).isoformat()
+
+
+class IncidentTracker:
+    """Tracks open incidents keyed by health check name."""
+
+    def __init__(self, db_path: Path, renotify_base: float = 900, renotify_max: float = 86400):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.renotify_base = renotify_base
+        self.renotify_max = renotify_max
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def _load(self) -> Dict[str, dict]:
+        rows = self._conn.execute(f"SELECT {', '.join(_COLUMNS)} FROM incidents").fetchall()
+        return {row[0]: dict(zip(_COLUMNS, row)) for row in rows}
+
+    @staticmethod
+    def _public(row: dict) -> dict:
+        return {
+            "incident_id": row["incident_id"],
+            "check": row["check_name"],
+            "count": row["count"],
+            "message": row["message"],
+            "opened_at": _iso(row["opened_at"]),
+            "last_seen": _iso(row["last_seen"]),
+            "duration_seconds": round(row["last_seen"] - row["opened_at"], 1),
+        }
+
+    def renotify_delay(self, notify_count: int) -> float:
+        """Seconds to wait after the `notify_count`-th notification before the next one."""
+        return min(self.renotify_base * (2 ** max(notify_count - 1, 0)), self.renotify_max)
+
+    def observe(self, checks: Iterable, now: Optional[float] = None) -> List[IncidentEvent]:
+        """Fold one round of HealthCheck results into the incident state.
+
+        Returns:
+            One event per check whose incident opened, repeated, is due a
+            re-notification, or resolved, in check order.
+        """
+        now = time.time() if now is None else now
+        events = []
+        with self._lock:
+            current = self._load()
+            self._conn.execute("BEGIN")
+            try:
+                for check in checks:
+                    row = current.get(check.name)
+                    if check.healthy:
+                        if row is not None:
+                            row["last_seen"] = now
+                            self._conn.execute(
+                                "DELETE FROM incidents WHERE check_name = ?", (check.name,)
+                            )
+                            events.append(IncidentEvent(RESOLVED, self._public(row)))
+                        continue
+
+                    if row is None:
+                        row = {
+                            "check_name": check.name,
+                            "incident_id": f"INC-{check.name}-{datetime.utcfromtimestamp(now):%Y%m%d%H%M%S}",
+                            "opened_at": now, "last_seen": now, "count": 1,
+                            "message": check.message, "last_notified": now, "notify_count": 1,
+                        }
+                        kind = OPENED
+                    else:
+                        row.update(last_seen=now, count=row["count"] + 1, message=check.message)
+                        kind = REPEATED
+                        if now - row["last_notified"] >= self.renotify_delay(row["notify_count"]):
+                            row.update(last_notified=now, notify_count=row["notify_count"] + 1)
+                            kind = RENOTIFY
+                    self._conn.execute(
+                        f"INSERT OR REPLACE INTO incidents ({', '.join(_COLUMNS)}) "
+                        f"VALUES ({', '.join('?' * len(_COLUMNS))})",
+                        tuple(row[c] for c in _COLUMNS),
+                    )
+                    events.append(IncidentEvent(kind, self._public(row)))
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+        return events
+
+    def open_incidents(self) -> List[dict]:
+        """Return every open incident, oldest first."""
+        with self._lock:
+            rows = sorted(self._load().values(), key=lambda r: r["opened_at"])
+        return [self._public(r) for r in rows]
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -2,21 +2,31 @@
 HealthMonitor - Monitors system health and generates alerts.
 
 Checks: Cloud VM HTTP ping, API /health, Odoo URL, agent heartbeat staleness.
+Checks run concurrently on a bounded thread pool; each has its own deadline
+and the whole cycle is capped at HEALTH_CYCLE_TIMEOUT seconds. More checks
+can be added with register_check().
 Alerts via email (using EmailSender) or task files in Needs_Action/monitoring/.
+Repeated failures of a check are grouped into one incident (IncidentTracker):
+one task when it opens, exponentially spaced re-notifications while it stays
+open, and a resolve notification when the check recovers.
 Writes status to Platinum/Updates/health_status.json.
 
 Usage:
     from Platinum.src.config import get_settings
     monitor = HealthMonitor(get_settings())
+    monitor.register_check("disk", check_disk, timeout=5)
     status = monitor.run_checks()
     monitor.write_status(status)
 """
 
 import json
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
 from datetime import datetime
-from typing import Optional, List, Dict
+from typing import Callable, Optional, List, Dict, Union
 from pathlib import Path
 from dataclasses import dataclass, field
 
@@ -41,6 +51,19 @@ class HealthStatus:
     checks: List[HealthCheck]
     alerts: List[str] = field(default_factory=list)
     timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    incidents: List[dict] = field(default_factory=list)
+
+
+@dataclass
+class CheckSpec:
+    """A registered health check.
+
+    `func` is either a callable returning a HealthCheck or the name of a
+    HealthMonitor method, looked up when the check runs.
+    """
+    name: str
+    func: Union[str, Callable[[], HealthCheck]]
+    timeout: float
 
 
 class HealthMonitor:
@@ -50,6 +73,45 @@ class HealthMonitor:
         self.settings = settings
         self.vault_path = Path(settings.VAULT_PATH)
         self._alert_history: List[dict] = []
+        self._incidents = None
+        self._checks: Dict[str, CheckSpec] = {}
+        # Deadlines match the urllib timeouts used inside each check
+        self.register_check("api_health", "check_api_health", timeout=10)
+        self.register_check("cloud_vm", "check_cloud_vm", timeout=15)
+        self.register_check("odoo", "check_odoo", timeout=10)
+        self.register_check("agent_heartbeats", "check_agent_heartbeats", timeout=5)
+
+    def register_check(
+        self,
+        name: str,
+        func: Union[str, Callable[[], HealthCheck]],
+        timeout: float = 10,
+    ) -> None:
+        """Add (or replace) a check run by run_checks().
+
+        Args:
+            name: Check name, used in timeout results.
+            func: Callable returning a HealthCheck, or a method name.
+            timeout: Seconds after the cycle starts before the check is
+                reported as timed out.
+        """
+        self._checks[name] = CheckSpec(name=name, func=func, timeout=timeout)
+
+    def unregister_check(self, name: str) -> None:
+        """Remove a registered check."""
+        self._checks.pop(name, None)
+
+    @property
+    def incidents(self):
+        """IncidentTracker for this vault, opened on first use."""
+        if self._incidents is None:
+            from Platinum.src.health_incidents import IncidentTracker
+            self._incidents = IncidentTracker(
+                self.vault_path / "Platinum" / ".state" / "health_incidents.db",
+                renotify_base=self.settings.HEALTH_RENOTIFY_BASE,
+                renotify_max=self.settings.HEALTH_RENOTIFY_MAX,
+            )
+        return self._incidents
 
     def check_api_health(self) -> HealthCheck:
         """Check if the FastAPI server is responding."""
@@ -168,14 +230,15 @@ class HealthMonitor:
             message=f"All {len(summary)} agents healthy",
         )
 
-    def run_checks(self) -> HealthStatus:
-        """Run all health checks and return aggregate status."""
-        checks = [
-            self.check_api_health(),
-            self.check_cloud_vm(),
-            self.check_odoo(),
-            self.check_agent_heartbeats(),
-        ]
+    def run_checks(self, handle_alerts: bool = True) -> HealthStatus:
+        """Run all health checks and return aggregate status.
+
+        Args:
+            handle_alerts: Track incidents and create alert tasks/emails for
+                failing checks. Only HealthMonitorDaemon should; readers such
+                as the API pass False.
+        """
+        checks = self._run_registered_checks()
 
         alerts = []
         for check in checks:
@@ -191,37 +254,120 @@ class HealthMonitor:
             alerts=alerts,
         )
 
-        if alerts:
-            self._handle_alerts(alerts)
+        if handle_alerts:
+            status.incidents = self._process_incidents(checks)
 
         return status
 
-    def _handle_alerts(self, alerts: List[str]):
+    def _process_incidents(self, checks: List[HealthCheck]) -> List[dict]:
+        """Open, update or resolve incidents for this round. Returns the open ones."""
+        from Platinum.src.health_incidents import OPENED, RENOTIFY, RESOLVED
+
+        for event in self.incidents.observe(checks):
+            incident = event.incident
+            if event.kind == OPENED:
+                self._handle_alerts(
+                    [f"[ALERT] {incident['check']}: {incident['message']}"], incident=incident
+                )
+            elif event.kind == RENOTIFY:
+                logger.warning(
+                    f"Incident {incident['incident_id']} still open "
+                    f"({incident['count']} failures since {incident['opened_at']})"
+                )
+                self._notify(
+                    [f"[ALERT] {incident['check']}: {incident['message']} "
+                     f"(failing since {incident['opened_at']}, {incident['count']} checks)"],
+                    subject="Health Alert (ongoing)",
+                )
+            elif event.kind == RESOLVED:
+                logger.info(
+                    f"Incident {incident['incident_id']} resolved after "
+                    f"{incident['duration_seconds']}s ({incident['count']} failures)"
+                )
+                self._alert_history.append(dict(incident, status="RESOLVED"))
+                self._notify(
+                    [f"[RESOLVED] {incident['check']} recovered after "
+                     f"{incident['duration_seconds']}s ({incident['count']} failed checks)"],
+                    subject="Health Resolved",
+                )
+        return self.incidents.open_incidents()
+
+    def _run_registered_checks(self) -> List[HealthCheck]:
+        """Run every registered check concurrently, in registration order."""
+        specs = list(self._checks.values())
+        if not specs:
+            return []
+        cycle_timeout = self.settings.HEALTH_CYCLE_TIMEOUT
+        pool = ThreadPoolExecutor(
+            max_workers=max(1, min(self.settings.HEALTH_MAX_WORKERS, len(specs))),
+            thread_name_prefix="health-check",
+        )
+        start = time.monotonic()
+        try:
+            futures = [(spec, pool.submit(self._call_check, spec)) for spec in specs]
+            results = []
+            for spec, future in futures:
+                deadline = start + min(spec.timeout, cycle_timeout)
+                try:
+                    results.append(future.result(timeout=max(0.0, deadline - time.monotonic())))
+                except FutureTimeout:
+                    future.cancel()
+                    results.append(HealthCheck(
+                        name=spec.name,
+                        target="(timeout)",
+                        healthy=False,
+                        message=f"Check timed out after {min(spec.timeout, cycle_timeout):g}s",
+                    ))
+            return results
+        finally:
+            # Don't wait for stragglers: a hung probe must not stretch the cycle
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _call_check(self, spec: CheckSpec) -> HealthCheck:
+        func = getattr(self, spec.func) if isinstance(spec.func, str) else spec.func
+        try:
+            return func()
+        except Exception as e:
+            logger.error(f"Health check {spec.name} raised: {e}")
+            return HealthCheck(
+                name=spec.name,
+                target="(error)",
+                healthy=False,
+                message=f"Check failed: {e}",
+            )
+
+    def _handle_alerts(self, alerts: List[str], incident: Optional[dict] = None):
         """Handle health alerts - create monitoring task files."""
         monitoring_dir = self.vault_path / "Platinum" / "Needs_Action" / "monitoring"
         monitoring_dir.mkdir(parents=True, exist_ok=True)
 
+        task_id = f"HEALTH-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}"
         alert_data = {
-            "task_id": f"HEALTH-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}",
+            "task_id": task_id if incident is None else f"{task_id}-{incident['check']}",
             "domain": "monitoring",
-            "title": "Health Alert",
+            "title": "Health Alert" if incident is None else f"Health Alert: {incident['check']}",
             "body": "\n".join(alerts),
             "status": "NEEDS_ACTION",
             "created_at": datetime.utcnow().isoformat(),
         }
+        if incident is not None:
+            alert_data["incident_id"] = incident["incident_id"]
         alert_file = monitoring_dir / f"{alert_data['task_id']}.json"
         alert_file.write_text(json.dumps(alert_data, indent=2), encoding="utf-8")
         self._alert_history.append(alert_data)
         logger.info(f"Health alert created: {alert_data['task_id']}")
 
-        # Send email alert if configured
+        self._notify(alerts)
+
+    def _notify(self, alerts: List[str], subject: str = "Health Alert"):
+        """Send an email alert if configured."""
         if self.settings.HEALTH_ALERT_EMAIL and self.settings.is_local:
             try:
-                self._send_email_alert(alerts)
+                self._send_email_alert(alerts, subject=subject)
             except Exception as e:
                 logger.error(f"Failed to send email alert: {e}")
 
-    def _send_email_alert(self, alerts: List[str]):
+    def _send_email_alert(self, alerts: List[str], subject: str = "Health Alert"):
         """Send health alert via email (Local agent only)."""
         if not self.settings.has_smtp:
             return
@@ -229,7 +375,7 @@ class HealthMonitor:
         sender = EmailSender(self.settings)
         sender.send(
             to=self.settings.HEALTH_ALERT_EMAIL,
-            subject=f"[AI Employee] Health Alert - {datetime.utcnow().strftime('%Y-%m-%d %H:%M')}",
+            subject=f"[AI Employee] {subject} - {datetime.utcnow().strftime('%Y-%m-%d %H:%M')}",
             body=f"Health Monitor detected issues:\n\n" + "\n".join(alerts),
         )
 
@@ -253,6 +399,7 @@ class HealthMonitor:
                 for c in status.checks
             ],
             "alerts": status.alerts,
+            "incidents": status.incidents,
             "timestamp": status.timestamp,
         }
         status_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
@@ -274,9 +421,122 @@ class HealthMonitor:
                 for c in status.checks
             ],
             "alerts": status.alerts,
+            "incidents": status.incidents,
             "timestamp": status.timestamp,
         }
 
     def get_alert_history(self) -> List[dict]:
         """Return recent alert history."""
         return self._alert_history.copy()
+
+
+class HealthSnapshotCache:
+    """Serves the last health snapshot from memory (for the API).
+
+    The snapshot is Platinum/Updates/health_status.json as written by
+    HealthMonitorDaemon, re-read only when the file changes. When it is
+    older than `max_age` seconds (daemon down or lagging) one background
+    refresh runs the checks without creating alerts; concurrent callers
+    share that refresh instead of probing again.
+    """
+
+    def __init__(self, settings, max_age: Optional[float] = None):
+        self.settings = settings
+        self.max_age = max_age if max_age is not None else settings.HEALTH_SNAPSHOT_MAX_AGE
+        self.status_file = Path(settings.VAULT_PATH) / "Platinum" / "Updates" / "health_status.json"
+        self._lock = threading.Lock()
+        self._snapshot: Optional[dict] = None
+        self._source: Optional[str] = None
+        self._file_sig = None
+        self._refresh_done: Optional[threading.Event] = None
+
+    @staticmethod
+    def _age_seconds(snapshot: dict) -> float:
+        try:
+            taken = datetime.fromisoformat(snapshot["timestamp"])
+        except (KeyError, TypeError, ValueError):
+            return float("inf")
+        return (datetime.utcnow() - taken).total_seconds()
+
+    def _store(self, snapshot: dict, source: str) -> None:
+        """Keep `snapshot` if it is newer than the cached one (caller holds the lock)."""
+        if self._snapshot is None or self._age_seconds(snapshot) <= self._age_seconds(self._snapshot):
+            self._snapshot = snapshot
+            self._source = source
+
+    def _load_file(self) -> None:
+        try:
+            st = self.status_file.stat()
+        except OSError:
+            return
+        sig = (st.st_mtime_ns, st.st_size)
+        if sig == self._file_sig:
+            return
+        try:
+            snapshot = json.loads(self.status_file.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        with self._lock:
+            self._file_sig = sig
+            self._store(snapshot, "daemon")
+
+    def refresh(self) -> threading.Event:
+        """Start a background refresh unless one is already running.
+
+        Returns:
+            Event set when the in-flight refresh finishes.
+        """
+        with self._lock:
+            if self._refresh_done is not None:
+                return self._refresh_done
+            done = self._refresh_done = threading.Event()
+
+        def _run():
+            try:
+                monitor = HealthMonitor(self.settings)
+                snapshot = monitor.get_status_dict(monitor.run_checks(handle_alerts=False))
+                with self._lock:
+                    self._store(snapshot, "api")
+            except Exception as e:
+                logger.error(f"Background health refresh failed: {e}")
+            finally:
+                with self._lock:
+                    self._refresh_done = None
+                done.set()
+
+        threading.Thread(target=_run, name="health-refresh", daemon=True).start()
+        return done
+
+    def get(self, wait: Optional[float] = None) -> dict:
+        """Return the cached snapshot, refreshing it in the background if stale.
+
+        Only blocks (up to `wait` seconds, default HEALTH_CYCLE_TIMEOUT)
+        when there is no snapshot at all yet.
+        """
+        self._load_file()
+        with self._lock:
+            snapshot = self._snapshot
+        if snapshot is None or self._age_seconds(snapshot) > self.max_age:
+            done = self.refresh()
+            if snapshot is None:
+                done.wait(self.settings.HEALTH_CYCLE_TIMEOUT if wait is None else wait)
+                with self._lock:
+                    snapshot = self._snapshot
+        if snapshot is None:
+            return {
+                "overall_healthy": False,
+                "checks": [],
+                "alerts": ["Health snapshot not available yet"],
+                "timestamp": datetime.utcnow().isoformat(),
+                "stale": True,
+            }
+
+        age = self._age_seconds(snapshot)
+        with self._lock:
+            source = self._source
+        return dict(
+            snapshot,
+            age_seconds=round(age, 1),
+            stale=age > self.max_age,
+            source=source,
+        )
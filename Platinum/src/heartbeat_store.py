@@ -0,0 +1,171 @@
+"""
+HeartbeatStore - Compact local store for agent heartbeats.
+
+Each agent is one row in a SQLite sidecar (Platinum/.state/heartbeats.db),
+so a beat is a single atomic UPSERT and a health check reads every agent
+with one SELECT, instead of rewriting and re-parsing a JSON file per agent.
+
+The sidecar is local to the machine and never synced. Agents on the other
+side of VaultSync are seen through the compact `<agent>_heartbeat.json`
+files AgentHeartbeat publishes to Updates/ at a much lower rate;
+ingest_published() folds those into the store, re-reading a file only
+when its size or mtime changed.
+
+Usage:
+    store = HeartbeatStore.for_vault("/path/to/vault")
+    store.put({"agent_name": "cloud", "status": "online", ...})
+    print(store.read_all())
+"""
+
+import os
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+from pathlib import Path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS heartbeats (
+    agent_name   TEXT PRIMARY KEY,
+    status       TEXT NOT NULL,
+    current_task TEXT,
+    timestamp    TEXT NOT NULL,
+    interval     INTEGER,
+    source       TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS published (
+    path     TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size     INTEGER NOT NULL
+);
+"""
+
+_COLUMNS = ("agent_name", "status", "current_task", "timestamp", "interval")
+
+_stores: Dict[Path, "HeartbeatStore"] = {}
+_stores_lock = threading.Lock()
+
+
+class HeartbeatStore:
+    """One fixed-size row per agent: status, current task, last beat, interval."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    @classmethod
+    def for_vault(cls, vault_path: str) -> "HeartbeatStore":
+        """Return the shared store for a vault, opening it on first use."""
+        db_path = Path(vault_path) / "Platinum" / ".state" / "heartbeats.db"
+        with _stores_lock:
+            store = _stores.get(db_path)
+            if store is None:
+                store = _stores[db_path] = cls(db_path)
+            return store
+
+    def put(self, record: dict, source: str = "local") -> None:
+        """Insert or replace an agent's heartbeat."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO heartbeats "
+                "(agent_name, status, current_task, timestamp, interval, source) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                tuple(record.get(c) for c in _COLUMNS) + (source,),
+            )
+
+    def get(self, agent_name: str) -> Optional[dict]:
+        """Return one agent's last heartbeat, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT agent_name, status, current_task, timestamp, interval "
+                "FROM heartbeats WHERE agent_name = ?",
+                (agent_name,),
+            ).fetchone()
+        return dict(zip(_COLUMNS, row)) if row else None
+
+    def read_all(self) -> Dict[str, dict]:
+        """Return every agent's last heartbeat, keyed by agent name."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT agent_name, status, current_task, timestamp, interval "
+                "FROM heartbeats ORDER BY agent_name"
+            ).fetchall()
+        return {row[0]: dict(zip(_COLUMNS, row)) for row in rows}
+
+    def ingest_published(self, updates_dir: Path) -> int:
+        """Fold changed `*_heartbeat.json` files from Updates/ into the store.
+
+        A file only replaces a row whose heartbeat is older, so a stale or
+        unreadable published copy never overrides a beat recorded locally.
+
+        Returns:
+            Number of files re-read.
+        """
+        updates_dir = Path(updates_dir)
+        read = 0
+        try:
+            entries = [e for e in os.scandir(updates_dir) if e.name.endswith("_heartbeat.json")]
+        except OSError:
+            return 0
+
+        for entry in entries:
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT mtime_ns, size FROM published WHERE path = ?", (entry.name,)
+                ).fetchone()
+            if row == (st.st_mtime_ns, st.st_size):
+                continue
+
+            read += 1
+            agent_name = entry.name[: -len("_heartbeat.json")]
+            try:
+                data = json.loads(Path(entry.path).read_text(encoding="utf-8"))
+                datetime.fromisoformat(data["timestamp"])
+                record = {c: data.get(c) for c in _COLUMNS}
+                record["agent_name"] = agent_name
+                record["status"] = record["status"] or "unknown"
+            except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+                record = {
+                    "agent_name": agent_name, "status": "error",
+                    "current_task": None, "timestamp": "", "interval": None,
+                }
+
+            with self._lock:
+                self._conn.execute("BEGIN")
+                try:
+                    current = self._conn.execute(
+                        "SELECT timestamp FROM heartbeats WHERE agent_name = ?", (agent_name,)
+                    ).fetchone()
+                    if current is None or (record["timestamp"] and record["timestamp"] >= current[0]):
+                        self._conn.execute(
+                            "INSERT OR REPLACE INTO heartbeats "
+                            "(agent_name, status, current_task, timestamp, interval, source) "
+                            "VALUES (?, ?, ?, ?, ?, 'published')",
+                            tuple(record[c] for c in _COLUMNS),
+                        )
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO published (path, mtime_ns, size) VALUES (?, ?, ?)",
+                        (entry.name, st.st_mtime_ns, st.st_size),
+                    )
+                    self._conn.execute("COMMIT")
+                except sqlite3.Error:
+                    self._conn.execute("ROLLBACK")
+                    raise
+        return read
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,7 +1,7 @@
 """
 LocalAgent - Local Executive Agent for the Platinum Tier.
 
-Uses skills: DraftManager, AgentHeartbeat, SecretGuard, VaultSync
+Uses skills: DraftManager, AgentHeartbeat, SecretGuard, VaultSync, AuditLog
 
 The Local Agent has full executive authority. It reviews drafts submitted
 by the Cloud Agent, approves or rejects them, and executes the final
@@ -26,6 +26,7 @@ from Platinum.src.vault_sync import VaultSync
 from Platinum.src.draft_manager import DraftManager, Draft
 from Platinum.src.agent_heartbeat import AgentHeartbeat
 from Platinum.src.secret_guard import SecretGuard
+from Platinum.src.audit_log import AuditLog
 from Platinum.src.config import get_settings
 
 logger = logging.getLogger("platinum.local_agent")
@@ -50,6 +51,12 @@ class LocalAgent:
             interval=self.settings.HEARTBEAT_INTERVAL,
         )
         self.secret_guard = SecretGuard(agent_role="local")  # Full access
+        self.execution_log = AuditLog(
+            self.vault_path / "Platinum" / "Logs", "execution_log",
+            max_bytes=self.settings.AUDIT_SEGMENT_MAX_BYTES,
+            max_age=self.settings.AUDIT_SEGMENT_MAX_AGE,
+            index_fields=("draft_id", "domain", "action"),
+        )
         self._running = False
         self._log: list = []
         self._executed_actions: list = []
@@ -164,12 +171,8 @@ class LocalAgent:
         return True
 
     def _write_execution_log(self, action_record: dict):
-        """Write execution record to Platinum/Logs/."""
-        logs_dir = self.vault_path / "Platinum" / "Logs"
-        logs_dir.mkdir(parents=True, exist_ok=True)
-        log_file = logs_dir / "execution_log.jsonl"
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(action_record) + "\n")
+        """Write execution record to Platinum/Logs/ (rotating, indexed segments)."""
+        self.execution_log.write(action_record)
 
     def update_dashboard(self):
         """Update the Platinum dashboard with current status (single-writer)."""
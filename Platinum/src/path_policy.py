@@ -0,0 +1,202 @@
+"""
+PathPolicy - Compiled allow/deny rules for vault paths.
+
+One engine behind both VaultSync's sync filter and SecretGuard's secret
+patterns. Blocked "*.ext" rules (glob or regex) collapse into one suffix
+check, every other blocked pattern into a single regex alternation, and
+the sync allow-list is an extension set lookup.
+
+decide() checks a whole batch at once: the paths are joined into one
+newline-separated string and each rule scans it in multiline mode, so
+the work per path is C-level substring search rather than a Python call
+per path and per pattern. Every rule regex starts with a literal, which
+the regex engine can scan for directly; an alternation, or a leading
+anchor or character class, is instead tried at every position.
+
+Glob rules:
+- `*` and `?` never cross a "/"; everything else is literal.
+- A glob without "/" matches the file name at any depth (".env", "*.key").
+- A glob with "/" matches at any directory boundary ("banking/*").
+- A path whose parent directory matches is blocked too, except for plain
+  "*.ext" globs, which only look at the file name.
+
+Matching is case-insensitive. Patterns are written in lowercase, and
+paths are lowercased before matching.
+
+Usage:
+    policy = PathPolicy(globs=["*.key", "banking/*"], allowed_extensions={".md"})
+    policy.allows("notes/todo.md")                        # True
+    policy.decide(["a.md", "vault.key", "banking/x.md"])  # [True, False, False]
+"""
+
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import Iterable, List, Optional
+
+
+def glob_to_regex(glob: str) -> str:
+    """Translate an fnmatch-style glob into an unanchored regex fragment."""
+    glob = glob.lower()
+    out = []
+    for ch in glob.lstrip("*"):
+        if ch == "*":
+            out.append(r"[^/\n]*")
+        elif ch == "?":
+            out.append(r"[^/\n]")
+        else:
+            out.append(re.escape(ch))
+    regex = "".join(out)
+
+    # Anchor at a path component boundary. A leading "*" already reaches
+    # back to one. Otherwise the check goes after the literal prefix, as a
+    # lookbehind, so the regex still starts with that literal.
+    if not glob.startswith("*"):
+        literal = re.match(r"[^*?]*", glob).group()
+        if literal:
+            lit = re.escape(literal)
+            regex = lit + rf"(?<![^/\n]{lit})" + regex[len(lit):]
+        else:
+            regex = r"(?:^|/)" + regex
+    # Match the entry itself or anything beneath it
+    return regex + r"(?:/|$)"
+
+
+def _regex_fragment(pattern: str) -> str:
+    # A leading ".*" is redundant under search() and only adds backtracking
+    return pattern[2:] if pattern.startswith(".*") else pattern
+
+
+def _glob_suffix(glob: str) -> Optional[str]:
+    """".key" for a glob like "*.key", else None."""
+    m = re.fullmatch(r"\*(\.[^*?/]+)", glob)
+    return m.group(1).lower() if m else None
+
+
+def _regex_suffix(pattern: str) -> Optional[str]:
+    """".key" for a regex like r".*\\.key$", else None."""
+    m = re.fullmatch(r"\\\.(\w+)\$", _regex_fragment(pattern))
+    return "." + m.group(1).lower() if m else None
+
+
+def _extension(path: str) -> str:
+    """Suffix of the last path component, as Path.suffix computes it."""
+    name = path[path.rfind("/") + 1:]
+    i = name.rfind(".")
+    return name[i:] if 0 < i < len(name) - 1 else ""
+
+
+class PathPolicy:
+    """Blocked patterns plus an optional extension allow-list, compiled once."""
+
+    def __init__(
+        self,
+        globs: Iterable[str] = (),
+        regexes: Iterable[str] = (),
+        allowed_extensions: Optional[Iterable[str]] = None,
+        cache_size: int = 65536,
+    ):
+        """
+        Args:
+            globs: fnmatch-style blocked patterns.
+            regexes: Blocked regexes (lowercase), applied with search().
+            allowed_extensions: If given, a path whose file name has an
+                extension outside this set is denied. Paths with no
+                extension are allowed.
+            cache_size: Per-path decisions kept by allows() and is_blocked().
+        """
+        self.globs = list(globs)
+        self.regexes = list(regexes)
+        self.allowed_extensions = (
+            frozenset(e.lower() for e in allowed_extensions)
+            if allowed_extensions is not None else None
+        )
+
+        suffixes = set()
+        fragments = []
+        for glob in self.globs:
+            suffix = _glob_suffix(glob)
+            if suffix:
+                suffixes.add(suffix)
+            else:
+                fragments.append(glob_to_regex(glob))
+        for regex in self.regexes:
+            suffix = _regex_suffix(regex)
+            if suffix:
+                suffixes.add(suffix)
+            elif _regex_fragment(regex) not in fragments:
+                fragments.append(_regex_fragment(regex))
+        self.blocked_suffixes = tuple(sorted(suffixes))
+
+        self._blocked_re = (
+            re.compile("|".join(f"(?:{f})" for f in fragments)) if fragments else None
+        )
+
+        # Batch scans: one regex per rule, each starting with a literal
+        scans = [re.compile(f, re.MULTILINE) for f in fragments]
+        if suffixes:
+            # Shared "\." prefix: still a literal scan
+            scans.append(re.compile(
+                r"\.(?:" + "|".join(re.escape(s[1:]) for s in self.blocked_suffixes) + r")$",
+                re.MULTILINE,
+            ))
+        self._scans = scans
+        # Last extension of a line that is not on the allow-list; the
+        # caller rejects hits that start the file name (".env" has no suffix)
+        self._bad_extension_re = None
+        if self.allowed_extensions is not None:
+            allowed = "|".join(re.escape(e[1:]) for e in sorted(self.allowed_extensions))
+            self._bad_extension_re = re.compile(
+                rf"\.(?!(?:{allowed})$)[^./\n]+$" if allowed else r"\.[^./\n]+$",
+                re.MULTILINE,
+            )
+
+        self.is_blocked = lru_cache(maxsize=cache_size)(self._is_blocked)
+        self.allows = lru_cache(maxsize=cache_size)(self._allows)
+
+    def _is_blocked(self, path: str) -> bool:
+        """True if the path matches a blocked pattern (the extension allow-list aside)."""
+        lowered = path.lower()
+        if self.blocked_suffixes and lowered.endswith(self.blocked_suffixes):
+            return True
+        return self._blocked_re is not None and self._blocked_re.search(lowered) is not None
+
+    def _allows(self, path: str) -> bool:
+        """True if the path is neither blocked nor of a disallowed extension."""
+        if self.allowed_extensions is not None:
+            ext = _extension(path).lower()
+            if ext and ext not in self.allowed_extensions:
+                return False
+        return not self._is_blocked(path)
+
+    def decide(self, paths: Iterable[str]) -> List[bool]:
+        """Allow (True) / deny (False) for each path, in order, in one pass."""
+        paths = list(paths)
+        if not paths:
+            return []
+        # Offsets come from the lowered paths: lowercasing can change a
+        # path's length ("İ" becomes two characters)
+        lowered = [p.lower() for p in paths]
+        blob = "\n".join(lowered)
+        if blob.count("\n") != len(paths) - 1:
+            # A path contains a newline; lines no longer map to paths
+            return [self._allows(p) for p in paths]
+
+        decisions = [True] * len(paths)
+        starts = [0]
+        starts.extend(accumulate(len(p) + 1 for p in lowered[:-1]))
+        for regex in self._scans:
+            for match in regex.finditer(blob):
+                decisions[bisect_right(starts, match.start()) - 1] = False
+        if self._bad_extension_re is not None:
+            for match in self._bad_extension_re.finditer(blob):
+                pos = match.start()
+                if pos and blob[pos - 1] not in "/\n":
+                    decisions[bisect_right(starts, pos) - 1] = False
+        return decisions
+
+    def filter(self, paths: Iterable[str]) -> List[str]:
+        """Return the allowed paths, in order."""
+        paths = list(paths)
+        return [p for p, ok in zip(paths, self.decide(paths)) if ok]
@@ -0,0 +1,79 @@
+"""
+Path policy benchmark - paths/second through VaultSync's sync filter.
+
+Generates synthetic vault paths (nested task directories, a spread of
+extensions, a few percent secrets) and times SYNC_POLICY on them two
+ways: decide() on the whole batch, and allows() one path at a time with
+the decision cache bypassed.
+
+Usage:
+    python -m Platinum.src.path_policy_benchmark --paths 1000000
+"""
+
+import time
+import random
+from typing import Dict, List
+
+from Platinum.src.path_policy import PathPolicy
+from Platinum.src.vault_sync import SYNC_POLICY
+
+_DIRS = ["Needs_Action", "In_Progress/cloud", "Pending_Approval", "Done/2026/10/17", "Updates", "Logs"]
+_EXTENSIONS = [".md"] * 6 + [".json"] * 3 + [".jsonl", ".txt", ".yaml", ".py", ".png", ""]
+_SECRETS = [".env", "vault.key", "cert.pem", "banking/statement.md", "secrets/api.md", "smtp_credentials"]
+
+
+def synthetic_paths(count: int, secret_ratio: float = 0.02, seed: int = 0) -> List[str]:
+    """Return `count` vault-relative paths, roughly `secret_ratio` of them secrets."""
+    rng = random.Random(seed)
+    paths = []
+    for i in range(count):
+        base = f"Platinum/{rng.choice(_DIRS)}/d{rng.randrange(200)}"
+        if rng.random() < secret_ratio:
+            paths.append(f"{base}/{rng.choice(_SECRETS)}")
+        else:
+            paths.append(f"{base}/TASK_{i}{rng.choice(_EXTENSIONS)}")
+    return paths
+
+
+def run_benchmark(count: int = 1_000_000, policy: PathPolicy = SYNC_POLICY) -> Dict[str, float]:
+    """Time batch and per-path decisions on `count` synthetic paths.
+
+    Returns:
+        {"paths": int, "allowed": int, "batch_per_sec": float, "single_per_sec": float}
+    """
+    paths = synthetic_paths(count)
+
+    start = time.perf_counter()
+    decisions = policy.decide(paths)
+    batch_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    single = [policy._allows(p) for p in paths]
+    single_elapsed = time.perf_counter() - start
+
+    if single != decisions:
+        raise AssertionError("batch and per-path decisions differ")
+    return {
+        "paths": count,
+        "allowed": sum(decisions),
+        "batch_per_sec": round(count / max(batch_elapsed, 1e-9), 1),
+        "single_per_sec": round(count / max(single_elapsed, 1e-9), 1),
+    }
+
+
+def main():
+    """Entry point: print paths/second for batch and per-path checks."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the vault path policy")
+    parser.add_argument("--paths", type=int, default=1_000_000, help="Synthetic paths to check")
+    args = parser.parse_args()
+
+    r = run_benchmark(args.paths)
+    print(f"{r['paths']:,} paths, {r['allowed']:,} allowed")
+    print(f"  decide() batch : {r['batch_per_sec']:>12,.0f} paths/s")
+    print(f"  allows() each  : {r['single_per_sec']:>12,.0f} paths/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,11 +14,14 @@ Usage:
 """
 
 import os
-import re
+import time
+from collections import deque
 from datetime import datetime
 from typing import List
 from pathlib import Path
 
+from Platinum.src.path_policy import PathPolicy
+
 
 # Patterns blocked for Cloud agent (never allowed to access)
 BLOCKED_PATTERNS = [
@@ -42,6 +45,14 @@ BLOCKED_PATTERNS = [
     r"smtp_credentials(/.*)?$",
 ]
 
+# Compiled once; VaultSync's sync filter blocks the same directories (as
+# whole path components). Patterns are lowercase; matching is case-insensitive.
+SECRET_POLICY = PathPolicy(regexes=BLOCKED_PATTERNS)
+
+# Default number of access attempts kept in the in-memory audit log
+AUDIT_LOG_SIZE = 1000
+
+
 # Resource types that are always safe for any agent
 SAFE_RESOURCES = {
     "email_draft", "social_draft", "accounting_draft",
@@ -54,12 +65,12 @@ SAFE_RESOURCES = {
 class SecretGuard:
     """Enforces secret access boundaries between Cloud and Local agents."""
 
-    def __init__(self, agent_role: str = "cloud"):
+    def __init__(self, agent_role: str = "cloud", audit_log_size: int = AUDIT_LOG_SIZE):
         if agent_role not in ("cloud", "local"):
             raise ValueError(f"Invalid agent_role: {agent_role}. Must be 'cloud' or 'local'.")
         self.agent_role = agent_role
-        self._blocked_patterns = [re.compile(p, re.IGNORECASE) for p in BLOCKED_PATTERNS]
-        self._audit_log: List[dict] = []
+        # Ring buffer of (epoch seconds, resource, allowed); oldest entries drop off
+        self._audit_log = deque(maxlen=audit_log_size)
 
     def can_access(self, resource_type: str) -> bool:
         """Check if current agent role is allowed to access a resource.
@@ -80,15 +91,10 @@ class SecretGuard:
             self.audit_access_attempt(resource_type, True)
             return True
 
-        # Cloud agent: check against blocked patterns
-        for pattern in self._blocked_patterns:
-            if pattern.search(resource_type):
-                self.audit_access_attempt(resource_type, False)
-                return False
-
-        # Not explicitly blocked - allow
-        self.audit_access_attempt(resource_type, True)
-        return True
+        # Cloud agent: check against blocked patterns (cached per resource)
+        allowed = not SECRET_POLICY.is_blocked(resource_type)
+        self.audit_access_attempt(resource_type, allowed)
+        return allowed
 
     def validate_sync_files(self, files: List[str]) -> List[str]:
         """Filter out secret files from a list of files to sync.
@@ -99,9 +105,20 @@ class SecretGuard:
         Returns:
             List of files that are safe to sync (secrets removed).
         """
+        files = list(files)
+        if self.agent_role == "local":
+            decisions = [True] * len(files)
+        else:
+            # One batch pass over the blocked patterns; safe resource
+            # types stay allowed as in can_access()
+            decisions = [
+                ok or f.lower() in SAFE_RESOURCES
+                for f, ok in zip(files, SECRET_POLICY.decide(files))
+            ]
         safe_files = []
-        for f in files:
-            if self.can_access(f):
+        for f, allowed in zip(files, decisions):
+            self.audit_access_attempt(f, allowed)
+            if allowed:
                 safe_files.append(f)
         return safe_files
 
@@ -112,21 +129,21 @@ class SecretGuard:
         return BLOCKED_PATTERNS.copy()
 
     def audit_access_attempt(self, resource: str, allowed: bool) -> None:
-        """Log an access attempt for auditing."""
-        self._audit_log.append({
-            "agent_role": self.agent_role,
-            "resource": resource,
-            "allowed": allowed,
-            "timestamp": datetime.utcnow().isoformat(),
-        })
+        """Log an access attempt for auditing (the most recent `audit_log_size` are kept)."""
+        self._audit_log.append((time.time(), resource, allowed))
 
     def get_audit_log(self) -> List[dict]:
-        """Return the access attempt audit log."""
-        return self._audit_log.copy()
+        """Return the retained access attempts, oldest first."""
+        return [
+            {
+                "agent_role": self.agent_role,
+                "resource": resource,
+                "allowed": allowed,
+                "timestamp": datetime.utcfromtimestamp(ts).isoformat(),
+            }
+            for ts, resource, allowed in self._audit_log
+        ]
 
     def is_secret_file(self, filepath: str) -> bool:
         """Check if a file path matches any secret pattern."""
-        for pattern in self._blocked_patterns:
-            if pattern.search(filepath):
-                return True
-        return False
+        return SECRET_POLICY.is_blocked(filepath)
@@ -1,18 +1,34 @@
 """
-Sync Daemon - Periodic git sync between Cloud and Local.
+Sync Daemon - Git sync between Cloud and Local.
 
-Runs continuously, pulling and pushing vault changes at regular intervals.
-Supports SSH key authentication for secure git operations.
+Runs continuously, pulling and pushing vault changes. Supports SSH key
+authentication for secure git operations.
+
+Two modes (PLATINUM_SYNC_MODE):
+    event     Watch Platinum/ for changes and sync a few seconds after a
+              burst settles (SYNC_DEBOUNCE, capped at SYNC_MAX_DELAY), so a
+              new draft in Pending_Approval/ reaches the other agent right
+              away. With no local changes the daemon still pulls, starting
+              at SYNC_MIN_INTERVAL and doubling up to SYNC_INTERVAL while
+              cycles keep coming back empty.
+    interval  Sync every SYNC_INTERVAL seconds.
+
+sync_status.json also carries cumulative cycle durations (count, sum and
+per-bucket counts for DURATION_BUCKETS) for the API's /metrics endpoint.
 
 Usage:
     python -m Platinum.src.sync_daemon
 """
 
+import math
 import signal
 import sys
 import time
+import threading
 import logging
 from datetime import datetime
+from typing import Optional
+from pathlib import Path
 
 logging.basicConfig(
     level=logging.INFO,
@@ -20,6 +36,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger("platinum.sync_daemon")
 
+# Changes here ride along with the next sync but never trigger one:
+# status and heartbeat files are rewritten constantly, the daemon's own
+# sync_status.json included.
+QUIET_DIRS = ("Updates", "Logs")
+
+# Sync cycle duration histogram bounds (seconds); counts have one more
+# entry for slower cycles
+DURATION_BUCKETS = (0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
 
 class SyncDaemon:
     """Daemon process for periodic vault synchronization."""
@@ -30,6 +55,11 @@ class SyncDaemon:
             settings = get_settings()
         self.settings = settings
         self._running = False
+        self._wake = threading.Event()
+        self._dirty_since: Optional[float] = None
+        self._last_change = 0.0
+        self._ignore_until = 0.0
+        self._durations = {"count": 0, "sum": 0.0, "buckets": [0] * (len(DURATION_BUCKETS) + 1)}
 
         from Platinum.src.vault_sync import VaultSync
         self.vault_sync = VaultSync(
@@ -45,28 +75,104 @@ class SyncDaemon:
         signal.signal(signal.SIGINT, self._handle_signal)
         signal.signal(signal.SIGTERM, self._handle_signal)
 
+        mode = self.settings.SYNC_MODE
         logger.info(
             f"Sync Daemon started "
-            f"(interval={self.settings.SYNC_INTERVAL}s, "
+            f"(mode={mode}, interval={self.settings.SYNC_INTERVAL}s, "
             f"remote={self.settings.GIT_REMOTE}/{self.settings.GIT_BRANCH})"
         )
 
         try:
-            while self._running:
-                self._run_cycle()
-                # Sleep in small intervals for responsive shutdown
-                for _ in range(self.settings.SYNC_INTERVAL):
-                    if not self._running:
-                        break
-                    time.sleep(1)
+            if mode == "event":
+                self._run_event_loop()
+            else:
+                self._run_interval_loop()
         except Exception as e:
             logger.error(f"Daemon error: {e}")
         finally:
             logger.info("Sync Daemon stopped")
 
+    def _run_interval_loop(self):
+        """Sync every SYNC_INTERVAL seconds."""
+        while self._running:
+            self._run_cycle()
+            # Sleep in small intervals for responsive shutdown
+            for _ in range(self.settings.SYNC_INTERVAL):
+                if not self._running:
+                    break
+                time.sleep(1)
+
+    def _run_event_loop(self):
+        """Sync on vault changes, backing off while idle."""
+        from Platinum.src.vault_watcher import VaultWatcher
+
+        watcher = VaultWatcher(
+            Path(self.settings.VAULT_PATH) / "Platinum",
+            self.notify_change,
+            ignore=QUIET_DIRS,
+            poll_interval=self.settings.SYNC_POLL_INTERVAL,
+        )
+        watcher.start()
+        try:
+            interval = self.settings.SYNC_MIN_INTERVAL
+            next_idle = time.monotonic()
+            while self._running:
+                now = time.monotonic()
+                due = self._sync_due(now)
+                if due is not None and due <= now:
+                    self._dirty_since = None
+                    self._run_cycle(trigger="event")
+                    interval = self.settings.SYNC_MIN_INTERVAL
+                    next_idle = time.monotonic() + interval
+                    continue
+                if now >= next_idle:
+                    changed = self._run_cycle(trigger="idle")
+                    interval = self._next_interval(interval, changed)
+                    next_idle = time.monotonic() + interval
+                    continue
+                wake_at = next_idle if due is None else min(due, next_idle)
+                # Wake at least once a second for responsive shutdown
+                self._wake.wait(timeout=min(max(wake_at - now, 0.0), 1.0))
+                self._wake.clear()
+        finally:
+            watcher.stop()
+
+    def notify_change(self, rel_path: str):
+        """Record a change under Platinum/ (called from the watcher thread)."""
+        if rel_path.split("/", 1)[0] in QUIET_DIRS:
+            return
+        now = time.monotonic()
+        if now < self._ignore_until:
+            # Files written by our own pull
+            return
+        self._last_change = now
+        if self._dirty_since is None:
+            self._dirty_since = now
+        self._wake.set()
+
+    def _sync_due(self, now: float) -> Optional[float]:
+        """Return when pending changes should be synced, or None if there are none.
+
+        A burst is synced once it has been quiet for SYNC_DEBOUNCE seconds,
+        or SYNC_MAX_DELAY after its first change if it never settles.
+        """
+        if self._dirty_since is None:
+            return None
+        return min(
+            self._last_change + self.settings.SYNC_DEBOUNCE,
+            self._dirty_since + self.settings.SYNC_MAX_DELAY,
+        )
+
+    def _next_interval(self, interval: float, changed: int) -> float:
+        """Idle backoff: reset after a cycle that moved files, otherwise double."""
+        if changed:
+            return self.settings.SYNC_MIN_INTERVAL
+        return min(interval * 2, self.settings.SYNC_INTERVAL)
+
     def stop(self):
         """Stop the daemon gracefully."""
         self._running = False
+        self._wake.set()
         logger.info("Shutdown signal received")
 
     def _handle_signal(self, signum, frame):
@@ -74,13 +180,20 @@ class SyncDaemon:
         logger.info(f"Signal {signum} received, shutting down...")
         self.stop()
 
-    def _run_cycle(self):
-        """Run a single sync cycle."""
+    def _run_cycle(self, trigger: str = "interval") -> int:
+        """Run a single sync cycle. Returns the number of files pulled or pushed."""
         try:
             start = time.time()
 
-            # Pull first
-            pull_result = self.vault_sync.pull()
+            # Pull first. The files it writes would otherwise schedule another
+            # cycle, so changes are ignored during the pull and for one watcher
+            # poll after it (local edits made then are still in this push, or
+            # the next idle cycle's)
+            self._ignore_until = math.inf
+            try:
+                pull_result = self.vault_sync.pull()
+            finally:
+                self._ignore_until = time.monotonic() + self.settings.SYNC_POLL_INTERVAL
             if pull_result.success:
                 logger.info(f"Pull: {pull_result.message}")
             else:
@@ -95,21 +208,31 @@ class SyncDaemon:
 
             elapsed = time.time() - start
             files_changed = len(pull_result.files_changed) + len(push_result.files_changed)
+            self._record_duration(elapsed)
 
             logger.info(
-                f"Sync cycle complete: {files_changed} files changed ({elapsed:.1f}s)"
+                f"Sync cycle complete ({trigger}): {files_changed} files changed ({elapsed:.1f}s)"
             )
 
             # Write sync status
-            self._write_sync_status(pull_result, push_result)
+            self._write_sync_status(pull_result, push_result, trigger=trigger)
+            return files_changed
 
         except Exception as e:
             logger.error(f"Sync cycle failed: {e}")
+            return 0
+
+    def _record_duration(self, elapsed: float):
+        """Add one cycle to the cumulative duration histogram."""
+        bucket = next((i for i, b in enumerate(DURATION_BUCKETS) if elapsed <= b), len(DURATION_BUCKETS))
+        self._durations["count"] += 1
+        self._durations["sum"] += elapsed
+        self._durations["buckets"][bucket] += 1
+        self._durations["last"] = round(elapsed, 3)
 
-    def _write_sync_status(self, pull_result, push_result):
+    def _write_sync_status(self, pull_result, push_result, trigger: str = "interval"):
         """Write sync status to Platinum/Updates/sync_status.json."""
         import json
-        from pathlib import Path
 
         updates_dir = Path(self.settings.VAULT_PATH) / "Platinum" / "Updates"
         updates_dir.mkdir(parents=True, exist_ok=True)
@@ -128,6 +251,8 @@ class SyncDaemon:
                 "files_changed": len(push_result.files_changed),
             },
             "remote": f"{self.settings.GIT_REMOTE}/{self.settings.GIT_BRANCH}",
+            "trigger": trigger,
+            "durations": {**self._durations, "bounds": list(DURATION_BUCKETS)},
         }
         status_file.write_text(json.dumps(status, indent=2), encoding="utf-8")
 
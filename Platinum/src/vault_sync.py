@@ -5,6 +5,17 @@ Reusable Platinum Skill: Synchronizes vault state between Cloud and Local
 agents using git pull/push. Enforces file-type filtering to prevent
 secret leakage during sync operations.
 
+Besides secret file types, any directory named like one of SecretGuard's
+secret locations (secrets/, private/, banking/, odoo_admin/, ...) is not
+synced, wherever it sits in the vault: "Notes/private/plan.md" stays
+local. Files starting with ".env" (including ".env.example" templates)
+are never synced.
+
+A push costs a fixed number of git processes regardless of how many files
+changed: one `git status --porcelain -z`, one `git add` fed the allowed
+paths on stdin, one commit and one push. When nothing allowed changed and
+nothing is waiting to be pushed, the commit and push are skipped.
+
 Usage:
     sync = VaultSync("/path/to/vault")
     result = sync.sync()
@@ -13,21 +24,39 @@ Usage:
 
 import subprocess
 import os
+import re
 import json
 from datetime import datetime
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from pathlib import Path
 
+from Platinum.src.path_policy import PathPolicy
+from Platinum.src.secret_guard import BLOCKED_PATTERNS as SECRET_PATTERNS
+
 
-# File extensions allowed for sync (never sync secrets)
-ALLOWED_EXTENSIONS = {".md", ".json", ".txt", ".yaml", ".yml", ".toml", ".cfg", ".log"}
+# File extensions allowed for sync (never sync secrets); .zst is a sealed
+# AuditLog segment
+ALLOWED_EXTENSIONS = {".md", ".json", ".jsonl", ".zst", ".txt", ".yaml", ".yml", ".toml", ".cfg", ".log"}
 BLOCKED_PATTERNS = [
-    ".env", "*.key", "*.pem", "*.p12", "*.pfx", "*.jks",
+    ".env*", "*.key", "*.pem", "*.p12", "*.pfx", "*.jks",
     "*.secret", "*.token", "*.credentials",
     "whatsapp_session/*", "banking/*", "payment_tokens/*",
 ]
 
+# SecretGuard's secret directories (secrets/, private/, odoo_admin/, ...)
+# are never synced either, at any depth. As globs they only match a whole
+# directory name: "Notes/private/plan.md" is blocked, "myprivate/plan.md"
+# is not. Its file patterns are already covered by BLOCKED_PATTERNS.
+SECRET_DIRS = [
+    m.group(1) + "/*"
+    for m in (re.fullmatch(r"(\w+)\(/\.\*\)\?\$", p) for p in SECRET_PATTERNS) if m
+]
+SYNC_POLICY = PathPolicy(
+    globs=BLOCKED_PATTERNS + [d for d in SECRET_DIRS if d not in BLOCKED_PATTERNS],
+    allowed_extensions=ALLOWED_EXTENSIONS,
+)
+
 
 @dataclass
 class SyncResult:
@@ -39,6 +68,30 @@ class SyncResult:
     timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
 
 
+def parse_porcelain_z(output: str) -> List[Tuple[str, str, Optional[str]]]:
+    """Parse `git status --porcelain -z` output into (code, path, orig_path) tuples.
+
+    Each record is "XY <path>" terminated by NUL; rename and copy records
+    are followed by one more NUL-terminated field holding the source path.
+    """
+    entries = []
+    fields = output.split("\0")
+    i = 0
+    while i < len(fields):
+        record = fields[i]
+        i += 1
+        if len(record) < 4:
+            continue
+        status_code, path = record[:2], record[3:]
+        orig_path = None
+        if "R" in status_code or "C" in status_code:
+            if i < len(fields):
+                orig_path = fields[i]
+                i += 1
+        entries.append((status_code, path, orig_path))
+    return entries
+
+
 class VaultSync:
     """Git-based vault synchronization between agents."""
 
@@ -49,18 +102,28 @@ class VaultSync:
         self.branch = branch
         self.ssh_key = ssh_key
         self._sync_log: List[dict] = []
+        self._unpushed = False  # A commit was made but its push failed
 
-    def _run_git(self, *args) -> tuple:
-        """Run a git command and return (returncode, stdout, stderr)."""
-        cmd = ["git", "-C", str(self.vault_path)] + list(args)
-        env = os.environ.copy()
+        self._env = None
         if self.ssh_key:
-            env["GIT_SSH_COMMAND"] = f'ssh -i "{self.ssh_key}" -o StrictHostKeyChecking=no'
+            self._env = os.environ.copy()
+            self._env["GIT_SSH_COMMAND"] = f'ssh -i "{self.ssh_key}" -o StrictHostKeyChecking=no'
+
+    def _run_git(self, *args, input: Optional[str] = None, strip: bool = True) -> tuple:
+        """Run a git command and return (returncode, stdout, stderr).
+
+        Args:
+            *args: git arguments.
+            input: Optional text fed to the command's stdin.
+            strip: Strip surrounding whitespace from stdout (disable for -z output).
+        """
+        cmd = ["git", "-C", str(self.vault_path)] + list(args)
         try:
             result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=30, env=env
+                cmd, capture_output=True, text=True, timeout=30, env=self._env, input=input
             )
-            return result.returncode, result.stdout.strip(), result.stderr.strip()
+            out = result.stdout.strip() if strip else result.stdout
+            return result.returncode, out, result.stderr.strip()
         except subprocess.TimeoutExpired:
             return 1, "", "Git command timed out"
         except FileNotFoundError:
@@ -68,25 +131,7 @@ class VaultSync:
 
     def _is_allowed_file(self, filepath: str) -> bool:
         """Check if file is allowed for sync (not a secret)."""
-        path = Path(filepath)
-        ext = path.suffix.lower()
-        name = path.name.lower()
-
-        # Block known secret patterns
-        for pattern in BLOCKED_PATTERNS:
-            if "*" in pattern:
-                # Glob-style pattern
-                base = pattern.replace("*", "")
-                if name.endswith(base.lstrip("*")) or filepath.startswith(pattern.rstrip("/*")):
-                    return False
-            elif name == pattern or name.startswith(pattern):
-                return False
-
-        # Only allow known safe extensions
-        if ext and ext not in ALLOWED_EXTENSIONS:
-            return False
-
-        return True
+        return SYNC_POLICY.allows(filepath)
 
     def pull(self) -> SyncResult:
         """Pull latest vault state from remote."""
@@ -108,36 +153,59 @@ class VaultSync:
 
     def push(self, message: str = "Vault sync") -> SyncResult:
         """Stage allowed files and push to remote."""
-        # Get modified/untracked files
-        status = self.get_status()
-        allowed_files = [
-            f for f in status.get("modified", []) + status.get("untracked", [])
-            if self._is_allowed_file(f)
-        ]
-
-        if not allowed_files:
+        # Get modified/untracked files in one status call
+        allowed_files = []
+        to_stage = []
+        entries = self._status_entries()
+        decisions = SYNC_POLICY.decide(path for _, path, _ in entries)
+        for (status_code, path, orig_path), allowed in zip(entries, decisions):
+            if not allowed:
+                continue
+            allowed_files.append(path)
+            # Renames and deletions already recorded in the index have
+            # nothing left on disk to match; they are committed as staged.
+            if orig_path:
+                allowed_files.append(orig_path)
+            if status_code != "D ":
+                to_stage.append(path)
+
+        if not allowed_files and not self._unpushed:
             return SyncResult(
                 success=True, status="pushed",
                 message="No allowed files to push"
             )
 
-        # Stage only allowed files
-        for f in allowed_files:
-            self._run_git("add", f)
+        if allowed_files:
+            # Stage only allowed files, all in one git process. Literal
+            # pathspecs stop names containing '*' or '?' acting as globs.
+            if to_stage:
+                code, out, err = self._run_git(
+                    "--literal-pathspecs", "add", "--all",
+                    "--pathspec-from-file=-", "--pathspec-file-nul",
+                    input="\0".join(to_stage),
+                )
+                if code != 0:
+                    return SyncResult(
+                        success=False, status="error",
+                        message=f"Stage failed: {err}"
+                    )
 
-        # Commit
-        timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
-        commit_msg = f"{message} [{timestamp}]"
-        code, out, err = self._run_git("commit", "-m", commit_msg)
-        if code != 0 and "nothing to commit" not in err + out:
-            return SyncResult(
-                success=False, status="error",
-                message=f"Commit failed: {err}"
-            )
+            # Commit
+            timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+            commit_msg = f"{message} [{timestamp}]"
+            code, out, err = self._run_git("commit", "-m", commit_msg)
+            if code != 0 and "nothing to commit" not in err + out:
+                return SyncResult(
+                    success=False, status="error",
+                    message=f"Commit failed: {err}"
+                )
+            if code == 0:
+                self._unpushed = True
 
         # Push
         code, out, err = self._run_git("push", self.remote, self.branch)
         if code == 0:
+            self._unpushed = False
             result = SyncResult(
                 success=True, status="pushed",
                 message=f"Pushed {len(allowed_files)} files",
@@ -171,20 +239,30 @@ class VaultSync:
 
     def get_status(self) -> dict:
         """Get modified and untracked files in the vault."""
-        code, out, _ = self._run_git("status", "--porcelain")
         modified = []
         untracked = []
-        if code == 0 and out:
-            for line in out.splitlines():
-                if len(line) >= 3:
-                    status_code = line[:2].strip()
-                    filepath = line[3:].strip()
-                    if status_code == "??":
-                        untracked.append(filepath)
-                    else:
-                        modified.append(filepath)
+        for status_code, filepath, _ in self._status_entries():
+            if status_code == "??":
+                untracked.append(filepath)
+            else:
+                modified.append(filepath)
         return {"modified": modified, "untracked": untracked}
 
+    def _status_entries(self) -> List[Tuple[str, str, Optional[str]]]:
+        """Run `git status --porcelain -z` once and parse it.
+
+        Returns:
+            List of (status_code, path, orig_path) tuples. orig_path is set
+            for renames and copies. Paths are exactly as on disk: -z output
+            is never quoted, so spaces, quotes and non-ASCII names survive.
+        """
+        code, out, _ = self._run_git(
+            "status", "--porcelain", "-z", "--untracked-files=all", strip=False
+        )
+        if code != 0 or not out:
+            return []
+        return parse_porcelain_z(out)
+
     def get_conflicts(self) -> list:
         """Detect merge conflicts."""
         code, out, _ = self._run_git("diff", "--name-only", "--diff-filter=U")
@@ -230,4 +308,4 @@ class VaultSync:
 
     def validate_sync_files(self, files: List[str]) -> List[str]:
         """Filter a list of files to only those allowed for sync."""
-        return [f for f in files if self._is_allowed_file(f)]
+        return SYNC_POLICY.filter(files)
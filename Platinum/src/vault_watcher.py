@@ -0,0 +1,161 @@
+"""
+VaultWatcher - Filesystem change notifications for the Platinum vault.
+
+Uses watchdog (inotify on Linux, FSEvents/ReadDirectoryChangesW elsewhere)
+when it is installed. Without it, a polling fallback compares directory
+mtimes, which catches files being created, moved or deleted - the way
+tasks and drafts move through the vault - but not in-place edits.
+
+Callbacks receive the changed path relative to the watched root, in POSIX
+form, and run on the watcher's thread.
+
+Usage:
+    watcher = VaultWatcher(Path("/path/to/vault/Platinum"), print)
+    watcher.start()
+    ...
+    watcher.stop()
+"""
+
+import os
+import threading
+import logging
+from typing import Callable, Dict, Iterable, Optional
+from pathlib import Path
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+logger = logging.getLogger("platinum.vault_watcher")
+
+# Never reported: local-only state that must not trigger syncs
+ALWAYS_IGNORED = (".git", ".state")
+
+
+class _EventHandler(FileSystemEventHandler):
+    """Forwards watchdog events to VaultWatcher."""
+
+    def __init__(self, watcher: "VaultWatcher"):
+        super().__init__()
+        self._watcher = watcher
+
+    def on_any_event(self, event):
+        if event.event_type in ("opened", "closed_no_write"):
+            return
+        self._watcher._emit(event.src_path)
+        dest = getattr(event, "dest_path", "")
+        if dest:
+            self._watcher._emit(dest)
+
+
+class VaultWatcher:
+    """Watches a directory tree and reports changed paths to a callback."""
+
+    def __init__(
+        self,
+        root: Path,
+        on_change: Callable[[str], None],
+        ignore: Iterable[str] = (),
+        poll_interval: float = 2.0,
+        use_watchdog: Optional[bool] = None,
+    ):
+        """
+        Args:
+            root: Directory to watch recursively.
+            on_change: Called with each changed path, relative to root.
+            ignore: Top-level entries under root whose changes are not reported.
+            poll_interval: Seconds between scans for the polling fallback.
+            use_watchdog: Force (True) or disable (False) watchdog; default
+                is to use it when installed.
+        """
+        self.root = Path(root)
+        self.on_change = on_change
+        self.ignore = set(ALWAYS_IGNORED) | set(ignore)
+        self.poll_interval = poll_interval
+        self.use_watchdog = WATCHDOG_AVAILABLE if use_watchdog is None else use_watchdog
+        self._observer = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def backend(self) -> str:
+        return "watchdog" if self.use_watchdog else "polling"
+
+    def start(self) -> None:
+        """Start watching in a background thread."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._stop.clear()
+        if self.use_watchdog:
+            self._observer = Observer()
+            self._observer.schedule(_EventHandler(self), str(self.root), recursive=True)
+            self._observer.daemon = True
+            self._observer.start()
+        else:
+            self._thread = threading.Thread(
+                target=self._poll_loop, name="vault-watcher", daemon=True
+            )
+            self._thread.start()
+        logger.info(f"Watching {self.root} ({self.backend})")
+
+    def stop(self) -> None:
+        """Stop watching and wait for the background thread to exit."""
+        self._stop.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=5)
+            self._observer = None
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _relative(self, path: str) -> Optional[str]:
+        try:
+            rel = Path(path).relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+        if rel == "." or rel.split("/", 1)[0] in self.ignore:
+            return None
+        return rel
+
+    def _emit(self, path: str) -> None:
+        rel = self._relative(path)
+        if rel is None:
+            return
+        try:
+            self.on_change(rel)
+        except Exception as e:
+            logger.error(f"Change callback failed for {rel}: {e}")
+
+    def _snapshot(self) -> Dict[str, int]:
+        """Map every directory under root to its mtime."""
+        mtimes = {}
+        stack = [str(self.root)]
+        while stack:
+            current = stack.pop()
+            try:
+                mtimes[current] = os.stat(current).st_mtime_ns
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            if current == str(self.root) and entry.name in self.ignore:
+                                continue
+                            stack.append(entry.path)
+            except OSError:
+                continue
+        return mtimes
+
+    def _poll_loop(self) -> None:
+        previous = self._snapshot()
+        while not self._stop.wait(self.poll_interval):
+            current = self._snapshot()
+            for path, mtime in current.items():
+                if previous.get(path) != mtime:
+                    self._emit(path)
+            for path in previous.keys() - current.keys():
+                self._emit(path)
+            previous = current
@@ -3,6 +3,8 @@ Tests for A2A Interface.
 """
 
 import json
+import time
+import threading
 import pytest
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -10,6 +12,10 @@ from datetime import datetime, timedelta
 from Platinum.src.a2a_interface import (
     A2AMessage, A2ATransport, FileBasedTransport
 )
+from Platinum.src.a2a_log import LogTransport
+from Platinum.src.a2a_sqlite import SQLiteTransport
+from Platinum.src.a2a_benchmark import run_benchmark
+from Platinum.src import vault_watcher
 
 
 @pytest.fixture
@@ -197,3 +203,264 @@ class TestFileBasedTransport:
 
         messages = transport.receive("test")
         assert len(messages) == 0
+
+
+class TestLogTransport:
+
+    @pytest.fixture
+    def log_transport(self, tmp_path):
+        t = LogTransport(str(tmp_path))
+        yield t
+        t.close()
+
+    def _send(self, transport, n, sender="cloud", recipient="local", **kwargs):
+        msgs = [A2AMessage(sender=sender, recipient=recipient, payload={"i": i}, **kwargs)
+                for i in range(n)]
+        for m in msgs:
+            assert transport.send(m) is True
+        return msgs
+
+    def test_send_appends_to_sender_stream(self, log_transport, tmp_path):
+        self._send(log_transport, 3)
+        segment = tmp_path / "Platinum" / "Signals" / "local" / "cloud" / "seg-00000001.jsonl"
+        lines = segment.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(l)["payload"]["i"] for l in lines] == [0, 1, 2]
+
+    def test_receive_and_acknowledge(self, log_transport):
+        msgs = self._send(log_transport, 2)
+        received = log_transport.receive("local")
+        assert [m.message_id for m in received] == [m.message_id for m in msgs]
+        # Receive does not consume
+        assert len(log_transport.receive("local")) == 2
+
+        assert log_transport.acknowledge(msgs[0].message_id) is True
+        assert log_transport.acknowledge(msgs[0].message_id) is False
+        assert [m.message_id for m in log_transport.receive("local")] == [msgs[1].message_id]
+
+    def test_acknowledge_without_receive(self, log_transport):
+        msgs = self._send(log_transport, 3)
+        assert log_transport.acknowledge(msgs[1].message_id) is True
+        assert log_transport.get_pending_count("local") == 2
+        assert log_transport.acknowledge("fake-id") is False
+
+    def test_receive_many_and_ack_by_position(self, log_transport):
+        self._send(log_transport, 5)
+        records = log_transport.receive_many("local", limit=3)
+        assert [r.message.payload["i"] for r in records] == [0, 1, 2]
+        assert log_transport.ack_many("local", [r.position for r in records]) == 3
+        assert log_transport.get_pending_count("local") == 2
+
+        rest = log_transport.receive_many("local", limit=10)
+        assert [r.message.payload["i"] for r in rest] == [3, 4]
+        assert log_transport.ack("local", rest[1].position) is True
+        assert log_transport.ack("local", rest[1].position) is False
+        assert [r.message.payload["i"] for r in log_transport.receive_many("local")] == [3]
+
+    def test_pending_count_is_incremental(self, log_transport):
+        assert log_transport.get_pending_count("local") == 0
+        self._send(log_transport, 2)
+        assert log_transport.get_pending_count("local") == 2
+        self._send(log_transport, 1, sender="monitor")
+        assert log_transport.get_pending_count("local") == 3
+
+    def test_cursor_survives_restart(self, log_transport, tmp_path):
+        self._send(log_transport, 3)
+        first = log_transport.receive_many("local", limit=1)[0]
+        log_transport.ack("local", first.position)
+        log_transport.close()
+
+        reopened = LogTransport(str(tmp_path))
+        assert [r.message.payload["i"] for r in reopened.receive_many("local")] == [1, 2]
+        assert reopened.get_pending_count("local") == 2
+        reopened.close()
+
+    def test_consumed_segments_are_deleted(self, tmp_path):
+        transport = LogTransport(str(tmp_path), segment_bytes=200)
+        self._send(transport, 6)
+        stream_dir = tmp_path / "Platinum" / "Signals" / "local" / "cloud"
+        assert len(list(stream_dir.glob("seg-*.jsonl"))) > 1
+
+        records = transport.receive_many("local", limit=100)
+        assert len(records) == 6
+        transport.ack_many("local", [r.position for r in records])
+        # Only the active (last) segment is left
+        assert len(list(stream_dir.glob("seg-*.jsonl"))) == 1
+        assert transport.get_pending_count("local") == 0
+        self._send(transport, 1)
+        assert transport.get_pending_count("local") == 1
+        transport.close()
+
+    def test_partial_line_is_not_delivered(self, log_transport, tmp_path):
+        self._send(log_transport, 1)
+        segment = tmp_path / "Platinum" / "Signals" / "local" / "cloud" / "seg-00000001.jsonl"
+        with open(segment, "ab") as f:
+            f.write(b'{"sender":"cloud"')
+        assert len(log_transport.receive("local")) == 1
+        assert log_transport.get_pending_count("local") == 1
+
+    def test_expired_messages_dropped(self, log_transport):
+        old = (datetime.utcnow() - timedelta(hours=5)).isoformat()
+        self._send(log_transport, 2, timestamp=old, ttl_seconds=3600)
+        self._send(log_transport, 1)
+        assert log_transport.get_pending_count("local") == 3
+        assert log_transport.cleanup_expired() == 2
+        assert log_transport.get_pending_count("local") == 1
+        assert len(log_transport.receive("local")) == 1
+
+    def test_helpers_available(self, log_transport):
+        msg = log_transport.send_request("cloud", "local", "approve_draft", {"draft_id": "D1"})
+        assert log_transport.receive("local")[0].message_id == msg.message_id
+
+
+class TestSQLiteTransport:
+
+    @pytest.fixture
+    def sqlite_transport(self, tmp_path):
+        t = SQLiteTransport(str(tmp_path))
+        yield t
+        t.close()
+
+    def test_send_receive_acknowledge(self, sqlite_transport):
+        msg = A2AMessage(sender="cloud", recipient="local", payload={"data": "hello"})
+        assert sqlite_transport.send(msg) is True
+        received = sqlite_transport.receive("local")
+        assert [m.payload["data"] for m in received] == ["hello"]
+        assert sqlite_transport.get_pending_count("local") == 1
+        assert sqlite_transport.acknowledge(msg.message_id) is True
+        assert sqlite_transport.acknowledge(msg.message_id) is False
+        assert sqlite_transport.receive("local") == []
+
+    def test_receive_orders_by_timestamp(self, sqlite_transport):
+        now = datetime.utcnow()
+        for i in (2, 0, 1):
+            sqlite_transport.send(A2AMessage(
+                sender="a", recipient="b", payload={"i": i},
+                timestamp=(now + timedelta(seconds=i)).isoformat(),
+            ))
+        assert [m.payload["i"] for m in sqlite_transport.receive("b")] == [0, 1, 2]
+
+    def test_receive_many_ack_in_transaction(self, sqlite_transport):
+        sqlite_transport.send_many(
+            A2AMessage(sender="a", recipient="b", payload={"i": i}) for i in range(5)
+        )
+        batch = sqlite_transport.receive_many("b", limit=3, ack=True)
+        assert len(batch) == 3
+        assert sqlite_transport.get_pending_count("b") == 2
+        rest = sqlite_transport.receive_many("b", limit=10, ack=True)
+        assert {m.message_id for m in rest}.isdisjoint(m.message_id for m in batch)
+        assert sqlite_transport.get_pending_count("b") == 0
+
+    def test_expiry(self, sqlite_transport):
+        old = (datetime.utcnow() - timedelta(hours=5)).isoformat()
+        sqlite_transport.send(A2AMessage(sender="a", recipient="b", payload={},
+                                         timestamp=old, ttl_seconds=3600))
+        sqlite_transport.send(A2AMessage(sender="a", recipient="b", payload={}))
+        assert len(sqlite_transport.receive("b")) == 1
+        assert sqlite_transport.cleanup_expired() == 1
+        assert sqlite_transport.get_pending_count("b") == 1
+
+    def test_shared_database_between_instances(self, tmp_path):
+        sender = SQLiteTransport(str(tmp_path))
+        receiver = SQLiteTransport(str(tmp_path))
+        sender.send_request("cloud", "local", "approve_draft")
+        assert receiver.receive("local")[0].payload["action"] == "approve_draft"
+        sender.close()
+        receiver.close()
+
+
+@pytest.fixture(params=["file", "log", "sqlite"])
+def transport_pair(request, tmp_path):
+    """(sender, receiver) instances of one transport sharing a vault."""
+    cls = {"file": FileBasedTransport, "log": LogTransport, "sqlite": SQLiteTransport}[request.param]
+    sender, receiver = cls(str(tmp_path)), cls(str(tmp_path))
+    yield sender, receiver
+    for t in (sender, receiver):
+        t.close()
+
+
+def _later(delay, func, *args):
+    thread = threading.Timer(delay, func, args)
+    thread.start()
+    return thread
+
+
+class TestBlockingReceive:
+
+    @pytest.fixture(params=["watchdog", "polling"])
+    def pair(self, request, transport_pair, monkeypatch):
+        if request.param == "watchdog" and not vault_watcher.WATCHDOG_AVAILABLE:
+            pytest.skip("watchdog not installed")
+        if request.param == "polling":
+            monkeypatch.setattr(vault_watcher, "WATCHDOG_AVAILABLE", False)
+        return transport_pair
+
+    def test_returns_when_message_arrives(self, pair):
+        sender, receiver = pair
+        receiver.receive("local")  # creates the inbox
+        _later(0.2, sender.send_notification, "cloud", "local", "ping")
+        start = time.monotonic()
+        messages = receiver.receive("local", timeout=5)
+        assert [m.payload["event"] for m in messages] == ["ping"]
+        assert time.monotonic() - start < 2
+
+    def test_times_out_empty(self, pair):
+        _, receiver = pair
+        start = time.monotonic()
+        assert receiver.receive("local", timeout=0.3) == []
+        assert 0.25 <= time.monotonic() - start < 2
+
+    def test_request_and_wait(self, pair):
+        sender, receiver = pair
+
+        def respond():
+            for msg in receiver.receive("local", timeout=5):
+                receiver.acknowledge(msg.message_id)
+                receiver.send_response("local", "cloud", msg.message_id, "ok", {"n": 1})
+
+        responder = threading.Thread(target=respond)
+        responder.start()
+        start = time.monotonic()
+        reply = sender.request_and_wait("cloud", "local", "approve_draft", timeout=5)
+        responder.join()
+        assert reply is not None and reply.payload == {"status": "ok", "data": {"n": 1}}
+        assert time.monotonic() - start < 2
+        assert sender.get_pending_count("cloud") == 0
+
+    def test_request_and_wait_times_out(self, pair):
+        sender, _ = pair
+        assert sender.request_and_wait("cloud", "local", "approve_draft", timeout=0.2) is None
+
+    def test_close_stops_watchers(self, pair):
+        _, receiver = pair
+        before = set(threading.enumerate())
+        receiver.receive("local", timeout=0.1)
+        receiver.close()
+        assert receiver._watchers == {}
+        time.sleep(0.1)
+        assert [t for t in threading.enumerate() if t not in before] == []
+
+    def test_subclass_without_super_init(self, tmp_path):
+        class LegacyTransport(FileBasedTransport):
+            def __init__(self, vault_path):
+                self.signals_dir = Path(vault_path) / "Signals"
+
+        receiver = LegacyTransport(str(tmp_path))
+        assert receiver.receive("local", timeout=0.1) == []
+        receiver.close()
+        assert receiver._watchers == {}
+
+
+def test_wait_for_response_behind_backlog(transport_pair):
+    sender, receiver = transport_pair
+    for i in range(1100):
+        receiver.send_notification("local", "cloud", "tick", {"i": i})
+    receiver.send_response("local", "cloud", "req-1", "ok")
+    reply = sender.wait_for_response("cloud", "req-1", timeout=1)
+    assert reply is not None and reply.payload["status"] == "ok"
+    assert sender.get_pending_count("cloud") == 1100
+
+
+def test_transport_benchmark_runs():
+    results = run_benchmark(messages=50, batch=20)
+    assert set(results) == {"file", "log", "sqlite"}
+    assert all(r["received"] == 50 for r in results.values())
@@ -64,7 +64,7 @@ class TestDemoWorkflow:
     def test_demo_done_directory_populated(self, demo_vault):
         run_demo(str(demo_vault))
         done_dir = demo_vault / "Platinum" / "Done"
-        done_files = list(done_dir.glob("DRAFT-*.json"))
+        done_files = list(done_dir.rglob("DRAFT-*.json"))
         assert len(done_files) >= 1
 
     def test_demo_step_descriptions(self, demo_vault):
@@ -3,14 +3,19 @@ Tests for HealthMonitor.
 """
 
 import json
+import threading
+import time
 import pytest
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from Platinum.src.health_monitor import HealthMonitor, HealthCheck, HealthStatus
+from Platinum.src.health_monitor import (
+    HealthMonitor, HealthCheck, HealthStatus, HealthSnapshotCache,
+)
 from Platinum.src.health_monitor_daemon import HealthMonitorDaemon
+from Platinum.src.health_incidents import IncidentTracker
 
 
 @pytest.fixture
@@ -24,6 +29,11 @@ def mock_settings(tmp_path):
         HEALTH_API_URL="http://localhost:8000",
         ODOO_URL="http://localhost:8069",
         HEARTBEAT_INTERVAL=30,
+        HEALTH_CYCLE_TIMEOUT=20.0,
+        HEALTH_MAX_WORKERS=4,
+        HEALTH_SNAPSHOT_MAX_AGE=180.0,
+        HEALTH_RENOTIFY_BASE=900,
+        HEALTH_RENOTIFY_MAX=86400,
         is_local=True,
         is_cloud=False,
         has_smtp=False,
@@ -43,6 +53,11 @@ def mock_settings_no_cloud(tmp_path):
         HEALTH_API_URL="http://localhost:8000",
         ODOO_URL="",
         HEARTBEAT_INTERVAL=30,
+        HEALTH_CYCLE_TIMEOUT=20.0,
+        HEALTH_MAX_WORKERS=4,
+        HEALTH_SNAPSHOT_MAX_AGE=180.0,
+        HEALTH_RENOTIFY_BASE=900,
+        HEALTH_RENOTIFY_MAX=86400,
         is_local=True,
         is_cloud=False,
         has_smtp=False,
@@ -239,6 +254,219 @@ class TestHealthMonitor:
         monitor._handle_alerts(["Test"])
         assert len(monitor.get_alert_history()) == 1
 
+    @patch.object(HealthMonitor, "check_api_health")
+    @patch.object(HealthMonitor, "check_cloud_vm")
+    @patch.object(HealthMonitor, "check_odoo")
+    @patch.object(HealthMonitor, "check_agent_heartbeats")
+    def test_run_checks_without_alert_handling(self, mock_hb, mock_odoo, mock_cloud, mock_api,
+                                               monitor, tmp_path):
+        for m in (mock_api, mock_cloud, mock_odoo, mock_hb):
+            m.return_value = HealthCheck(name="x", target="x", healthy=False, message="down")
+        status = monitor.run_checks(handle_alerts=False)
+        assert len(status.alerts) == 4
+        assert not (tmp_path / "Platinum" / "Needs_Action" / "monitoring").exists()
+
+
+class TestIncidents:
+
+    @staticmethod
+    def _check(name, healthy, message="down"):
+        return HealthCheck(name=name, target="x", healthy=healthy, message=message)
+
+    def test_tracker_groups_repeats(self, tmp_path):
+        tracker = IncidentTracker(tmp_path / "inc.db", renotify_base=100, renotify_max=1000)
+        events = tracker.observe([self._check("odoo", False)], now=0)
+        assert [e.kind for e in events] == ["opened"]
+        events = tracker.observe([self._check("odoo", False, "still down")], now=60)
+        assert [e.kind for e in events] == ["repeated"]
+        open_ = tracker.open_incidents()
+        assert len(open_) == 1
+        assert open_[0]["count"] == 2
+        assert open_[0]["message"] == "still down"
+
+    def test_tracker_exponential_renotify(self, tmp_path):
+        tracker = IncidentTracker(tmp_path / "inc.db", renotify_base=100, renotify_max=300)
+        tracker.observe([self._check("odoo", False)], now=0)
+        renotified = [
+            t for t in range(10, 1500, 10)
+            if tracker.observe([self._check("odoo", False)], now=t)[0].kind == "renotify"
+        ]
+        # 100s after opening, then 200s later, then capped at 300s
+        assert renotified[:4] == [100, 300, 600, 900]
+
+    def test_tracker_resolve(self, tmp_path):
+        tracker = IncidentTracker(tmp_path / "inc.db")
+        tracker.observe([self._check("odoo", False)], now=0)
+        events = tracker.observe([self._check("odoo", True)], now=120)
+        assert [e.kind for e in events] == ["resolved"]
+        assert events[0].incident["duration_seconds"] == 120
+        assert tracker.open_incidents() == []
+        # Healthy checks without an incident produce nothing
+        assert tracker.observe([self._check("odoo", True)], now=180) == []
+
+    def test_tracker_state_survives_restart(self, tmp_path):
+        IncidentTracker(tmp_path / "inc.db").observe([self._check("odoo", False)], now=0)
+        events = IncidentTracker(tmp_path / "inc.db").observe([self._check("odoo", False)], now=60)
+        assert events[0].kind == "repeated"
+
+    def test_run_checks_opens_one_task_per_incident(self, monitor, tmp_path):
+        for name in list(monitor._checks):
+            monitor.unregister_check(name)
+        state = {"healthy": False}
+        monitor.register_check(
+            "odoo", lambda: self._check("odoo", state["healthy"]), timeout=5
+        )
+        monitoring_dir = tmp_path / "Platinum" / "Needs_Action" / "monitoring"
+
+        for _ in range(5):
+            status = monitor.run_checks()
+        assert len(list(monitoring_dir.glob("HEALTH-*.json"))) == 1
+        assert status.incidents[0]["count"] == 5
+        assert len(status.alerts) == 1
+
+        state["healthy"] = True
+        with patch.object(monitor, "_notify") as notify:
+            status = monitor.run_checks()
+        assert status.incidents == []
+        assert "RESOLVED" in notify.call_args[0][0][0]
+        assert len(list(monitoring_dir.glob("HEALTH-*.json"))) == 1
+        assert monitor.get_alert_history()[-1]["status"] == "RESOLVED"
+
+
+class TestHealthSnapshotCache:
+
+    def _write_snapshot(self, tmp_path, age_seconds=0, healthy=True):
+        updates_dir = tmp_path / "Platinum" / "Updates"
+        updates_dir.mkdir(parents=True, exist_ok=True)
+        path = updates_dir / "health_status.json"
+        path.write_text(json.dumps({
+            "overall_healthy": healthy,
+            "checks": [],
+            "alerts": [],
+            "timestamp": (datetime.utcnow() - timedelta(seconds=age_seconds)).isoformat(),
+        }), encoding="utf-8")
+        return path
+
+    def test_serves_daemon_snapshot_without_probing(self, mock_settings, tmp_path):
+        self._write_snapshot(tmp_path, healthy=False)
+        cache = HealthSnapshotCache(mock_settings)
+        with patch.object(HealthMonitor, "run_checks") as run_checks:
+            data = cache.get()
+            data = cache.get()
+        run_checks.assert_not_called()
+        assert data["overall_healthy"] is False
+        assert data["source"] == "daemon"
+        assert data["stale"] is False
+
+    def test_file_reread_only_when_changed(self, mock_settings, tmp_path):
+        self._write_snapshot(tmp_path)
+        cache = HealthSnapshotCache(mock_settings)
+        cache.get()
+        with patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+            cache.get()
+
+    def test_stale_snapshot_refreshes_once(self, mock_settings, tmp_path):
+        self._write_snapshot(tmp_path, age_seconds=600)
+        cache = HealthSnapshotCache(mock_settings)
+        calls = []
+
+        def slow_checks(self, handle_alerts=True):
+            calls.append(handle_alerts)
+            time.sleep(0.2)
+            return HealthStatus(overall_healthy=True, checks=[])
+
+        with patch.object(HealthMonitor, "run_checks", slow_checks):
+            results = []
+            threads = [threading.Thread(target=lambda: results.append(cache.get()))
+                       for _ in range(5)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            # Callers got the stale snapshot immediately
+            assert all(r["stale"] for r in results)
+            in_flight = cache._refresh_done
+            if in_flight is not None:
+                in_flight.wait(2)
+
+        assert calls == [False]
+        data = cache.get()
+        assert data["stale"] is False
+        assert data["source"] == "api"
+        assert not (tmp_path / "Platinum" / "Needs_Action" / "monitoring").exists()
+
+    def test_first_call_waits_for_refresh(self, mock_settings):
+        cache = HealthSnapshotCache(mock_settings)
+        with patch.object(HealthMonitor, "run_checks",
+                          return_value=HealthStatus(overall_healthy=True, checks=[])):
+            data = cache.get(wait=2)
+        assert data["overall_healthy"] is True
+        assert data["source"] == "api"
+
+
+class TestHealthCheckRegistry:
+
+    @staticmethod
+    def _slow(name, seconds, healthy=True):
+        def check():
+            time.sleep(seconds)
+            return HealthCheck(name=name, target="x", healthy=healthy, message="ok")
+        return check
+
+    def _only(self, monitor, **checks):
+        for name in list(monitor._checks):
+            monitor.unregister_check(name)
+        for name, (func, timeout) in checks.items():
+            monitor.register_check(name, func, timeout=timeout)
+
+    def test_default_checks_registered(self, monitor):
+        assert list(monitor._checks) == ["api_health", "cloud_vm", "odoo", "agent_heartbeats"]
+
+    def test_register_custom_check(self, monitor):
+        self._only(monitor, disk=(self._slow("disk", 0), 5))
+        status = monitor.run_checks()
+        assert [c.name for c in status.checks] == ["disk"]
+        assert status.overall_healthy is True
+
+    def test_checks_run_concurrently(self, monitor):
+        self._only(
+            monitor,
+            a=(self._slow("a", 0.3), 5),
+            b=(self._slow("b", 0.3), 5),
+            c=(self._slow("c", 0.3), 5),
+        )
+        start = time.monotonic()
+        status = monitor.run_checks()
+        assert time.monotonic() - start < 0.6
+        assert [c.name for c in status.checks] == ["a", "b", "c"]
+
+    def test_per_check_deadline(self, monitor):
+        self._only(monitor, fast=(self._slow("fast", 0), 5), hung=(self._slow("hung", 2), 0.2))
+        start = time.monotonic()
+        status = monitor.run_checks()
+        assert time.monotonic() - start < 1.0
+        fast, hung = status.checks
+        assert fast.healthy is True
+        assert hung.healthy is False
+        assert "timed out" in hung.message
+
+    def test_cycle_deadline(self, monitor, mock_settings):
+        mock_settings.HEALTH_CYCLE_TIMEOUT = 0.2
+        self._only(monitor, slow=(self._slow("slow", 2), 30))
+        start = time.monotonic()
+        status = monitor.run_checks()
+        assert time.monotonic() - start < 1.0
+        assert status.checks[0].healthy is False
+        assert "0.2s" in status.checks[0].message
+
+    def test_check_exception_is_unhealthy(self, monitor):
+        def broken():
+            raise RuntimeError("boom")
+        self._only(monitor, broken=(broken, 5))
+        status = monitor.run_checks()
+        assert status.checks[0].healthy is False
+        assert "boom" in status.checks[0].message
+
 
 class TestHealthMonitorDaemon:
 
@@ -7,13 +7,16 @@ Tests:
 - ClaimManager: claim, release, double-claim prevention
 - AgentHeartbeat: beat, is_alive, timeout detection
 - SecretGuard: cloud blocks secrets, local allows all
+- AuditLog: segment rotation, compression, indexed queries
 """
 
 import json
 import time
 import sys
+import shutil
+import subprocess
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, date, timezone
 
 import pytest
 
@@ -21,11 +24,13 @@ import pytest
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from Platinum.src.vault_sync import VaultSync, ALLOWED_EXTENSIONS
+from Platinum.src.vault_sync import VaultSync, ALLOWED_EXTENSIONS, parse_porcelain_z
+from Platinum.src.path_policy import PathPolicy
 from Platinum.src.draft_manager import DraftManager, Draft
 from Platinum.src.claim_manager import ClaimManager
 from Platinum.src.agent_heartbeat import AgentHeartbeat
 from Platinum.src.secret_guard import SecretGuard
+from Platinum.src.audit_log import AuditLog, AuditLogHandler, ZSTD_AVAILABLE
 
 
 # ========== FIXTURES ==========
@@ -53,6 +58,10 @@ class TestVaultSync:
         sync = VaultSync(str(vault_dir))
         assert sync._is_allowed_file("README.md")
 
+    def test_allowed_file_jsonl(self, vault_dir):
+        sync = VaultSync(str(vault_dir))
+        assert sync._is_allowed_file("Platinum/Done/2026/10/17.jsonl")
+
     def test_allowed_file_json(self, vault_dir):
         sync = VaultSync(str(vault_dir))
         assert sync._is_allowed_file("config.json")
@@ -90,6 +99,130 @@ class TestVaultSync:
         assert sync.get_sync_log() == []
 
 
+    def test_parse_porcelain_z(self):
+        out = ' M a b.md\0?? "quoted".json\0R  new.md\0old.md\0 D gone.txt\0'
+        assert parse_porcelain_z(out) == [
+            (" M", "a b.md", None),
+            ("??", '"quoted".json', None),
+            ("R ", "new.md", "old.md"),
+            (" D", "gone.txt", None),
+        ]
+
+
+class TestPathPolicy:
+    def test_glob_rules(self):
+        policy = PathPolicy(globs=[".env*", "*.key", "banking/*"])
+        assert policy.decide([
+            ".env", "sub/.env.local", "notes.env.md", "a/vault.KEY", "k.key/x.md",
+            "banking/x.md", "a/banking/b/c.md", "mybanking/x.md", "readme.md",
+        ]) == [False, False, True, False, True, False, False, True, True]
+
+    def test_extension_allow_list(self):
+        policy = PathPolicy(allowed_extensions={".md"})
+        assert policy.decide(["a.md", "a.py", ".hidden", "dir.py/README", "A.MD"]) == [
+            True, False, True, True, True,
+        ]
+
+    def test_batch_matches_single(self):
+        from Platinum.src.path_policy_benchmark import synthetic_paths
+        from Platinum.src.vault_sync import SYNC_POLICY
+        paths = synthetic_paths(2000, secret_ratio=0.2) + ["a\nb.key", "x.tar.gz", ""]
+        assert SYNC_POLICY.decide(paths) == [SYNC_POLICY.allows(p) for p in paths]
+
+    def test_batch_matches_single_non_ascii(self):
+        from Platinum.src.vault_sync import SYNC_POLICY
+        # "İ".lower() is two characters, which shifts every later offset
+        paths = [
+            "Platinum/Needs_Action/email/" + "İ" * 12 + ".md", "Platinum/secrets/api.md",
+            "Platinum/.env", "Platinum/x.md", "Platinum/y.md", "Ünïcødé/ß/ǅ.key", "Ωmega/vault.KEY",
+        ]
+        assert SYNC_POLICY.decide(paths) == [SYNC_POLICY.allows(p) for p in paths]
+        assert SYNC_POLICY.decide(paths)[2:5] == [False, True, True]
+
+    def test_sync_blocks_secret_guard_patterns(self, vault_dir):
+        sync = VaultSync(str(vault_dir))
+        assert not sync._is_allowed_file("secrets/api.md")
+        assert not sync._is_allowed_file("Notes/private/plan.md")
+        assert not sync._is_allowed_file("a/odoo_admin/pw.txt")
+        assert not sync._is_allowed_file(".env.example")
+        # Only whole directory names are secret locations
+        assert sync._is_allowed_file("Notes/myprivate/plan.md")
+        assert sync._is_allowed_file("Notes/private.md")
+        assert sync._is_allowed_file("Notes/release.env.md")
+        assert sync.validate_sync_files(["a.md", ".env.prod", "odoo_admin/pw.txt"]) == ["a.md"]
+
+    def test_benchmark_runs(self):
+        from Platinum.src.path_policy_benchmark import run_benchmark
+        result = run_benchmark(1000)
+        assert result["paths"] == 1000
+        assert 0 < result["allowed"] < 1000
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestVaultSyncGit:
+    @pytest.fixture
+    def repo(self, tmp_path):
+        def git(*args, cwd):
+            subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+        remote = tmp_path / "remote.git"
+        work = tmp_path / "work"
+        git("init", "--bare", "-b", "main", str(remote), cwd=tmp_path)
+        git("init", "-b", "main", str(work), cwd=tmp_path)
+        git("config", "user.email", "test@example.com", cwd=work)
+        git("config", "user.name", "Test", cwd=work)
+        git("remote", "add", "origin", str(remote), cwd=work)
+        (work / "README.md").write_text("init")
+        git("add", "README.md", cwd=work)
+        git("commit", "-m", "init", cwd=work)
+        git("push", "origin", "main", cwd=work)
+        return work
+
+    def _log(self, repo):
+        return subprocess.run(
+            ["git", "log", "--format=%s"], cwd=repo, capture_output=True, text=True
+        ).stdout.splitlines()
+
+    def test_push_stages_only_allowed_files(self, repo):
+        tasks = repo / "Platinum" / "Needs_Action" / "email"
+        tasks.mkdir(parents=True)
+        (tasks / "task one.json").write_text("{}")
+        (tasks / "t\u00e9st.md").write_text("x")
+        (repo / "Platinum" / "vault.key").write_text("secret")
+        (repo / "README.md").write_text("changed")
+
+        result = VaultSync(str(repo)).push()
+        assert result.success
+        assert sorted(result.files_changed) == [
+            "Platinum/Needs_Action/email/task one.json",
+            "Platinum/Needs_Action/email/t\u00e9st.md",
+            "README.md",
+        ]
+        committed = subprocess.run(
+            ["git", "show", "--name-only", "--format=", "-z", "HEAD"],
+            cwd=repo, capture_output=True, text=True,
+        ).stdout.split("\0")
+        assert "Platinum/vault.key" not in committed
+        assert "Platinum/Needs_Action/email/task one.json" in committed
+
+    def test_push_skips_when_nothing_changed(self, repo):
+        sync = VaultSync(str(repo))
+        (repo / "notes.md").write_text("x")
+        sync.push()
+        commits = len(self._log(repo))
+        result = sync.push()
+        assert result.message == "No allowed files to push"
+        assert len(self._log(repo)) == commits
+
+    def test_push_records_rename_and_delete(self, repo):
+        sync = VaultSync(str(repo))
+        subprocess.run(["git", "mv", "README.md", "MOVED.md"], cwd=repo, check=True)
+        result = sync.push()
+        assert result.success
+        assert set(result.files_changed) == {"MOVED.md", "README.md"}
+        assert sync.get_status() == {"modified": [], "untracked": []}
+
+
 # ========== DraftManager Tests ==========
 
 class TestDraftManager:
@@ -155,6 +288,121 @@ class TestDraftManager:
         assert trail[1]["action"] == "submitted_for_approval"
         assert trail[2]["action"] == "approved"
 
+    def test_find_draft_after_external_move(self, vault_dir):
+        dm = DraftManager(str(vault_dir))
+        draft = dm.create_draft("email", "Moved", "Body", "cloud")
+        # Simulate the other agent moving the draft (arrives via git pull)
+        src = vault_dir / "Platinum" / "Plans" / "email" / f"{draft.draft_id}.json"
+        dest = vault_dir / "Platinum" / "Pending_Approval" / "email" / src.name
+        src.rename(dest)
+        assert dm._find_draft_file(draft.draft_id) == dest
+
+    def test_find_draft_created_elsewhere(self, vault_dir):
+        dm = DraftManager(str(vault_dir))
+        assert dm.get_draft("DRAFT-REMOTE01") is None
+        other = Draft(draft_id="DRAFT-REMOTE01", domain="email", title="Remote",
+                      body="B", status="pending_approval", author="cloud")
+        path = vault_dir / "Platinum" / "Pending_Approval" / "email" / "DRAFT-REMOTE01.json"
+        path.write_text(other.to_json(), encoding="utf-8")
+        assert dm.get_draft("DRAFT-REMOTE01").title == "Remote"
+
+    def test_draft_index_persists(self, vault_dir):
+        draft = DraftManager(str(vault_dir)).create_draft("email", "Keep", "Body", "cloud")
+        dm = DraftManager(str(vault_dir))
+        dm.submit_for_approval(draft.draft_id)
+        dm.approve(draft.draft_id, "local")
+        fresh = DraftManager(str(vault_dir))
+        assert fresh.get_draft(draft.draft_id).status == "approved"
+        assert fresh.rebuild_index() == 1
+
+    def test_approve_files_into_date_partition(self, vault_dir):
+        dm = DraftManager(str(vault_dir))
+        draft = dm.create_draft("email", "Dated", "Body", "cloud")
+        dm.submit_for_approval(draft.draft_id)
+        dm.approve(draft.draft_id, "local")
+        day_dir = dm.done_archive.day_dir()
+        assert (day_dir / f"{draft.draft_id}.json").exists()
+        assert day_dir.relative_to(vault_dir / "Platinum" / "Done").parts == (
+            f"{datetime.utcnow():%Y}", f"{datetime.utcnow():%m}", f"{datetime.utcnow():%d}",
+        )
+
+    def test_compact_done(self, vault_dir):
+        dm = DraftManager(str(vault_dir))
+        ids = []
+        for title in ("A", "B"):
+            draft = dm.create_draft("email", title, "Body", "cloud")
+            dm.submit_for_approval(draft.draft_id)
+            dm.approve(draft.draft_id, "local")
+            ids.append(draft.draft_id)
+
+        tomorrow = date.today() + timedelta(days=2)
+        assert dm.compact_done(before=tomorrow) == 2
+        day_dir = dm.done_archive.day_dir()
+        assert not day_dir.exists()
+        assert day_dir.with_name(day_dir.name + ".jsonl").exists()
+
+        # Still retrievable, from this and from a fresh manager
+        assert dm.get_draft(ids[0]).title == "A"
+        fresh = DraftManager(str(vault_dir))
+        assert fresh.get_draft(ids[1]).status == "approved"
+        assert len(fresh.get_audit_trail(ids[1])) == 3
+        # Archived drafts are read-only
+        assert fresh.approve(ids[0], "local") is None
+
+    def test_compact_done_merges_late_arrivals(self, vault_dir):
+        dm = DraftManager(str(vault_dir))
+        day = date(2026, 1, 5)
+        day_dir = dm.done_archive.day_dir(day)
+        day_dir.mkdir(parents=True)
+        (day_dir / "DRAFT-OLD00001.json").write_text(
+            Draft("DRAFT-OLD00001", "email", "Old", "B", "approved", "cloud").to_json())
+        assert dm.compact_done() == 1
+        day_dir.mkdir()
+        (day_dir / "DRAFT-OLD00002.json").write_text(
+            Draft("DRAFT-OLD00002", "email", "Late", "B", "approved", "cloud").to_json())
+        assert dm.compact_done() == 1
+        assert dm.get_draft("DRAFT-OLD00001").title == "Old"
+        assert dm.get_draft("DRAFT-OLD00002").title == "Late"
+
+    def test_recompacted_day_moves_earlier_drafts(self, vault_dir):
+        dm = DraftManager(str(vault_dir))
+        day_dir = dm.done_archive.day_dir(date(2026, 1, 5))
+        day_dir.mkdir(parents=True)
+        (day_dir / "DRAFT-BBBB.json").write_text(
+            Draft("DRAFT-BBBB", "email", "Bee", "B", "approved", "cloud").to_json())
+        assert dm.compact_done() == 1
+        assert dm.get_draft("DRAFT-BBBB").title == "Bee"
+
+        # DRAFT-AAAA sorts first, so DRAFT-BBBB's offset in the segment moves
+        day_dir.mkdir()
+        (day_dir / "DRAFT-AAAA.json").write_text(
+            Draft("DRAFT-AAAA", "email", "A longer title", "B", "approved", "cloud").to_json())
+        # Compacted by another process (or pulled), so this index is not told
+        from Platinum.src.done_archive import DoneArchive
+        assert DoneArchive(str(vault_dir / "Platinum")).compact() == 1
+        assert dm.get_draft("DRAFT-BBBB").title == "Bee"
+        assert dm.get_draft("DRAFT-AAAA").title == "A longer title"
+        assert DraftManager(str(vault_dir)).get_draft("DRAFT-BBBB").title == "Bee"
+
+    def test_index_counts_archived_drafts(self, vault_dir):
+        from Platinum.src.draft_index import DraftIndex
+        dm = DraftManager(str(vault_dir))
+        day_dir = dm.done_archive.day_dir(date(2026, 1, 5))
+        day_dir.mkdir(parents=True)
+        for draft_id in ("DRAFT-AAAA", "DRAFT-BBBB"):
+            (day_dir / f"{draft_id}.json").write_text(
+                Draft(draft_id, "email", "T", "B", "approved", "cloud").to_json())
+        assert dm.compact_done() == 2
+        today = dm.done_archive.day_dir()
+        today.mkdir(parents=True, exist_ok=True)
+        (today / "DRAFT-CCCC.json").write_text(
+            Draft("DRAFT-CCCC", "email", "T", "B", "approved", "cloud").to_json())
+        index = DraftIndex(vault_dir / "Platinum")
+        assert index.count("Done") == 3
+        (today / "DRAFT-CCCC.json").unlink()
+        assert index.count("Done") == 2
+        index.close()
+
     def test_list_pending_all_domains(self, vault_dir):
         dm = DraftManager(str(vault_dir))
         dm.create_draft("email", "E1", "B", "cloud")
@@ -231,6 +479,135 @@ class TestClaimManager:
         cm = ClaimManager(str(vault_dir))
         assert cm.get_owner("NONEXIST.json") is None
 
+    def test_list_available_limit_sorted(self, vault_dir):
+        cm = ClaimManager(str(vault_dir))
+        for task_id in ("T003", "T001", "T002"):
+            self._create_task_file(vault_dir, "email", task_id)
+        assert cm.list_available("email", limit=2) == [
+            "Needs_Action/email/T001.json", "Needs_Action/email/T002.json",
+        ]
+
+    def test_index_sees_external_changes(self, vault_dir):
+        cm = ClaimManager(str(vault_dir))
+        assert cm.list_available("email") == []
+        # A file written behind the manager's back (API, git pull) shows up
+        self._create_task_file(vault_dir, "email", "T001")
+        assert cm.list_available("email") == ["Needs_Action/email/T001.json"]
+        # ...and so does an external claim
+        src = vault_dir / "Platinum" / "Needs_Action" / "email" / "T001.json"
+        src.rename(vault_dir / "Platinum" / "In_Progress" / "local" / "T001.json")
+        assert cm.list_available("email") == []
+        assert cm.get_owner("T001.json") == "local"
+
+    def test_index_persists_across_instances(self, vault_dir):
+        rel = self._create_task_file(vault_dir, "email", "T001")
+        ClaimManager(str(vault_dir)).claim(rel, "cloud")
+        assert ClaimManager(str(vault_dir)).get_owner("T001.json") == "cloud"
+
+    def test_claim_batch(self, vault_dir):
+        cm = ClaimManager(str(vault_dir))
+        for task_id in ("T001", "T002", "T003"):
+            self._create_task_file(vault_dir, "email", task_id)
+        result = cm.claim_batch("email", "cloud", max_n=2)
+        assert [t.source_file for t in result.claimed] == [
+            "Needs_Action/email/T001.json", "Needs_Action/email/T002.json",
+        ]
+        assert result.failed == {}
+        task = result.claimed[0]
+        assert task.task_file == "In_Progress/cloud/T001.json"
+        assert task.data["owner"] == "cloud"
+        assert task.data["status"] == "claimed"
+        # Returned dict matches what was written to disk
+        on_disk = json.loads((vault_dir / "Platinum" / task.task_file).read_text())
+        assert on_disk == task.data
+        assert cm.list_available("email") == ["Needs_Action/email/T003.json"]
+        assert sorted(cm.list_claimed_by("cloud")) == ["T001.json", "T002.json"]
+
+    def test_claim_batch_reports_failures(self, vault_dir):
+        cm = ClaimManager(str(vault_dir))
+        self._create_task_file(vault_dir, "email", "T001")
+        self._create_task_file(vault_dir, "email", "T002")
+        # T002 already sits in the agent's In_Progress/
+        (vault_dir / "Platinum" / "In_Progress" / "cloud" / "T002.json").write_text("{}")
+        result = cm.claim_batch(
+            "email", "cloud", accept=lambda f: not f.endswith("T001.json")
+        )
+        assert result.claimed == []
+        assert result.failed == {
+            "Needs_Action/email/T001.json": "rejected",
+            "Needs_Action/email/T002.json": "already claimed",
+        }
+
+    def test_claim_batch_skips_past_rejected_tasks(self, vault_dir):
+        cm = ClaimManager(str(vault_dir))
+        for task_id in ("T001", "T002", "T003", "T004", "T005"):
+            self._create_task_file(vault_dir, "email", task_id)
+        (vault_dir / "Platinum" / "In_Progress" / "cloud" / "T003.json").write_text("{}")
+        result = cm.claim_batch(
+            "email", "cloud", max_n=2, accept=lambda f: not f.endswith(("T001.json", "T002.json"))
+        )
+        assert [t.source_file for t in result.claimed] == [
+            "Needs_Action/email/T004.json", "Needs_Action/email/T005.json",
+        ]
+        assert set(result.failed) == {
+            "Needs_Action/email/T001.json", "Needs_Action/email/T002.json",
+            "Needs_Action/email/T003.json",
+        }
+
+    def test_claim_batch_keeps_unparsable_content(self, vault_dir):
+        cm = ClaimManager(str(vault_dir))
+        task = vault_dir / "Platinum" / "Needs_Action" / "email" / "T001.json"
+        task.write_text("not json: keep me", encoding="utf-8")
+        result = cm.claim_batch("email", "cloud")
+        assert [t.task_file for t in result.claimed] == ["In_Progress/cloud/T001.json"]
+        assert result.claimed[0].data["title"] == "T001.json"
+        claimed = vault_dir / "Platinum" / "In_Progress" / "cloud" / "T001.json"
+        assert claimed.read_text(encoding="utf-8") == "not json: keep me"
+
+    def test_task_written_during_batch_stays_indexed(self, vault_dir):
+        cm = ClaimManager(str(vault_dir))
+        for task_id in ("T001", "T002"):
+            self._create_task_file(vault_dir, "email", task_id)
+
+        def accept(task_file):
+            # Another process drops a task in while the batch is moving files
+            if task_file.endswith("T002.json"):
+                self._create_task_file(vault_dir, "email", "T100")
+            return True
+
+        result = cm.claim_batch("email", "cloud", max_n=2, accept=accept)
+        assert len(result.claimed) == 2
+        assert cm.list_available("email") == ["Needs_Action/email/T100.json"]
+
+    def test_claim_batch_requeues_on_metadata_write_failure(self, vault_dir, monkeypatch):
+        cm = ClaimManager(str(vault_dir))
+        rel = self._create_task_file(vault_dir, "email", "T001")
+        original = (vault_dir / "Platinum" / rel).read_text(encoding="utf-8")
+        real_write = Path.write_text
+
+        def failing_write(path, *args, **kwargs):
+            if "In_Progress" in path.parts:
+                raise OSError("disk full")
+            return real_write(path, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "write_text", failing_write)
+        result = cm.claim_batch("email", "cloud")
+        assert result.claimed == []
+        assert result.failed[rel].startswith("metadata write failed")
+        assert (vault_dir / "Platinum" / rel).read_text(encoding="utf-8") == original
+        assert list((vault_dir / "Platinum" / "In_Progress" / "cloud").iterdir()) == []
+        assert cm.list_available("email") == [rel]
+        assert cm.get_owner("T001.json") is None
+
+    def test_rebuild_index(self, vault_dir):
+        cm = ClaimManager(str(vault_dir))
+        self._create_task_file(vault_dir, "email", "T001")
+        self._create_task_file(vault_dir, "social", "T002")
+        cm.claim("Needs_Action/social/T002.json", "cloud")
+        assert cm.rebuild_index() == 2
+        assert cm.list_available() == ["Needs_Action/email/T001.json"]
+        assert cm.get_owner("T002.json") == "cloud"
+
 
 # ========== AgentHeartbeat Tests ==========
 
@@ -299,6 +676,62 @@ class TestAgentHeartbeat:
         hb.stop_background()
         assert hb.is_alive("cloud", timeout=5)
 
+    def test_beat_publishes_on_status_change_only(self, vault_dir):
+        hb = AgentHeartbeat("cloud", str(vault_dir))
+        path = vault_dir / "Platinum" / "Updates" / "cloud_heartbeat.json"
+        hb.beat(current_task="T1")
+        first = path.read_text()
+        hb.beat(current_task="T2")
+        # Recorded locally, not re-published within publish_interval
+        assert path.read_text() == first
+        assert hb.get_status("cloud")["current_task"] == "T2"
+
+        hb.stop_background()
+        assert json.loads(path.read_text())["status"] == "offline"
+
+    def test_published_copy_is_compact(self, vault_dir):
+        hb = AgentHeartbeat("cloud", str(vault_dir), interval=30)
+        hb.beat()
+        text = (vault_dir / "Platinum" / "Updates" / "cloud_heartbeat.json").read_text()
+        assert "\n" not in text
+        assert json.loads(text)["interval"] == 300
+
+    def test_read_all_bulk(self, vault_dir):
+        AgentHeartbeat("cloud", str(vault_dir)).beat(current_task="T1")
+        # The other agent's heartbeat arrives through VaultSync
+        (vault_dir / "Platinum" / "Updates" / "local_heartbeat.json").write_text(json.dumps({
+            "agent_name": "local", "status": "online", "current_task": None,
+            "timestamp": datetime.utcnow().isoformat(), "interval": 300,
+        }))
+        agents = AgentHeartbeat.read_all(str(vault_dir))
+        assert set(agents) == {"cloud", "local"}
+        assert agents["cloud"]["current_task"] == "T1"
+
+    def test_stale_published_copy_does_not_override_local(self, vault_dir):
+        hb = AgentHeartbeat("cloud", str(vault_dir))
+        hb.beat()
+        old_time = (datetime.utcnow() - timedelta(seconds=600)).isoformat()
+        (vault_dir / "Platinum" / "Updates" / "cloud_heartbeat.json").write_text(json.dumps({
+            "agent_name": "cloud", "status": "online", "timestamp": old_time,
+        }))
+        assert hb.is_alive("cloud", timeout=60) is True
+
+    def test_health_summary_uses_published_interval(self, vault_dir):
+        # Published every 300s: a 4-minute-old copy is not stale
+        recent = (datetime.utcnow() - timedelta(seconds=240)).isoformat()
+        (vault_dir / "Platinum" / "Updates" / "local_heartbeat.json").write_text(json.dumps({
+            "agent_name": "local", "status": "online", "current_task": None,
+            "timestamp": recent, "interval": 300,
+        }))
+        summary = AgentHeartbeat.get_health_summary(str(vault_dir), interval=30)
+        assert summary["local"]["healthy"] is True
+
+    def test_health_summary_unreadable_file(self, vault_dir):
+        (vault_dir / "Platinum" / "Updates" / "ghost_heartbeat.json").write_text("{not json")
+        summary = AgentHeartbeat.get_health_summary(str(vault_dir))
+        assert summary["ghost"]["status"] == "error"
+        assert summary["ghost"]["healthy"] is False
+
 
 # ========== SecretGuard Tests ==========
 
@@ -360,6 +793,28 @@ class TestSecretGuard:
         assert log[0]["allowed"] is False
         assert log[1]["allowed"] is True
 
+    def test_audit_log_is_bounded(self):
+        guard = SecretGuard(agent_role="cloud", audit_log_size=3)
+        for i in range(10):
+            guard.can_access(f"note_{i}.md")
+        log = guard.get_audit_log()
+        assert [e["resource"] for e in log] == ["note_7.md", "note_8.md", "note_9.md"]
+
+    def test_combined_pattern_matches_individual_patterns(self):
+        import re
+        from Platinum.src.secret_guard import BLOCKED_PATTERNS
+        guard = SecretGuard(agent_role="cloud")
+        paths = [
+            ".env", ".env.production", "config/.ENV", "envfile", "vault.key",
+            "a/b/cert.PEM", "store.jks", "api.token", "tokens.md", "banking",
+            "banking/x/y", "my_banking.md", "Private/notes.md", "secrets",
+            "secretsauce.md", "odoo_admin/pw", "smtp_credentials", "readme.md",
+        ]
+        for path in paths:
+            expected = any(re.search(p, path, re.IGNORECASE) for p in BLOCKED_PATTERNS)
+            assert guard.is_secret_file(path) is expected, path
+            assert guard.can_access(path) is not expected, path
+
     def test_invalid_role(self):
         with pytest.raises(ValueError):
             SecretGuard(agent_role="invalid")
@@ -378,3 +833,140 @@ class TestSecretGuard:
         guard = SecretGuard(agent_role="local")
         patterns = guard.get_blocked_patterns()
         assert len(patterns) == 0
+
+
+# ========== AuditLog Tests ==========
+
+class TestAuditLog:
+    def _log(self, vault_dir, **kwargs):
+        kwargs.setdefault("index_fields", ("draft_id",))
+        return AuditLog(vault_dir / "Platinum" / "Logs", "execution_log", **kwargs)
+
+    def test_write_and_query_active_segment(self, vault_dir):
+        audit = self._log(vault_dir)
+        audit.write({"draft_id": "d1", "action": "execute_email"})
+        audit.write({"draft_id": "d2", "action": "execute_social"})
+        assert [r["draft_id"] for r in audit.query()] == ["d1", "d2"]
+        assert [r["action"] for r in audit.query(draft_id="d2")] == ["execute_social"]
+        assert (vault_dir / "Platinum" / "Logs" / "execution_log.jsonl").exists()
+        assert audit.segments() == []
+
+    def test_rotates_by_size(self, vault_dir):
+        audit = self._log(vault_dir, max_bytes=200)
+        for i in range(20):
+            audit.write({"draft_id": f"d{i}", "pad": "x" * 40})
+        segments = audit.segments()
+        assert len(segments) > 1
+        assert sum(s["count"] for s in segments) < 20  # The rest is still active
+        assert [r["draft_id"] for r in audit.query()] == [f"d{i}" for i in range(20)]
+        suffix = ".jsonl.zst" if ZSTD_AVAILABLE else ".jsonl"
+        assert segments[0]["file"] == "execution_log-000001" + suffix
+        assert all(s["count"] > 0 for s in segments)
+
+    def test_rotates_by_age(self, vault_dir):
+        audit = self._log(vault_dir, max_age=60)
+        audit.write({"ts": time.time() - 120, "draft_id": "old"})
+        audit.write({"draft_id": "new"})
+        assert [s["keys"]["draft_id"] for s in audit.segments()] == [["old"]]
+        assert [r["draft_id"] for r in audit.query(since=time.time() - 60)] == ["new"]
+
+    @pytest.mark.skipif(not ZSTD_AVAILABLE, reason="zstandard not installed")
+    def test_sealed_segments_are_compressed(self, vault_dir):
+        audit = self._log(vault_dir)
+        for i in range(200):
+            audit.write({"draft_id": "d1", "details": "Email sent via SMTP: weekly report"})
+        name = audit.seal()
+        sealed = vault_dir / "Platinum" / "Logs" / name
+        assert sealed.stat().st_size < 200 * 40
+        assert len(list(audit.query(draft_id="d1"))) == 200
+
+    def test_query_reads_only_matching_segments(self, vault_dir, monkeypatch):
+        audit = self._log(vault_dir)
+        for draft in ("d1", "d2", "d3"):
+            audit.write({"draft_id": draft})
+            audit.seal()
+        audit.write({"draft_id": "d4"})
+
+        read = []
+        original = AuditLog._read_file
+        monkeypatch.setattr(AuditLog, "_read_file",
+                            staticmethod(lambda path: read.append(path.name) or original(path)))
+        assert [r["draft_id"] for r in audit.query(draft_id="d2")] == ["d2"]
+        assert read == ["execution_log-000002" + (".jsonl.zst" if ZSTD_AVAILABLE else ".jsonl")]
+
+        read.clear()
+        assert list(audit.query(since=time.time() + 60)) == []
+        assert read == []
+
+    def test_unindexed_field_scans_time_range(self, vault_dir):
+        audit = self._log(vault_dir)
+        audit.write({"draft_id": "d1", "status": "executed"})
+        audit.seal()
+        audit.write({"draft_id": "d2", "status": "failed"})
+        assert [r["draft_id"] for r in audit.query(status="executed")] == ["d1"]
+
+    def test_reopen_keeps_active_segment_and_index(self, vault_dir):
+        audit = self._log(vault_dir)
+        audit.write({"draft_id": "d1"})
+        audit.seal()
+        audit.write({"draft_id": "d2"})
+        audit.close()
+
+        reopened = self._log(vault_dir)
+        reopened.write({"draft_id": "d3"})
+        assert [r["draft_id"] for r in reopened.query()] == ["d1", "d2", "d3"]
+        assert reopened.seal().startswith("execution_log-000002")
+
+    def test_finishes_interrupted_seal(self, vault_dir):
+        logs = vault_dir / "Platinum" / "Logs"
+        (logs / "execution_log-000001.jsonl.sealing").write_text(
+            json.dumps({"ts": 1.0, "draft_id": "d1"}) + "\n", encoding="utf-8"
+        )
+        audit = self._log(vault_dir)
+        assert not list(logs.glob("*.sealing"))
+        assert [s["keys"]["draft_id"] for s in audit.segments()] == [["d1"]]
+        assert [r["draft_id"] for r in audit.query(draft_id="d1")] == ["d1"]
+
+    def test_imports_pre_upgrade_execution_log(self, vault_dir):
+        log_file = vault_dir / "Platinum" / "Logs" / "execution_log.jsonl"
+        old = [
+            {"draft_id": "d1", "domain": "email", "action": "execute_email",
+             "timestamp": "2026-01-05T10:00:00", "status": "executed"},
+            {"draft_id": "d2", "domain": "social", "action": "execute_social",
+             "timestamp": "2026-01-05T11:00:00", "status": "executed"},
+        ]
+        log_file.write_text("".join(json.dumps(r) + "\n" for r in old), encoding="utf-8")
+
+        audit = self._log(vault_dir, index_fields=("draft_id", "domain"))
+        assert [r["draft_id"] for r in audit.query()] == ["d1", "d2"]
+        assert [r["ts"] for r in audit.query(draft_id="d1")] == [
+            datetime(2026, 1, 5, 10, 0).replace(tzinfo=timezone.utc).timestamp()
+        ]
+        # The old records are over max_age, so the next write seals and indexes them
+        audit.write({"draft_id": "d3", "domain": "email"})
+        [segment] = audit.segments()
+        assert segment["count"] == 2
+        assert segment["keys"]["draft_id"] == ["d1", "d2"]
+        assert [r["draft_id"] for r in audit.query(domain="email")] == ["d1", "d3"]
+
+    def test_sealed_segments_sync(self, vault_dir):
+        audit = self._log(vault_dir)
+        audit.write({"draft_id": "d1"})
+        sync = VaultSync(str(vault_dir))
+        assert sync._is_allowed_file(f"Platinum/Logs/{audit.seal()}")
+        assert sync._is_allowed_file("Platinum/Logs/execution_log.index.json")
+
+    def test_logging_handler(self, vault_dir):
+        import logging
+        audit = self._log(vault_dir)
+        handler = AuditLogHandler(audit)
+        log = logging.getLogger("platinum.test_audit")
+        log.addHandler(handler)
+        try:
+            log.warning("disk at %d%%", 91)
+        finally:
+            log.removeHandler(handler)
+        [record] = audit.query()
+        assert record["level"] == "WARNING"
+        assert record["logger"] == "platinum.test_audit"
+        assert record["message"] == "disk at 91%"
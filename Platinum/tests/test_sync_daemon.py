@@ -3,13 +3,16 @@ Tests for SyncDaemon.
 """
 
 import json
+import threading
+import time
 import pytest
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 
-from Platinum.src.sync_daemon import SyncDaemon
+from Platinum.src.sync_daemon import SyncDaemon, DURATION_BUCKETS
 from Platinum.src.vault_sync import SyncResult
+from Platinum.src.vault_watcher import VaultWatcher, WATCHDOG_AVAILABLE
 
 
 @pytest.fixture
@@ -20,6 +23,11 @@ def mock_settings(tmp_path):
         GIT_BRANCH="main",
         GIT_SSH_KEY="",
         SYNC_INTERVAL=60,
+        SYNC_MODE="event",
+        SYNC_MIN_INTERVAL=15,
+        SYNC_DEBOUNCE=2.0,
+        SYNC_MAX_DELAY=10.0,
+        SYNC_POLL_INTERVAL=0.05,
     )
 
 
@@ -29,6 +37,11 @@ def daemon(mock_settings):
         d = SyncDaemon.__new__(SyncDaemon)
         d.settings = mock_settings
         d._running = False
+        d._wake = threading.Event()
+        d._dirty_since = None
+        d._last_change = 0.0
+        d._ignore_until = 0.0
+        d._durations = {"count": 0, "sum": 0.0, "buckets": [0] * (len(DURATION_BUCKETS) + 1)}
         d.vault_sync = MagicMock()
         return d
 
@@ -129,3 +142,157 @@ class TestSyncDaemon:
         assert data["pull"]["files_changed"] == 2
         assert data["push"]["files_changed"] == 1
         assert data["remote"] == "origin/main"
+
+    def test_sync_status_records_cycle_durations(self, daemon, tmp_path):
+        result = SyncResult(success=True, status="ok", message="OK")
+        daemon.vault_sync.pull.return_value = result
+        daemon.vault_sync.push.return_value = result
+        daemon._run_cycle()
+        daemon._run_cycle()
+        status_file = tmp_path / "Platinum" / "Updates" / "sync_status.json"
+        durations = json.loads(status_file.read_text(encoding="utf-8"))["durations"]
+        assert durations["count"] == 2
+        assert sum(durations["buckets"]) == 2
+        assert durations["buckets"][0] == 2  # Mocked cycles are instant
+        assert len(durations["buckets"]) == len(durations["bounds"]) + 1
+
+    def test_write_sync_status_trigger(self, daemon, tmp_path):
+        result = SyncResult(success=True, status="ok", message="OK")
+        daemon._write_sync_status(result, result, trigger="event")
+        status_file = tmp_path / "Platinum" / "Updates" / "sync_status.json"
+        assert json.loads(status_file.read_text(encoding="utf-8"))["trigger"] == "event"
+
+    def test_run_cycle_returns_files_changed(self, daemon):
+        daemon.vault_sync.pull.return_value = SyncResult(
+            success=True, status="pulled", message="OK", files_changed=["a.md"]
+        )
+        daemon.vault_sync.push.return_value = SyncResult(
+            success=True, status="pushed", message="OK", files_changed=["b.md", "c.md"]
+        )
+        assert daemon._run_cycle() == 3
+
+        daemon.vault_sync.pull.side_effect = RuntimeError("boom")
+        assert daemon._run_cycle() == 0
+
+
+class TestSyncDaemonEvents:
+
+    def test_quiet_dirs_do_not_trigger(self, daemon):
+        daemon.notify_change("Updates/sync_status.json")
+        daemon.notify_change("Logs/cloud.log")
+        assert daemon._sync_due(time.monotonic()) is None
+
+        daemon.notify_change("Pending_Approval/email/DRAFT-1.json")
+        assert daemon._sync_due(time.monotonic()) is not None
+        assert daemon._wake.is_set()
+
+    def test_own_pull_does_not_trigger(self, daemon):
+        def pull():
+            daemon.notify_change("Needs_Action/email/pulled.json")
+            return MagicMock(success=True, files_changed=["Needs_Action/email/pulled.json"])
+
+        daemon.vault_sync.pull.side_effect = pull
+        daemon.vault_sync.push.return_value = MagicMock(success=True, files_changed=[])
+        daemon._run_cycle(trigger="event")
+        # Delivered by the watcher just after the pull returned
+        daemon.notify_change("Needs_Action/email/pulled.json")
+        assert daemon._sync_due(time.monotonic()) is None
+
+        time.sleep(0.06)
+        daemon.notify_change("Pending_Approval/email/DRAFT-1.json")
+        assert daemon._sync_due(time.monotonic()) is not None
+
+    def test_debounce_waits_for_quiet(self, daemon):
+        daemon.notify_change("Pending_Approval/email/DRAFT-1.json")
+        first = daemon._dirty_since
+        assert daemon._sync_due(first) == pytest.approx(first + 2.0)
+
+        # Each new change in the burst pushes the sync out...
+        daemon._last_change = first + 5.0
+        assert daemon._sync_due(first + 5.0) == pytest.approx(first + 7.0)
+
+        # ...but never past SYNC_MAX_DELAY from the first change
+        daemon._last_change = first + 9.5
+        assert daemon._sync_due(first + 9.5) == pytest.approx(first + 10.0)
+
+    def test_idle_backoff(self, daemon):
+        assert daemon._next_interval(15, 0) == 30
+        assert daemon._next_interval(30, 0) == 60
+        assert daemon._next_interval(60, 0) == 60  # capped at SYNC_INTERVAL
+        assert daemon._next_interval(60, 4) == 15
+
+    def test_event_loop_pushes_new_draft(self, daemon, mock_settings, tmp_path):
+        mock_settings.SYNC_DEBOUNCE = 0.1
+        mock_settings.SYNC_MAX_DELAY = 1.0
+        mock_settings.SYNC_MIN_INTERVAL = 60
+        ok = SyncResult(success=True, status="ok", message="OK")
+        daemon.vault_sync.pull.return_value = ok
+        daemon.vault_sync.push.return_value = ok
+        pending = tmp_path / "Platinum" / "Pending_Approval" / "email"
+        pending.mkdir(parents=True)
+
+        daemon._running = True
+        thread = threading.Thread(target=daemon._run_event_loop)
+        thread.start()
+        try:
+            # Startup runs one idle cycle; the next idle cycle is a minute away
+            deadline = time.monotonic() + 5
+            while daemon.vault_sync.push.call_count < 1 and time.monotonic() < deadline:
+                time.sleep(0.02)
+            time.sleep(0.3)  # let the watcher settle
+
+            (pending / "DRAFT-1.json").write_text("{}", encoding="utf-8")
+            deadline = time.monotonic() + 5
+            while daemon.vault_sync.push.call_count < 2 and time.monotonic() < deadline:
+                time.sleep(0.02)
+            assert daemon.vault_sync.push.call_count == 2
+        finally:
+            daemon.stop()
+            thread.join(timeout=5)
+        assert not thread.is_alive()
+        status = json.loads(
+            (tmp_path / "Platinum" / "Updates" / "sync_status.json").read_text(encoding="utf-8")
+        )
+        assert status["trigger"] == "event"
+
+
+class TestVaultWatcher:
+
+    def _watch(self, tmp_path, use_watchdog):
+        changes = []
+        watcher = VaultWatcher(
+            tmp_path, changes.append, ignore=("Updates",),
+            poll_interval=0.05, use_watchdog=use_watchdog,
+        )
+        (tmp_path / "Pending_Approval").mkdir()
+        (tmp_path / "Updates").mkdir()
+        watcher.start()
+        return watcher, changes
+
+    def _wait_for(self, changes, predicate, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if any(predicate(c) for c in list(changes)):
+                return True
+            time.sleep(0.02)
+        return False
+
+    @pytest.mark.parametrize("use_watchdog", [
+        False,
+        pytest.param(True, marks=pytest.mark.skipif(
+            not WATCHDOG_AVAILABLE, reason="watchdog not installed")),
+    ])
+    def test_reports_new_file(self, tmp_path, use_watchdog):
+        watcher, changes = self._watch(tmp_path, use_watchdog)
+        try:
+            time.sleep(0.1)
+            (tmp_path / "Updates" / "cloud_heartbeat.json").write_text("{}")
+            (tmp_path / ".state").mkdir()
+            (tmp_path / "Pending_Approval" / "DRAFT-1.json").write_text("{}")
+            assert self._wait_for(changes, lambda c: c.startswith("Pending_Approval"))
+        finally:
+            watcher.stop()
+        assert not any(c.startswith(("Updates", ".state")) for c in changes)
+
+    def test_backend(self, tmp_path):
+        assert VaultWatcher(tmp_path, print, use_watchdog=False).backend == "polling"
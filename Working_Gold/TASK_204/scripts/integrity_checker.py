@@ -4,26 +4,209 @@ integrity_checker.py - SHA-256 checksum for archives
 CRITICAL-6 Fix: No Backup Integrity Verification (CVSS 6.5)
 Created: 2026-01-27 for TASK_204
 Purpose: Generate and verify SHA-256 checksums for all archived files
+
+Files are hashed on a bounded thread pool with 1 MiB reads (hashlib
+releases the GIL on large buffers). Each manifest entry records the
+file's size, mtime_ns and inode; a file whose three values still match
+is not re-hashed on --create or --verify unless --full is given. A file
+modified in the same timestamp tick as the manifest was written cannot
+be told apart by mtime, so such entries are always re-hashed.
+
+The manifest also holds a Merkle tree with one hash per directory, so
+two archives (or an archive and its synced copy) are compared by
+descending only into directories whose hashes differ, and a single
+subtree can be verified after a partial restore.
 """
 
 import hashlib
 import json
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import sys
 import argparse
 
+CHUNK_SIZE = 1024 * 1024
+MAX_PARALLEL_ARCHIVES = 4
+
+
+class _Throughput:
+    """Thread-safe hashed/skipped counters for one run"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.hashed = 0
+        self.skipped = 0
+        self.bytes_hashed = 0
+
+    def add(self, hashed=0, skipped=0, bytes_hashed=0):
+        with self._lock:
+            self.hashed += hashed
+            self.skipped += skipped
+            self.bytes_hashed += bytes_hashed
+
+    def summary(self):
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        files = self.hashed + self.skipped
+        return (
+            f"[STATS] {files} files ({self.hashed} hashed, {self.skipped} unchanged) "
+            f"in {elapsed:.2f}s: {files / elapsed:,.0f} files/s, "
+            f"{self.bytes_hashed / elapsed / (1024 * 1024):,.1f} MB/s hashed"
+        )
+
+
+def _walk_files(root):
+    """Yield (rel_path, path, stat) for every file under root, one stat each"""
+    stack = ['']
+    while stack:
+        rel_dir = stack.pop()
+        with os.scandir(os.path.join(root, rel_dir)) as entries:
+            for entry in entries:
+                rel = os.path.join(rel_dir, entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(rel)
+                elif entry.is_file():
+                    yield rel, entry.path, entry.stat()
+
+
+def _dir_key(parts):
+    """'/'-joined directory path; '.' is the archive root"""
+    return '/'.join(parts) or '.'
+
+
+def _dir_entries(rel_paths):
+    """{dir parts: {name: file rel_path or subdir parts}} for a file list"""
+    entries = {(): {}}
+    for rel_path in rel_paths:
+        parts = Path(rel_path).parts
+        for depth in range(1, len(parts)):
+            entries.setdefault(parts[:depth], {})
+            entries[parts[:depth - 1]][parts[depth - 1]] = parts[:depth]
+        entries[parts[:-1]][parts[-1]] = rel_path
+    return entries
+
+
+def build_merkle_tree(checksums):
+    """Directory-level Merkle tree over {rel_path: sha256}
+
+    Returns {dir: hash}, keyed by '/'-separated directory path with '.'
+    for the root. A directory hashes its entries sorted by name, as
+    "blob <name>\\0<sha256>" for files and "tree <name>\\0<hash>" for
+    subdirectories, so a subtree's hash depends only on what is under it.
+    """
+    entries = _dir_entries(checksums)
+    tree = {}
+    for dir_parts in sorted(entries, key=len, reverse=True):
+        sha256 = hashlib.sha256()
+        for name, ref in sorted(entries[dir_parts].items()):
+            if isinstance(ref, tuple):
+                line = f"tree {name}\0{tree[_dir_key(ref)]}\n"
+            else:
+                line = f"blob {name}\0{checksums[ref]}\n"
+            sha256.update(line.encode('utf-8', 'surrogateescape'))
+        tree[_dir_key(dir_parts)] = sha256.hexdigest()
+    return dict(sorted(tree.items()))
+
+
+def diff_trees(files_a, tree_a, files_b, tree_b, subdir='.'):
+    """Paths that differ between two manifests, pruning equal subtrees
+
+    files_*: {rel_path: sha256}; tree_*: build_merkle_tree() output.
+    Returns sorted rel paths that were added, removed or changed.
+    """
+    entries_a = _dir_entries(files_a)
+    entries_b = _dir_entries(files_b)
+    start = () if subdir in ('.', '') else Path(subdir).parts
+    changed = []
+    stack = [start]
+    while stack:
+        dir_parts = stack.pop()
+        key = _dir_key(dir_parts)
+        if tree_a.get(key) is not None and tree_a.get(key) == tree_b.get(key):
+            continue
+        children_a = entries_a.get(dir_parts, {})
+        children_b = entries_b.get(dir_parts, {})
+        for name in set(children_a) | set(children_b):
+            ref_a, ref_b = children_a.get(name), children_b.get(name)
+            for ref in (ref_a, ref_b):
+                if isinstance(ref, tuple):
+                    stack.append(ref)
+                    break
+            for ref in (ref_a, ref_b):
+                if isinstance(ref, str):
+                    if files_a.get(ref) != files_b.get(ref):
+                        changed.append(ref)
+                    break
+    return sorted(set(changed), key=lambda rel: Path(rel).parts)
+
+
+def _signature(st):
+    return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'inode': st.st_ino}
+
+
+def _unchanged(file_info, st, manifest_mtime_ns):
+    """True if the stored size/mtime_ns/inode still describe the file"""
+    if file_info.get('mtime_ns') is None:
+        return False
+    if manifest_mtime_ns is None or st.st_mtime_ns >= manifest_mtime_ns:
+        # Racily clean: written in the same tick as the manifest
+        return False
+    return (
+        file_info.get('size') == st.st_size
+        and file_info.get('mtime_ns') == st.st_mtime_ns
+        and file_info.get('inode') == st.st_ino
+    )
+
 
 class IntegrityChecker:
     """Handle SHA-256 checksum generation and verification for archives"""
 
-    def __init__(self, verbose=True):
+    def __init__(self, verbose=True, workers=None, full=False):
+        """
+        workers: hashing threads (default: ThreadPoolExecutor's default)
+        full: re-hash every file, ignoring unchanged manifest entries
+        """
         self.verbose = verbose
+        self.workers = workers
+        self.full = full
+        self._local = threading.local()
+        self._print_lock = threading.Lock()
 
     def _log(self, message):
         """Print message if verbose mode enabled"""
         if self.verbose:
-            print(message)
+            buffer = getattr(self._local, 'buffer', None)
+            if buffer is not None:
+                # Parallel archive scan: printed in one block when done
+                buffer.append(message)
+            else:
+                print(message)
+
+    def _hash_all(self, jobs, pool, stats):
+        """Hash (key, path, size) jobs in parallel; return {key: sha256 or None}"""
+        def run(job):
+            key, path, size = job
+            checksum = self.generate_checksum(path)
+            stats.add(hashed=1, bytes_hashed=size if checksum else 0)
+            return key, checksum
+
+        if pool is not None:
+            return dict(pool.map(run, jobs))
+        with ThreadPoolExecutor(max_workers=self.workers) as own_pool:
+            return dict(own_pool.map(run, jobs))
+
+    def _load_manifest(self, integrity_file):
+        """Return (integrity_data, manifest mtime_ns), or (None, None)"""
+        try:
+            st = integrity_file.stat()
+            with open(integrity_file, 'r') as f:
+                return json.load(f), st.st_mtime_ns
+        except (OSError, ValueError):
+            return None, None
 
     def generate_checksum(self, file_path):
         """Generate SHA-256 checksum for a file"""
@@ -32,7 +215,7 @@ class IntegrityChecker:
         try:
             with open(file_path, 'rb') as f:
                 # Read file in chunks to handle large files
-                for chunk in iter(lambda: f.read(4096), b''):
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
                     sha256.update(chunk)
 
             return sha256.hexdigest()
@@ -43,6 +226,13 @@ class IntegrityChecker:
 
     def create_integrity_file(self, archive_dir):
         """Create integrity.json with checksums for all files in archive"""
+        stats = _Throughput()
+        result = self._create(archive_dir, None, stats)
+        if result is not None:
+            self._log(stats.summary())
+        return result
+
+    def _create(self, archive_dir, pool, stats):
         archive_path = Path(archive_dir)
 
         if not archive_path.exists():
@@ -52,44 +242,67 @@ class IntegrityChecker:
         self._log(f"\n[SCAN] Scanning archive: {archive_path.name}")
         self._log("=" * 60)
 
+        integrity_file = archive_path / 'integrity.json'
+        previous, manifest_mtime_ns = ({}, None)
+        if not self.full and integrity_file.exists():
+            old_data, manifest_mtime_ns = self._load_manifest(integrity_file)
+            if isinstance(old_data, dict):
+                previous = old_data.get('files') or {}
+
         integrity_data = {
-            'version': '1.0',
+            'version': '1.1',
             'created': datetime.now().isoformat(),
             'archive_dir': str(archive_path.name),
             'files': {}
         }
 
+        files = sorted(
+            (Path(rel).parts, rel, path, st)
+            for rel, path, st in _walk_files(archive_path)
+            if rel != 'integrity.json'
+        )
+
+        checksums = {}
+        jobs = []
+        for _, rel_path, path, st in files:
+            old = previous.get(rel_path)
+            if old and _unchanged(old, st, manifest_mtime_ns):
+                checksums[rel_path] = old['sha256']
+                stats.add(skipped=1)
+            else:
+                jobs.append((rel_path, path, st.st_size))
+        checksums.update(self._hash_all(jobs, pool, stats))
+
         file_count = 0
         error_count = 0
 
-        # Scan all files in archive
-        for file_path in sorted(archive_path.rglob('*')):
-            if file_path.is_file() and file_path.name != 'integrity.json':
-                rel_path = str(file_path.relative_to(archive_path))
-
-                checksum = self.generate_checksum(file_path)
-
-                if checksum:
-                    integrity_data['files'][rel_path] = {
-                        'sha256': checksum,
-                        'size': file_path.stat().st_size,
-                        'modified': datetime.fromtimestamp(
-                            file_path.stat().st_mtime
-                        ).isoformat()
-                    }
-                    self._log(f"[OK] {rel_path}: {checksum[:16]}...")
-                    file_count += 1
-                else:
-                    error_count += 1
+        for _, rel_path, _, st in files:
+            checksum = checksums[rel_path]
+
+            if checksum:
+                integrity_data['files'][rel_path] = {
+                    'sha256': checksum,
+                    **_signature(st),
+                    'modified': datetime.fromtimestamp(st.st_mtime).isoformat()
+                }
+                self._log(f"[OK] {rel_path}: {checksum[:16]}...")
+                file_count += 1
+            else:
+                error_count += 1
 
-        # Save integrity file
-        integrity_file = archive_path / 'integrity.json'
+        tree = build_merkle_tree(
+            {rel: info['sha256'] for rel, info in integrity_data['files'].items()}
+        )
+        integrity_data['merkle_root'] = tree['.']
+        integrity_data['merkle_tree'] = tree
 
+        # Save integrity file
         try:
             with open(integrity_file, 'w') as f:
                 json.dump(integrity_data, f, indent=2)
 
             self._log(f"\n[OK] Integrity file created: {integrity_file}")
+            self._log(f"   Merkle root: {tree['.'][:16]}...")
             self._log(f"   Files processed: {file_count}")
             self._log(f"   Errors: {error_count}")
 
@@ -101,6 +314,13 @@ class IntegrityChecker:
 
     def verify_integrity(self, archive_dir):
         """Verify all files match stored checksums"""
+        stats = _Throughput()
+        success, errors = self._verify(archive_dir, None, stats)
+        if stats.hashed or stats.skipped:
+            self._log(stats.summary())
+        return success, errors
+
+    def _verify(self, archive_dir, pool, stats):
         archive_path = Path(archive_dir)
         integrity_file = archive_path / 'integrity.json'
 
@@ -112,6 +332,7 @@ class IntegrityChecker:
         self._log("=" * 60)
 
         try:
+            manifest_mtime_ns = integrity_file.stat().st_mtime_ns
             with open(integrity_file, 'r') as f:
                 integrity_data = json.load(f)
         except Exception as e:
@@ -123,17 +344,33 @@ class IntegrityChecker:
         missing_count = 0
         mismatch_count = 0
 
-        # Verify each file
+        # Stat every file; only changed (or --full) files are re-hashed
+        checks = []
+        checksums = {}
+        jobs = []
         for rel_path, file_info in integrity_data['files'].items():
-            file_path = archive_path / rel_path
+            try:
+                st = os.stat(archive_path / rel_path)
+            except OSError:
+                checks.append((rel_path, file_info, False))
+                continue
+            checks.append((rel_path, file_info, True))
+            if not self.full and _unchanged(file_info, st, manifest_mtime_ns):
+                checksums[rel_path] = file_info['sha256']
+                stats.add(skipped=1)
+            else:
+                jobs.append((rel_path, archive_path / rel_path, st.st_size))
+        checksums.update(self._hash_all(jobs, pool, stats))
 
-            if not file_path.exists():
+        # Verify each file
+        for rel_path, file_info, exists in checks:
+            if not exists:
                 self._log(f"[ERR] Missing: {rel_path}")
                 errors.append(f"Missing file: {rel_path}")
                 missing_count += 1
                 continue
 
-            current_checksum = self.generate_checksum(file_path)
+            current_checksum = checksums[rel_path]
 
             if current_checksum != file_info['sha256']:
                 self._log(f"[ERR] Checksum mismatch: {rel_path}")
@@ -161,6 +398,89 @@ class IntegrityChecker:
 
         return success, errors
 
+    def _load_tree(self, archive_dir):
+        """Return ({rel_path: sha256}, merkle tree) from integrity.json, or None"""
+        integrity_data, _ = self._load_manifest(Path(archive_dir) / 'integrity.json')
+        if not isinstance(integrity_data, dict):
+            self._log(f"[ERR] No readable integrity file in {archive_dir}")
+            return None
+        files = {rel: info['sha256'] for rel, info in integrity_data['files'].items()}
+        # Manifests from before the Merkle tree was added
+        tree = integrity_data.get('merkle_tree') or build_merkle_tree(files)
+        return files, tree
+
+    def compare_archives(self, archive_a, archive_b):
+        """Compare two archives by their manifests' Merkle trees
+
+        Returns the sorted rel paths that differ ([] if identical), or
+        None if either integrity.json is missing.
+        """
+        a = self._load_tree(archive_a)
+        b = self._load_tree(archive_b)
+        if a is None or b is None:
+            return None
+
+        self._log(f"\n[COMPARE] {Path(archive_a).name} <-> {Path(archive_b).name}")
+        if a[1]['.'] == b[1]['.']:
+            self._log(f"[OK] Identical (root {a[1]['.'][:16]}...)")
+            return []
+
+        changed = diff_trees(a[0], a[1], b[0], b[1])
+        for rel_path in changed:
+            self._log(f"[DIFF] {rel_path}")
+        self._log(f"[ERR] {len(changed)} files differ")
+        return changed
+
+    def verify_subtree(self, archive_dir, subdir):
+        """Verify one directory of an archive against its stored subtree hash
+
+        Hashes only the files on disk under subdir. Returns (success,
+        errors) with the same messages as verify_integrity, plus
+        "Unexpected file: X" for files not in the manifest.
+        """
+        archive_path = Path(archive_dir)
+        stored = self._load_tree(archive_path)
+        if stored is None:
+            return False, ["No integrity.json file found"]
+        stored_files, stored_tree = stored
+
+        key = _dir_key(Path(subdir).parts) if subdir not in ('.', '') else '.'
+        self._log(f"\n[VERIFY] Verifying subtree {key} of {archive_path.name}")
+        if key not in stored_tree:
+            self._log(f"[ERR] {key} is not a directory in the manifest")
+            return False, [f"Unknown subtree: {key}"]
+
+        root = archive_path / subdir
+        prefix = Path(subdir).parts if key != '.' else ()
+        current = {}
+        if root.is_dir():
+            jobs = [
+                (os.path.join(*prefix, rel), path, st.st_size)
+                for rel, path, st in _walk_files(root)
+                if prefix or rel != 'integrity.json'
+            ]
+            current = {
+                rel: checksum
+                for rel, checksum in self._hash_all(jobs, None, _Throughput()).items()
+                if checksum
+            }
+
+        current_tree = build_merkle_tree(current) if current else {}
+        if current_tree.get(key) == stored_tree[key]:
+            self._log(f"[OK] Subtree verified: {stored_tree[key][:16]}...")
+            return True, []
+
+        errors = []
+        for rel_path in diff_trees(stored_files, stored_tree, current, current_tree, key):
+            if rel_path not in current:
+                errors.append(f"Missing file: {rel_path}")
+            elif rel_path not in stored_files:
+                errors.append(f"Unexpected file: {rel_path}")
+            else:
+                errors.append(f"Checksum mismatch: {rel_path}")
+            self._log(f"[ERR] {errors[-1]}")
+        return False, errors
+
     def scan_all_archives(self, base_dir, create=False):
         """Scan all archives in base directory"""
         base_path = Path(base_dir)
@@ -172,35 +492,44 @@ class IntegrityChecker:
         self._log(f"\n[ARCHIVES] Scanning archives in: {base_path}")
         self._log("=" * 60)
 
-        archives_found = 0
-        archives_processed = 0
-        archives_failed = 0
-
-        # Find all task archives
-        for task_dir in sorted(base_path.glob('TASK_*')):
-            if task_dir.is_dir():
-                archives_found += 1
+        task_dirs = [d for d in sorted(base_path.glob('TASK_*')) if d.is_dir()]
+        stats = _Throughput()
 
+        def process(task_dir):
+            # Buffer this archive's output so parallel archives don't interleave
+            self._local.buffer = []
+            try:
                 if create:
                     # Create integrity file
-                    result = self.create_integrity_file(task_dir)
-                    if result:
-                        archives_processed += 1
-                    else:
-                        archives_failed += 1
+                    ok = self._create(task_dir, pool, stats) is not None
                 else:
                     # Verify integrity
-                    success, errors = self.verify_integrity(task_dir)
-                    if success:
-                        archives_processed += 1
-                    else:
-                        archives_failed += 1
+                    ok, _ = self._verify(task_dir, pool, stats)
+            finally:
+                lines, self._local.buffer = self._local.buffer, None
+                if lines:
+                    with self._print_lock:
+                        print("\n".join(lines))
+            return ok
+
+        # One shared hashing pool; archive threads only wait on it, so
+        # the two pools cannot deadlock
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(MAX_PARALLEL_ARCHIVES, len(task_dirs)))
+            ) as archive_pool:
+                results = list(archive_pool.map(process, task_dirs))
+
+        archives_found = len(task_dirs)
+        archives_processed = sum(results)
+        archives_failed = archives_found - archives_processed
 
         # Summary
         self._log("\n" + "=" * 60)
         self._log(f"Archives found: {archives_found}")
         self._log(f"Archives processed: {archives_processed}")
         self._log(f"Archives failed: {archives_failed}")
+        self._log(stats.summary())
 
 
 def main():
@@ -232,6 +561,31 @@ def main():
         help='Scan all archives in base directory'
     )
 
+    parser.add_argument(
+        '--subtree',
+        metavar='REL_DIR',
+        help='With --verify, verify only this directory of the archive'
+    )
+
+    parser.add_argument(
+        '--compare',
+        metavar='OTHER_DIR',
+        help='Compare archive_dir with another archive by Merkle tree'
+    )
+
+    parser.add_argument(
+        '--full',
+        action='store_true',
+        help='Re-hash every file, even if size/mtime/inode are unchanged'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Hashing threads (default: CPU count + 4, at most 32)'
+    )
+
     parser.add_argument(
         '-q', '--quiet',
         action='store_true',
@@ -240,25 +594,34 @@ def main():
 
     args = parser.parse_args()
 
-    checker = IntegrityChecker(verbose=not args.quiet)
+    checker = IntegrityChecker(
+        verbose=not args.quiet, workers=args.workers, full=args.full
+    )
 
     if args.scan_all:
         # Scan all archives
         checker.scan_all_archives(args.scan_all, create=args.create)
 
     elif args.archive_dir:
-        if args.create:
+        if args.compare:
+            changed = checker.compare_archives(args.archive_dir, args.compare)
+            sys.exit(0 if changed == [] else 1)
+
+        elif args.create:
             # Create integrity file
             result = checker.create_integrity_file(args.archive_dir)
             sys.exit(0 if result else 1)
 
         elif args.verify:
             # Verify integrity
-            success, errors = checker.verify_integrity(args.archive_dir)
+            if args.subtree:
+                success, errors = checker.verify_subtree(args.archive_dir, args.subtree)
+            else:
+                success, errors = checker.verify_integrity(args.archive_dir)
             sys.exit(0 if success else 1)
 
         else:
-            print("Error: Must specify --create or --verify")
+            print("Error: Must specify --create, --verify or --compare")
             sys.exit(1)
 
     else:
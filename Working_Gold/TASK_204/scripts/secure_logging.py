@@ -4,12 +4,24 @@ secure_logging.py - Secure logging wrapper with automatic sanitization
 CRITICAL-8 Fix: Sensitive Data in Logs (CVSS 6.0)
 Created: 2026-01-28 for TASK_204
 Purpose: Provide secure logging that automatically sanitizes sensitive data
+
+With async_queue=True, the calling thread only enqueues the record; a
+background listener thread sanitizes, formats and writes records in
+batches (one write and flush per handler per batch), so log I/O is off
+the request path. The queue is bounded: when full, records are either
+dropped and counted (overflow='drop') or the caller waits (overflow='block').
+Queued records are flushed at interpreter exit.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+import traceback
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 # Import sanitization function from input_validator
 try:
@@ -43,6 +55,124 @@ class SanitizingFormatter(logging.Formatter):
         return sanitized_message
 
 
+class _BoundedQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler with a drop-or-block policy for a bounded queue"""
+
+    def __init__(self, record_queue: queue.Queue, overflow: str = 'block'):
+        if overflow not in ('drop', 'block'):
+            raise ValueError(f"overflow must be 'drop' or 'block', got {overflow!r}")
+        super().__init__(record_queue)
+        self.overflow = overflow
+        self.dropped = 0
+
+    def prepare(self, record):
+        """Merge args into the message; sanitizing and formatting happen on the listener"""
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record):
+        if self.overflow == 'block':
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _BatchingListener:
+    """Background thread that drains the queue and writes records in batches"""
+
+    _STOP = object()
+
+    def __init__(self, record_queue: queue.Queue, handlers: List[logging.Handler],
+                 queue_handler: _BoundedQueueHandler, batch_size: int = 256):
+        self.queue = record_queue
+        self.handlers = handlers
+        self.queue_handler = queue_handler
+        self.batch_size = batch_size
+        self._reported_drops = 0
+        self._thread = threading.Thread(target=self._run, name='secure-log-listener', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = any(item is self._STOP for item in batch)
+            records = [item for item in batch if item is not self._STOP]
+            self._report_drops(records)
+            try:
+                self._write(records)
+            except Exception:
+                # A dead listener would block every caller once the queue fills
+                traceback.print_exc(file=sys.stderr)
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+            if stop:
+                return
+
+    def _report_drops(self, records):
+        dropped = self.queue_handler.dropped
+        if dropped > self._reported_drops and records:
+            first = records[0]
+            records.append(logging.LogRecord(
+                first.name, logging.WARNING, __file__, 0,
+                f"Log queue full: dropped {dropped - self._reported_drops} records",
+                None, None,
+            ))
+            self._reported_drops = dropped
+
+    def _write(self, records):
+        # Handlers share one formatter, so each record is sanitized once
+        formatted = {}
+        for handler in self.handlers:
+            if getattr(handler, 'stream', None) is None:
+                # Not a stream handler (e.g. an extra handler): its own emit
+                for record in records:
+                    try:
+                        handler.handle(record)
+                    except Exception:
+                        handler.handleError(record)
+                continue
+            lines = []
+            for record in records:
+                if record.levelno < handler.level:
+                    continue
+                key = (id(handler.formatter), id(record))
+                if key not in formatted:
+                    try:
+                        formatted[key] = handler.format(record)
+                    except Exception:
+                        # As StreamHandler.emit does: report, skip the record
+                        handler.handleError(record)
+                        continue
+                lines.append(formatted[key])
+            if not lines:
+                continue
+            handler.acquire()
+            try:
+                handler.stream.write(handler.terminator.join(lines) + handler.terminator)
+                handler.flush()
+            except Exception:
+                handler.handleError(records[0])
+            finally:
+                handler.release()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Write everything queued so far, then end the thread"""
+        if self._thread.is_alive():
+            self.queue.put(self._STOP)
+            self._thread.join(timeout)
+
+
 class SecureLogger:
     """
     Wrapper for Python logging with automatic sanitization
@@ -51,6 +181,9 @@ class SecureLogger:
         logger = SecureLogger('my_component')
         logger.info('Processing user password=secret123')  # Automatically sanitized
         logger.error('API key: AKIA1234567890123456')  # Automatically sanitized
+
+        # Sanitize and write on a background thread
+        logger = SecureLogger('api', log_file='api.log', async_queue=True)
     """
 
     def __init__(
@@ -58,7 +191,11 @@ class SecureLogger:
         name: str,
         log_file: Optional[str] = None,
         level: int = logging.INFO,
-        console: bool = True
+        console: bool = True,
+        async_queue: bool = False,
+        queue_size: int = 10000,
+        overflow: str = 'block',
+        extra_handlers: Optional[List[logging.Handler]] = None
     ):
         """
         Initialize secure logger
@@ -68,10 +205,18 @@ class SecureLogger:
             log_file: Optional log file path
             level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
             console: Whether to also log to console
+            async_queue: Sanitize, format and write on a background thread
+            queue_size: Maximum queued records (async_queue only)
+            overflow: 'block' the caller or 'drop' the record when the
+                queue is full (async_queue only)
+            extra_handlers: Further handlers (e.g. a structured log sink);
+                those without a formatter get one that sanitizes the message
         """
         self.logger = logging.getLogger(name)
         self.logger.setLevel(level)
         self.logger.handlers = []  # Clear any existing handlers
+        self._listener = None
+        self._queue_handler = None
 
         # Create sanitizing formatter
         formatter = SanitizingFormatter(
@@ -96,6 +241,43 @@ class SecureLogger:
             console_handler.setFormatter(formatter)
             self.logger.addHandler(console_handler)
 
+        for handler in extra_handlers or []:
+            handler.setLevel(level)
+            if handler.formatter is None:
+                handler.setFormatter(SanitizingFormatter('%(message)s'))
+            self.logger.addHandler(handler)
+
+        if async_queue:
+            # The listener takes over the handlers; the logger only enqueues
+            handlers = self.logger.handlers
+            record_queue = queue.Queue(maxsize=queue_size)
+            self._queue_handler = _BoundedQueueHandler(record_queue, overflow)
+            self._listener = _BatchingListener(record_queue, handlers, self._queue_handler)
+            self.logger.handlers = [self._queue_handler]
+            atexit.register(self.close)
+
+    @property
+    def dropped(self) -> int:
+        """Records dropped because the queue was full (overflow='drop')"""
+        return self._queue_handler.dropped if self._queue_handler else 0
+
+    def flush(self):
+        """Block until every queued record has been written"""
+        if self._listener is not None:
+            self._listener.queue.join()
+
+    def close(self):
+        """Flush queued records and close the handlers"""
+        if self._listener is not None:
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.close()
+            # Later records are written synchronously rather than queued
+            # with no listener
+            self.logger.handlers = self._listener.handlers
+            self._listener = None
+            atexit.unregister(self.close)
+
     def debug(self, message: str, *args, **kwargs):
         """Log debug message (automatically sanitized)"""
         self.logger.debug(message, *args, **kwargs)
@@ -121,7 +303,11 @@ def get_secure_logger(
     name: str,
     log_file: Optional[str] = None,
     level: int = logging.INFO,
-    console: bool = True
+    console: bool = True,
+    async_queue: bool = False,
+    queue_size: int = 10000,
+    overflow: str = 'block',
+    extra_handlers: Optional[List[logging.Handler]] = None
 ) -> SecureLogger:
     """
     Factory function to create secure logger
@@ -131,11 +317,58 @@ def get_secure_logger(
         log_file: Optional log file path
         level: Logging level
         console: Whether to log to console
+        async_queue: Sanitize, format and write on a background thread
+        queue_size: Maximum queued records (async_queue only)
+        overflow: 'block' or 'drop' when the queue is full
+        extra_handlers: Further handlers, e.g. a structured log sink
 
     Returns:
         SecureLogger instance
     """
-    return SecureLogger(name, log_file, level, console)
+    return SecureLogger(name, log_file, level, console, async_queue, queue_size, overflow,
+                        extra_handlers)
+
+
+def benchmark_latency(records: int = 20000, log_dir: Optional[str] = None) -> dict:
+    """
+    Time logger.info() calls with synchronous and queued handlers
+
+    Args:
+        records: Log calls per mode
+        log_dir: Directory for the log files (default: a temporary directory)
+
+    Returns:
+        {mode: {"p50_us", "p99_us": per-call latency, "total_s": seconds
+        until every record is on disk}} for modes "sync" and "async"
+    """
+    import tempfile
+    import time
+
+    results = {}
+    with tempfile.TemporaryDirectory(dir=log_dir) as tmp:
+        for mode in ('sync', 'async'):
+            logger = SecureLogger(f'benchmark.{mode}', log_file=str(Path(tmp) / f'{mode}.log'),
+                                  console=False, async_queue=(mode == 'async'))
+            latencies = []
+            start = time.perf_counter()
+            for i in range(records):
+                t0 = time.perf_counter()
+                logger.info('request %d handled for user@example.com token=abc%d', i, i)
+                latencies.append(time.perf_counter() - t0)
+            logger.flush()
+            total = time.perf_counter() - start
+            logger.close()
+            for handler in logger.logger.handlers:
+                handler.close()
+            logger.logger.handlers = []
+
+            latencies.sort()
+            results[mode] = {
+                'p50_us': round(latencies[len(latencies) // 2] * 1e6, 2),
+                'p99_us': round(latencies[int(len(latencies) * 0.99)] * 1e6, 2),
+                'total_s': round(total, 3),
+            }
+    return results
 
 
 def sanitize_and_log(message: str, level: str = 'INFO', logger_name: str = 'default') -> str:
@@ -168,7 +401,7 @@ def main():
         description='AI Employee Vault - Secure Logging (CRITICAL-8 Fix)'
     )
 
-    parser.add_argument('action', choices=['test', 'sanitize'],
+    parser.add_argument('action', choices=['test', 'sanitize', 'benchmark'],
                         help='Action to perform')
 
     parser.add_argument('message', nargs='?',
@@ -271,6 +504,15 @@ def main():
 
         sys.exit(0)
 
+    elif args.action == 'benchmark':
+        records = int(args.message) if args.message else 20000
+        results = benchmark_latency(records)
+        print(f"[BENCH] {records:,} logger.info() calls to a file")
+        for mode, r in results.items():
+            print(f"  {mode:<6} p50 {r['p50_us']:>8.2f} us  p99 {r['p99_us']:>8.2f} us  "
+                  f"{r['total_s']:>7.3f} s until on disk")
+        sys.exit(0)
+
 
 if __name__ == '__main__':
     main()
@@ -434,6 +434,82 @@ class TestEncryption:
         assert encrypted_file1.read_bytes() != encrypted_file2.read_bytes()
 
 
+@pytest.mark.unit
+@pytest.mark.phase2
+@pytest.mark.security
+class TestChunkedEncryption:
+    """Test the streaming chunked format and legacy compatibility"""
+
+    CHUNK = 4096
+
+    def _roundtrip(self, work_dir, data, chunk_size=CHUNK):
+        encryptor = ArchiveEncryption(key_file=None, verbose=False)
+        plain = work_dir / 'plain.bin'
+        plain.write_bytes(data)
+        encrypted = work_dir / 'plain.enc'
+        decrypted = work_dir / 'plain.out'
+        encryptor.encrypt_file(str(plain), str(encrypted), chunk_size=chunk_size)
+        encryptor.decrypt_file(str(encrypted), str(decrypted))
+        return encryptor, encrypted, decrypted.read_bytes()
+
+    @pytest.mark.parametrize('size', [0, 1, 4096, 4097, 3 * 4096, 3 * 4096 + 5])
+    def test_roundtrip_sizes(self, temp_dir, size):
+        """Test chunk boundaries, empty input and partial last chunks"""
+        data = os.urandom(size)
+        _, encrypted, result = self._roundtrip(temp_dir('chunked'), data)
+        assert result == data
+        chunks = max(1, -(-size // self.CHUNK))
+        assert encrypted.stat().st_size == 16 + size + 16 * chunks
+
+    def test_header_is_versioned(self, temp_dir):
+        """Test output starts with the stream magic and version"""
+        from encryption_utils import STREAM_MAGIC, STREAM_VERSION
+        _, encrypted, _ = self._roundtrip(temp_dir('chunked'), b'x' * 100)
+        header = encrypted.read_bytes()[:5]
+        assert header == STREAM_MAGIC + bytes([STREAM_VERSION])
+
+    def test_legacy_file_decrypts(self, temp_dir):
+        """Test single-shot files written before the chunked format"""
+        work_dir = temp_dir('chunked')
+        encryptor = ArchiveEncryption(key_file=None, verbose=False)
+        nonce = os.urandom(12)
+        legacy = work_dir / 'legacy.enc'
+        legacy.write_bytes(nonce + encryptor.cipher.encrypt(nonce, b'legacy data', None))
+
+        output = work_dir / 'legacy.out'
+        encryptor.decrypt_file(str(legacy), str(output))
+        assert output.read_bytes() == b'legacy data'
+
+    def test_truncated_stream_fails(self, temp_dir):
+        """Test dropping the final chunk is detected"""
+        work_dir = temp_dir('chunked')
+        encryptor, encrypted, _ = self._roundtrip(work_dir, os.urandom(3 * self.CHUNK))
+        data = encrypted.read_bytes()
+        encrypted.write_bytes(data[:16 + 2 * (self.CHUNK + 16)])
+
+        output = work_dir / 'truncated.out'
+        with pytest.raises(Exception):
+            encryptor.decrypt_file(str(encrypted), str(output))
+        assert not output.exists()
+
+    def test_reordered_chunks_fail(self, temp_dir):
+        """Test swapping two chunks is detected"""
+        work_dir = temp_dir('chunked')
+        encryptor, encrypted, _ = self._roundtrip(work_dir, os.urandom(3 * self.CHUNK))
+        data = encrypted.read_bytes()
+        block = self.CHUNK + 16
+        first, second = data[16:16 + block], data[16 + block:16 + 2 * block]
+        encrypted.write_bytes(data[:16] + second + first + data[16 + 2 * block:])
+
+        with pytest.raises(Exception):
+            encryptor.decrypt_file(str(encrypted), str(work_dir / 'reordered.out'))
+
+    def test_invalid_chunk_size_rejected(self, temp_dir):
+        """Test chunk sizes outside the supported range"""
+        with pytest.raises(ValueError):
+            self._roundtrip(temp_dir('chunked'), b'data', chunk_size=16)
+
+
 @pytest.mark.unit
 @pytest.mark.phase2
 @pytest.mark.security
@@ -577,6 +653,178 @@ class TestFullWorkflow:
         assert len(temp_dirs) == 0
 
 
+@pytest.mark.unit
+@pytest.mark.phase2
+@pytest.mark.security
+class TestStreamingPipeline:
+    """Test the single-pass tar -> ZSTD -> AES-GCM pipeline"""
+
+    def _source(self, work_dir):
+        source_dir = work_dir / 'source'
+        (source_dir / 'sub').mkdir(parents=True)
+        (source_dir / 'notes.txt').write_text('Content 1')
+        # Incompressible and larger than one encryption chunk
+        (source_dir / 'sub' / 'blob.bin').write_bytes(os.urandom(3 * 1024 * 1024 + 7))
+        return source_dir
+
+    def test_create_writes_no_intermediate_files(self, temp_dir, monkeypatch):
+        """Test archive creation never touches disk besides the outputs"""
+        work_dir = temp_dir('pipeline')
+        source_dir = self._source(work_dir)
+        out_dir = work_dir / 'out'
+        out_dir.mkdir()
+
+        encryptor = ArchiveEncryption(key_file=None, verbose=False)
+        monkeypatch.setattr(encryptor, 'create_tar_archive', None)
+        monkeypatch.setattr(encryptor, 'compress_file', None)
+        encryptor.create_encrypted_archive(str(source_dir), str(out_dir / 'archive.enc'))
+
+        assert sorted(p.name for p in out_dir.iterdir()) == ['archive.enc', 'archive.json']
+
+    def test_roundtrip_multi_chunk(self, temp_dir):
+        """Test extraction reproduces files spanning several chunks"""
+        work_dir = temp_dir('pipeline')
+        source_dir = self._source(work_dir)
+        archive = work_dir / 'archive.enc'
+
+        encryptor = ArchiveEncryption(key_file=None, verbose=False)
+        encryptor.create_encrypted_archive(str(source_dir), str(archive))
+        encryptor.extract_encrypted_archive(str(archive), str(work_dir / 'extracted'))
+
+        extracted = work_dir / 'extracted' / 'source'
+        assert (extracted / 'notes.txt').read_text() == 'Content 1'
+        assert (extracted / 'sub' / 'blob.bin').read_bytes() == (source_dir / 'sub' / 'blob.bin').read_bytes()
+        assert sorted(p.name for p in (work_dir / 'extracted').iterdir()) == ['source']
+
+    def test_extracts_legacy_archive(self, temp_dir):
+        """Test archives written by the old three-step workflow"""
+        work_dir = temp_dir('pipeline')
+        source_dir = self._source(work_dir)
+        encryptor = ArchiveEncryption(key_file=None, verbose=False)
+
+        tar_file = work_dir / 'legacy.tar'
+        zst_file = work_dir / 'legacy.tar.zst'
+        encryptor.create_tar_archive(str(source_dir), str(tar_file))
+        encryptor.compress_file(str(tar_file), str(zst_file))
+        nonce = os.urandom(12)
+        archive = work_dir / 'legacy.enc'
+        archive.write_bytes(nonce + encryptor.cipher.encrypt(nonce, zst_file.read_bytes(), None))
+
+        encryptor.extract_encrypted_archive(str(archive), str(work_dir / 'extracted'))
+        assert (work_dir / 'extracted' / 'source' / 'notes.txt').read_text() == 'Content 1'
+
+    def test_failed_create_removes_output(self, temp_dir):
+        """Test a failure mid-stream leaves no partial archive"""
+        work_dir = temp_dir('pipeline')
+        source_dir = self._source(work_dir)
+        archive = work_dir / 'archive.enc'
+        encryptor = ArchiveEncryption(key_file=None, verbose=False)
+
+        def add_then_fail(tar, source_path, checksums=None):
+            tar.add(source_dir / 'sub' / 'blob.bin', arcname='blob.bin')
+            raise OSError('disk full')
+
+        encryptor._add_tree = add_then_fail
+        with pytest.raises(OSError):
+            encryptor.create_encrypted_archive(str(source_dir), str(archive))
+        assert not archive.exists()
+
+    @pytest.mark.parametrize('damage', ['tampered', 'truncated'])
+    def test_failed_extract_leaves_output_empty(self, temp_dir, damage, capsys):
+        """Test nothing is extracted unless the whole archive authenticates"""
+        from encryption_utils import CHUNK_SIZE
+        work_dir = temp_dir('pipeline')
+        source_dir = self._source(work_dir)
+        archive = work_dir / 'archive.enc'
+        encryptor = ArchiveEncryption(key_file=None, verbose=False)
+        encryptor.create_encrypted_archive(str(source_dir), str(archive))
+
+        data = bytearray(archive.read_bytes())
+        if damage == 'tampered':
+            data[-5] ^= 0x01  # Final chunk's tag
+        else:
+            del data[16 + 2 * (CHUNK_SIZE + 16):]  # Drop the final chunks
+        archive.write_bytes(bytes(data))
+
+        out_dir = work_dir / 'out'
+        encryptor.verbose = True
+        with pytest.raises(Exception):
+            encryptor.extract_encrypted_archive(str(archive), str(out_dir))
+        assert list(out_dir.iterdir()) == []
+        assert '[ERR] Decryption failed' in capsys.readouterr().out
+
+    def test_metadata_records_merkle_root(self, temp_dir):
+        """Test the metadata root matches IntegrityChecker's root for the source"""
+        import json
+        from integrity_checker import IntegrityChecker
+
+        work_dir = temp_dir('pipeline')
+        source_dir = self._source(work_dir)
+        manifest = IntegrityChecker(verbose=False).create_integrity_file(str(source_dir))
+        archive = work_dir / 'archive.enc'
+
+        encryptor = ArchiveEncryption(key_file=None, verbose=False)
+        encryptor.create_encrypted_archive(str(source_dir), str(archive))
+
+        metadata = json.loads(archive.with_suffix('.json').read_text())
+        assert metadata['merkle_root'] == manifest['merkle_root']
+        assert metadata['file_count'] == 2
+
+        # The extracted copy carries the same root
+        encryptor.extract_encrypted_archive(str(archive), str(work_dir / 'extracted'))
+        restored = IntegrityChecker(verbose=False).compare_archives(
+            str(source_dir), str(work_dir / 'extracted' / 'source')
+        )
+        assert restored == []
+
+
+@pytest.mark.unit
+@pytest.mark.phase2
+@pytest.mark.security
+class TestThreading:
+    """Test multi-threaded ZSTD and parallel chunk encryption"""
+
+    def test_threads_zero_uses_all_cores(self):
+        """Test threads=0 resolves to the CPU count"""
+        encryptor = ArchiveEncryption(key_file=None, verbose=False, threads=0)
+        assert encryptor.threads == (os.cpu_count() or 1)
+
+    def test_parallel_encryption_roundtrip(self, temp_dir):
+        """Test chunks sealed on a pool decrypt in order, single-threaded"""
+        work_dir = temp_dir('threads')
+        data = os.urandom(20 * 4096 + 123)
+        plain = work_dir / 'plain.bin'
+        plain.write_bytes(data)
+
+        parallel = ArchiveEncryption(key_file=None, verbose=False, threads=4)
+        parallel.encrypt_file(str(plain), str(work_dir / 'plain.enc'), chunk_size=4096)
+
+        serial = ArchiveEncryption(key_file=None, verbose=False)
+        serial.key, serial.cipher = parallel.key, parallel.cipher
+        serial.decrypt_file(str(work_dir / 'plain.enc'), str(work_dir / 'plain.out'))
+        assert (work_dir / 'plain.out').read_bytes() == data
+
+    def test_threaded_archive_roundtrip(self, temp_dir):
+        """Test multi-threaded ZSTD frames extract normally"""
+        work_dir = temp_dir('threads')
+        source_dir = work_dir / 'source'
+        source_dir.mkdir()
+        (source_dir / 'log.txt').write_text('line\n' * 200000)
+
+        encryptor = ArchiveEncryption(key_file=None, verbose=False, threads=3)
+        encryptor.create_encrypted_archive(str(source_dir), str(work_dir / 'archive.enc'))
+        encryptor.extract_encrypted_archive(str(work_dir / 'archive.enc'), str(work_dir / 'out'))
+
+        assert (work_dir / 'out' / 'source' / 'log.txt').read_text() == 'line\n' * 200000
+
+    def test_benchmark_reports_each_thread_count(self):
+        """Test the throughput benchmark runs"""
+        from encryption_utils import benchmark_throughput
+        results = benchmark_throughput(size_mb=2, thread_counts=(1, 2))
+        assert [r['threads'] for r in results] == [1, 2]
+        assert all(r['mb_per_sec'] > 0 for r in results)
+
+
 @pytest.mark.unit
 @pytest.mark.phase2
 class TestLogging:
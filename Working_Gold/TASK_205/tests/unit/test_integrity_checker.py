@@ -5,12 +5,13 @@ Tests CRITICAL-6 Fix: No Backup Integrity Verification (CVSS 6.5)
 """
 import pytest
 import sys
+import os
 import json
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / 'TASK_204' / 'scripts'))
 
-from integrity_checker import IntegrityChecker
+from integrity_checker import IntegrityChecker, build_merkle_tree
 
 
 @pytest.mark.unit
@@ -241,4 +242,222 @@ class TestVerifyIntegrity:
         assert len(errors) == 0
 
 
-# Total: 15 test methods
+
+def _age(path, seconds=10):
+    """Backdate a file so it is older than any manifest written after it"""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 10**9))
+
+
+@pytest.mark.unit
+@pytest.mark.phase2
+@pytest.mark.security
+class TestIncrementalIntegrity:
+    """Test manifest reuse, parallel hashing and archive scans"""
+
+    def _archive(self, temp_dir, count=5):
+        archive_dir = temp_dir('integrity_test') / 'archive'
+        (archive_dir / 'sub').mkdir(parents=True)
+        for i in range(count):
+            path = archive_dir / ('sub' if i % 2 else '.') / f'file{i}.txt'
+            path.write_text(f'Content {i}')
+            _age(path)
+        return archive_dir
+
+    def test_manifest_records_stat_signature(self, temp_dir):
+        """Test entries carry size, mtime_ns and inode"""
+        archive_dir = self._archive(temp_dir)
+        result = IntegrityChecker(verbose=False).create_integrity_file(str(archive_dir))
+
+        entry = result['files']['file0.txt']
+        st = os.stat(archive_dir / 'file0.txt')
+        assert entry['size'] == st.st_size
+        assert entry['mtime_ns'] == st.st_mtime_ns
+        assert entry['inode'] == st.st_ino
+        assert 'modified' in entry
+
+    def test_verify_skips_unchanged_files(self, temp_dir, monkeypatch):
+        """Test verify does not re-hash files whose signature matches"""
+        archive_dir = self._archive(temp_dir)
+        checker = IntegrityChecker(verbose=False)
+        checker.create_integrity_file(str(archive_dir))
+
+        hashed = []
+        original = checker.generate_checksum
+        monkeypatch.setattr(checker, 'generate_checksum', lambda p: hashed.append(p) or original(p))
+
+        assert checker.verify_integrity(str(archive_dir)) == (True, [])
+        assert hashed == []
+
+    def test_full_rehashes_everything(self, temp_dir, monkeypatch):
+        """Test full=True ignores stored signatures"""
+        archive_dir = self._archive(temp_dir)
+        IntegrityChecker(verbose=False).create_integrity_file(str(archive_dir))
+
+        checker = IntegrityChecker(verbose=False, full=True)
+        hashed = []
+        original = checker.generate_checksum
+        monkeypatch.setattr(checker, 'generate_checksum', lambda p: hashed.append(p) or original(p))
+
+        assert checker.verify_integrity(str(archive_dir)) == (True, [])
+        assert len(hashed) == 5
+
+    def test_full_detects_tampering_with_restored_mtime(self, temp_dir):
+        """Test same-size tampering with a restored mtime is caught by full only"""
+        archive_dir = self._archive(temp_dir)
+        IntegrityChecker(verbose=False).create_integrity_file(str(archive_dir))
+
+        target = archive_dir / 'file0.txt'
+        st = os.stat(target)
+        target.write_text('Content X')
+        os.utime(target, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert IntegrityChecker(verbose=False).verify_integrity(str(archive_dir))[0] is True
+        is_valid, errors = IntegrityChecker(verbose=False, full=True).verify_integrity(str(archive_dir))
+        assert is_valid is False
+        assert errors == ['Checksum mismatch: file0.txt']
+
+    def test_create_reuses_unchanged_checksums(self, temp_dir, monkeypatch):
+        """Test re-creating the manifest only hashes new and changed files"""
+        archive_dir = self._archive(temp_dir)
+        checker = IntegrityChecker(verbose=False)
+        checker.create_integrity_file(str(archive_dir))
+
+        (archive_dir / 'file0.txt').write_text('Changed content')
+        (archive_dir / 'new.txt').write_text('New file')
+
+        hashed = []
+        original = checker.generate_checksum
+        monkeypatch.setattr(checker, 'generate_checksum', lambda p: hashed.append(Path(p).name) or original(p))
+
+        result = checker.create_integrity_file(str(archive_dir))
+
+        assert sorted(hashed) == ['file0.txt', 'new.txt']
+        assert len(result['files']) == 6
+        assert checker.verify_integrity(str(archive_dir)) == (True, [])
+
+    def test_parallel_workers_match_serial(self, temp_dir):
+        """Test checksums are identical with one and many workers"""
+        archive_dir = self._archive(temp_dir, count=20)
+        serial = IntegrityChecker(verbose=False, workers=1, full=True).create_integrity_file(str(archive_dir))
+        parallel = IntegrityChecker(verbose=False, workers=8, full=True).create_integrity_file(str(archive_dir))
+
+        assert {k: v['sha256'] for k, v in serial['files'].items()} == \
+            {k: v['sha256'] for k, v in parallel['files'].items()}
+        assert list(serial['files']) == list(parallel['files'])
+
+    def test_scan_all_archives_in_parallel(self, temp_dir, capsys):
+        """Test scan_all creates and verifies every archive, printing a summary"""
+        base_dir = temp_dir('integrity_scan')
+        for n in range(6):
+            task = base_dir / f'TASK_{n:03d}'
+            task.mkdir()
+            (task / 'notes.md').write_text(f'Task {n}')
+
+        checker = IntegrityChecker(verbose=True, workers=4)
+        checker.scan_all_archives(str(base_dir), create=True)
+        assert all((base_dir / f'TASK_{n:03d}' / 'integrity.json').exists() for n in range(6))
+
+        (base_dir / 'TASK_002' / 'notes.md').write_text('Tampered!')
+        capsys.readouterr()
+        checker.scan_all_archives(str(base_dir))
+        out = capsys.readouterr().out
+
+        assert 'Archives processed: 5' in out
+        assert 'Archives failed: 1' in out
+        assert 'files/s' in out and 'MB/s' in out
+
+
+
+@pytest.mark.unit
+@pytest.mark.phase2
+@pytest.mark.security
+class TestMerkleTree:
+    """Test Merkle tree manifests, archive comparison and subtree verification"""
+
+    def _archive(self, work_dir, name='archive'):
+        archive_dir = work_dir / name
+        (archive_dir / 'docs' / 'deep').mkdir(parents=True)
+        (archive_dir / 'logs').mkdir()
+        (archive_dir / 'README.md').write_text('Top')
+        (archive_dir / 'docs' / 'a.md').write_text('A')
+        (archive_dir / 'docs' / 'deep' / 'b.md').write_text('B')
+        (archive_dir / 'logs' / 'run.log').write_text('Log')
+        IntegrityChecker(verbose=False).create_integrity_file(str(archive_dir))
+        return archive_dir
+
+    def test_manifest_has_directory_hashes(self, temp_dir):
+        """Test integrity.json stores a root and one hash per directory"""
+        archive_dir = self._archive(temp_dir('merkle'))
+        data = json.loads((archive_dir / 'integrity.json').read_text())
+
+        assert set(data['merkle_tree']) == {'.', 'docs', 'docs/deep', 'logs'}
+        assert data['merkle_root'] == data['merkle_tree']['.']
+
+    def test_subtree_hash_independent_of_siblings(self):
+        """Test a directory's hash only depends on files beneath it"""
+        base = {os.path.join('docs', 'a.md'): 'a' * 64, os.path.join('logs', 'x'): 'b' * 64}
+        changed = dict(base)
+        changed[os.path.join('logs', 'x')] = 'c' * 64
+
+        before, after = build_merkle_tree(base), build_merkle_tree(changed)
+        assert before['docs'] == after['docs']
+        assert before['logs'] != after['logs']
+        assert before['.'] != after['.']
+
+    def test_compare_identical_archives(self, temp_dir):
+        """Test identical archives compare equal by root"""
+        work_dir = temp_dir('merkle')
+        a = self._archive(work_dir, 'a')
+        b = self._archive(work_dir, 'b')
+
+        assert IntegrityChecker(verbose=False).compare_archives(str(a), str(b)) == []
+
+    def test_compare_reports_changed_added_removed(self, temp_dir):
+        """Test compare lists exactly the differing files"""
+        work_dir = temp_dir('merkle')
+        a = self._archive(work_dir, 'a')
+        b = self._archive(work_dir, 'b')
+        (b / 'docs' / 'deep' / 'b.md').write_text('Changed')
+        (b / 'logs' / 'run.log').unlink()
+        (b / 'new.txt').write_text('New')
+        IntegrityChecker(verbose=False).create_integrity_file(str(b))
+
+        changed = IntegrityChecker(verbose=False).compare_archives(str(a), str(b))
+        assert changed == [
+            os.path.join('docs', 'deep', 'b.md'),
+            os.path.join('logs', 'run.log'),
+            'new.txt',
+        ]
+
+    def test_verify_subtree_only_hashes_subtree(self, temp_dir, monkeypatch):
+        """Test subtree verification ignores files outside the subtree"""
+        archive_dir = self._archive(temp_dir('merkle'))
+        (archive_dir / 'logs' / 'run.log').write_text('Tampered')
+
+        checker = IntegrityChecker(verbose=False)
+        hashed = []
+        original = checker.generate_checksum
+        monkeypatch.setattr(checker, 'generate_checksum', lambda p: hashed.append(Path(p).name) or original(p))
+
+        assert checker.verify_subtree(str(archive_dir), 'docs') == (True, [])
+        assert sorted(hashed) == ['a.md', 'b.md']
+
+    def test_verify_subtree_after_partial_restore(self, temp_dir):
+        """Test subtree verification reports missing, changed and extra files"""
+        archive_dir = self._archive(temp_dir('merkle'))
+        (archive_dir / 'docs' / 'a.md').unlink()
+        (archive_dir / 'docs' / 'deep' / 'b.md').write_text('Wrong')
+        (archive_dir / 'docs' / 'extra.md').write_text('Extra')
+
+        is_valid, errors = IntegrityChecker(verbose=False).verify_subtree(str(archive_dir), 'docs')
+
+        assert is_valid is False
+        assert sorted(errors) == sorted([
+            f"Missing file: {os.path.join('docs', 'a.md')}",
+            f"Checksum mismatch: {os.path.join('docs', 'deep', 'b.md')}",
+            f"Unexpected file: {os.path.join('docs', 'extra.md')}",
+        ])
+
+
+# Total: 27 test methods
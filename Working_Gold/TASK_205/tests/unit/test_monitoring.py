@@ -0,0 +1,137 @@
+"""
+Unit tests for api/monitoring.py
+TASK_205 Phase 2 - Testing Infrastructure Foundation
+Tests TASK_210 latency histograms, sliding windows and per-thread shards
+"""
+import pytest
+import sys
+import random
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / 'TASK_206'))
+
+from api.monitoring import (
+    MetricsCollector, _Ring, _bucket, _new_counts, _quantile, bucket_upper_bound,
+    BUCKETS, GROWTH, MIN_DURATION, MAX_DURATION, MAX_ENDPOINTS, OTHER_ENDPOINT,
+)
+
+
+@pytest.mark.unit
+@pytest.mark.phase2
+class TestHistogramBuckets:
+    """Test _bucket() and _quantile()"""
+
+    def test_bucket_bounds_contain_duration(self):
+        """Test every duration falls between its bucket's lower and upper bound"""
+        rng = random.Random(1)
+        for _ in range(5000):
+            duration = 10 ** rng.uniform(-5, 2)
+            i = _bucket(duration)
+            assert duration <= bucket_upper_bound(i) * (1 + 1e-9)
+            if i > 0:
+                assert duration > bucket_upper_bound(i - 1) * (1 - 1e-9)
+
+    def test_bucket_clamps_out_of_range(self):
+        """Test tiny and huge durations land in the first and last bucket"""
+        assert _bucket(0.0) == 0
+        assert _bucket(MIN_DURATION / 10) == 0
+        assert _bucket(MAX_DURATION * 10) == BUCKETS - 1
+
+    def test_quantile_within_bucket_error(self):
+        """Test quantiles are within GROWTH/2 of the exact value"""
+        rng = random.Random(2)
+        durations = sorted(rng.lognormvariate(-4, 1.5) for _ in range(20000))
+        counts = _new_counts()
+        for duration in durations:
+            counts[_bucket(duration)] += 1
+        for q in (0.5, 0.9, 0.99):
+            exact = durations[int(q * len(durations)) - 1]
+            estimate = _quantile(counts, len(durations), q)
+            assert abs(estimate - exact) / exact <= (GROWTH - 1) / 2 + 0.01
+
+    def test_quantile_single_value(self):
+        """Test a single repeated duration is reported for every quantile"""
+        counts = _new_counts()
+        counts[_bucket(0.2)] += 10
+        for q in (0.5, 0.99):
+            assert abs(_quantile(counts, 10, q) - 0.2) / 0.2 <= (GROWTH - 1) / 2
+
+
+@pytest.mark.unit
+@pytest.mark.phase2
+class TestRing:
+    """Test _Ring sliding windows"""
+
+    def test_counts_within_window(self):
+        """Test slots inside the window are merged"""
+        ring = _Ring(10, 30)
+        ring.add(1000.0, 3, False)
+        ring.add(1045.0, 3, True)
+        out = _new_counts()
+        ring.merge_into(out, 1050.0, 60)
+        assert out[3] == 2
+        assert out[BUCKETS] == 1
+
+    def test_old_slots_expire(self):
+        """Test slots older than the window are left out"""
+        ring = _Ring(10, 30)
+        ring.add(1000.0, 3, False)
+        ring.add(1100.0, 4, False)
+        out = _new_counts()
+        ring.merge_into(out, 1100.0, 60)
+        assert out[3] == 0
+        assert out[4] == 1
+
+    def test_reused_slot_drops_previous_lap(self):
+        """Test a slot reused after wrapping starts from zero"""
+        ring = _Ring(10, 30)
+        ring.add(1000.0, 3, True)
+        ring.add(1300.0, 5, False)  # Same slot, 30 epochs later
+        out = _new_counts()
+        ring.merge_into(out, 1300.0, 300)
+        assert out[3] == 0
+        assert out[5] == 1
+        assert out[BUCKETS] == 0
+
+
+@pytest.mark.unit
+@pytest.mark.phase2
+class TestMetricsCollector:
+    """Test per-thread shards and endpoint cap"""
+
+    def test_merges_thread_shards(self):
+        """Test requests recorded from several threads are all counted"""
+        collector = MetricsCollector()
+        barrier = threading.Barrier(8)
+
+        def worker(n):
+            barrier.wait()
+            for i in range(500):
+                collector.record_request("/api/v1/tasks", "GET", 0.01, 500 if i % 10 == n else 200)
+            collector.record_security_op("validate", True)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        endpoint = collector.get_api_metrics()["GET:/api/v1/tasks"]
+        assert endpoint["total_requests"] == 4000
+        assert endpoint["errors"] == 400
+        assert endpoint["windows"]["1m"]["requests"] == 4000
+        assert collector.get_security_metrics() == {"validate:success": 8}
+        assert 'api_requests_total{method="GET",endpoint="/api/v1/tasks"} 4000' in collector.render_prometheus()
+
+    def test_endpoint_cap_folds_into_other(self):
+        """Test endpoints past MAX_ENDPOINTS share one entry"""
+        collector = MetricsCollector()
+        for i in range(MAX_ENDPOINTS + 50):
+            collector.record_request(f"/path/{i}", "GET", 0.001, 404)
+        api = collector.get_api_metrics()
+        assert len(api) == MAX_ENDPOINTS + 1
+        assert api[OTHER_ENDPOINT]["total_requests"] == 50
+
+
+# Total: 9 test methods
@@ -113,4 +113,148 @@ class TestSecureLogger:
         assert 'Console message' in captured.out
 
 
-# Total: 8 test methods
+
+@pytest.mark.unit
+@pytest.mark.phase2
+@pytest.mark.security
+class TestAsyncSecureLogger:
+    """Test the queued (background listener) logging pipeline"""
+
+    def _logger(self, temp_dir, **kwargs):
+        log_file = temp_dir('logging_test') / 'test.log'
+        logger = SecureLogger('test_async_logger', log_file=str(log_file), console=False,
+                              async_queue=True, **kwargs)
+        return logger, log_file
+
+    def test_async_logger_sanitizes_on_listener_thread(self, temp_dir, monkeypatch):
+        """Test records are sanitized off the calling thread"""
+        import threading
+        import secure_logging
+
+        threads = []
+        original = secure_logging.InputValidator.sanitize_log_message
+        monkeypatch.setattr(secure_logging.InputValidator, 'sanitize_log_message',
+                            lambda m: threads.append(threading.current_thread().name) or original(m))
+
+        logger, log_file = self._logger(temp_dir)
+        logger.info('User %s password=%s', 'alice', 'secret123')
+        logger.flush()
+
+        content = log_file.read_text()
+        assert 'User alice password=***' in content
+        assert 'secret123' not in content
+        assert threads == ['secure-log-listener']
+        logger.close()
+
+    def test_async_logger_keeps_order_and_levels(self, temp_dir):
+        """Test batched writes keep record order and the handler level"""
+        log_file = temp_dir('logging_test') / 'test.log'
+        logger = SecureLogger('test_async_logger', log_file=str(log_file), console=False,
+                              level=logging.WARNING, async_queue=True)
+        for i in range(500):
+            logger.warning('message %d', i)
+        logger.info('filtered out')
+        logger.close()
+
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == 500
+        assert [line.rsplit(' ', 1)[1] for line in lines] == [str(i) for i in range(500)]
+
+    def test_drop_policy_counts_and_reports(self, temp_dir):
+        """Test a full queue drops records and the listener logs how many"""
+        import threading
+        import time
+
+        logger, log_file = self._logger(temp_dir, queue_size=1, overflow='drop')
+        listener = logger._listener
+        release = threading.Event()
+        write = listener._write
+        listener._write = lambda records: release.wait(5) and write(records)
+
+        logger.info('first')
+        while not listener.queue.empty():
+            time.sleep(0.001)
+        logger.info('second')   # queued
+        logger.info('third')    # dropped
+        logger.info('fourth')   # dropped
+        assert logger.dropped == 2
+
+        release.set()
+        logger.close()
+        content = log_file.read_text()
+        assert 'first' in content and 'second' in content
+        assert 'third' not in content
+        assert 'dropped 2 records' in content
+
+    def test_block_policy_loses_nothing(self, temp_dir):
+        """Test overflow='block' waits for room instead of dropping"""
+        logger, log_file = self._logger(temp_dir, queue_size=2, overflow='block')
+        for i in range(200):
+            logger.info('record %d', i)
+        logger.close()
+
+        assert logger.dropped == 0
+        assert len(log_file.read_text().splitlines()) == 200
+
+    def test_close_flushes_and_falls_back_to_sync(self, temp_dir):
+        """Test close writes queued records and later records still reach the file"""
+        logger, log_file = self._logger(temp_dir)
+        logger.info('before close')
+        logger.close()
+        assert 'before close' in log_file.read_text()
+
+        logger.info('after close')
+        for handler in logger.logger.handlers:
+            handler.flush()
+        assert 'after close' in log_file.read_text()
+
+    def test_invalid_overflow_policy(self, temp_dir):
+        """Test an unknown overflow policy is rejected"""
+        with pytest.raises(ValueError):
+            self._logger(temp_dir, overflow='spill')
+
+    def test_extra_handlers_get_sanitized_messages(self, temp_dir):
+        """Test non-stream extra handlers receive sanitized records via the listener"""
+        class ListHandler(logging.Handler):
+            def __init__(self):
+                super().__init__()
+                self.messages = []
+
+            def emit(self, record):
+                self.messages.append(self.format(record))
+
+        sink = ListHandler()
+        logger, log_file = self._logger(temp_dir, extra_handlers=[sink])
+        logger.info('token for %s: password=%s', 'bob', 'hunter2')
+        logger.debug('below level')
+        logger.close()
+
+        assert sink.messages == ['token for bob: password=***']
+        assert 'password=***' in log_file.read_text()
+
+    def test_formatter_error_does_not_stop_listener(self, temp_dir, monkeypatch):
+        """Test a record that fails to format is skipped and later records are written"""
+        monkeypatch.setattr(logging, 'raiseExceptions', False)
+        logger, log_file = self._logger(temp_dir)
+        handler = logger._listener.handlers[0]
+        original = handler.formatter.format
+
+        def format(record):
+            if 'bad' in record.getMessage():
+                raise ValueError('formatter failure')
+            return original(record)
+
+        monkeypatch.setattr(handler.formatter, 'format', format)
+        logger.info('before')
+        logger.info('bad record')
+        logger.flush()
+        assert logger._listener._thread.is_alive()
+        logger.info('after')
+        logger.close()
+
+        content = log_file.read_text()
+        assert 'before' in content and 'after' in content
+        assert 'bad record' not in content
+
+
+# Total: 16 test methods
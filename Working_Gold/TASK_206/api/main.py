@@ -5,7 +5,7 @@ Uses existing security skills from TASK_204
 """
 import time
 from fastapi import FastAPI, HTTPException, UploadFile, File, Depends, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
 from typing import Optional, List
@@ -20,10 +20,10 @@ from ai_employee_security import PathValidator, ArchiveEncryption, IntegrityChec
 from api.database import get_db, init_db, seed_existing_tasks, Task, SecurityLog, SessionLocal
 
 # Import TASK_210: Monitoring
-from api.monitoring import metrics
+from api.monitoring import metrics, UNMATCHED_ENDPOINT
 
 # Import TASK_213: Platinum Tier
-from api.platinum_router import router as platinum_router
+from api.platinum_router import router as platinum_router, platinum_gauges
 
 # ========== APP SETUP ==========
 
@@ -52,7 +52,11 @@ async def track_requests(request: Request, call_next):
     start = time.time()
     response = await call_next(request)
     duration = time.time() - start
-    metrics.record_request(request.url.path, request.method, duration, response.status_code)
+    # Route template ("/api/v1/tasks/{task_id}") keeps one entry per endpoint;
+    # never the raw URL, so 404 scans can't fill the endpoint table
+    route = request.scope.get("route")
+    path = getattr(route, "path", UNMATCHED_ENDPOINT)
+    metrics.record_request(path, request.method, duration, response.status_code)
     return response
 
 
@@ -66,6 +70,13 @@ async def startup():
         seed_existing_tasks(db)
     finally:
         db.close()
+    metrics.add_gauge_source(platinum_gauges)
+    metrics.start_sampler()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    metrics.stop_sampler()
 
 
 # ========== SCHEMAS ==========
@@ -119,7 +130,8 @@ async def root():
             "health": "/health",
             "security": "/api/v1/security/*",
             "tasks": "/api/v1/tasks",
-            "metrics": "/api/v1/metrics"
+            "metrics": "/api/v1/metrics",
+            "prometheus": "/metrics"
         }
     }
 
@@ -357,9 +369,15 @@ async def get_metrics():
     return metrics.get_dashboard_data()
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Prometheus text exposition of request, security, system and Platinum metrics"""
+    return PlainTextResponse(metrics.render_prometheus(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 @app.get("/api/v1/metrics/system")
 async def get_system_metrics():
-    """Get system resource metrics (CPU, Memory, Disk)"""
+    """Get system resource metrics (CPU, Memory, Disk), sampled in the background"""
     return metrics.get_system_metrics()
 
 
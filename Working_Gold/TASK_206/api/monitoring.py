@@ -2,71 +2,436 @@
 TASK_210: Monitoring & Observability
 Prometheus metrics + system health monitoring
 Uses existing skills: SecureLogging for safe log output
+
+Request durations go into fixed-size, log-bucketed histograms: bucket i
+holds durations up to MIN_DURATION * GROWTH**i, so memory per endpoint is
+constant and quantiles are within GROWTH/2 (~7%) of the true value.
+Besides lifetime totals, each endpoint keeps rings of per-slot histograms
+(10s slots for 5 minutes, 1m slots for an hour) for the 1m/5m/1h windows.
+
+Every thread records into its own shard, so record_request() takes no
+lock and never waits on other requests; readers merge the shards.
+
+render_prometheus() serves /metrics in the Prometheus text format. Request
+counts also go into fixed PROMETHEUS_BUCKETS at record time, so a scrape
+only merges and prints counters. System gauges and registered gauge
+sources (Platinum queues, sync timings) are sampled by a background
+thread (start_sampler()) and kept as pre-rendered text.
 """
+import math
 import time
+import logging
+import threading
 import psutil
+from array import array
+from bisect import bisect_left
 from datetime import datetime, timedelta
 from collections import defaultdict
 from functools import wraps
 
+MIN_DURATION = 1e-5   # 10us; anything faster lands in bucket 0
+MAX_DURATION = 100.0  # Anything slower lands in the last bucket
+GROWTH = 1.15         # Upper bound ratio between neighbouring buckets
+BUCKETS = int(math.ceil(math.log(MAX_DURATION / MIN_DURATION, GROWTH))) + 1
+_LOG_GROWTH = math.log(GROWTH)
+_ERRORS = BUCKETS     # Slot arrays carry the error count after the buckets
+
+WINDOWS = {"1m": 60, "5m": 300, "1h": 3600}
+_RINGS = ((10, 30), (60, 60))  # (slot seconds, slots): 5m at 10s, 1h at 1m
+
+MAX_ENDPOINTS = 200   # Further endpoints share one entry
+OTHER_ENDPOINT = "other"
+UNMATCHED_ENDPOINT = "unmatched"  # Requests no route matched (404 scans)
+QUANTILES = (0.5, 0.9, 0.99)
+
+# Request latency histogram bounds for /metrics (prometheus_client defaults)
+PROMETHEUS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+SAMPLE_INTERVAL = 15.0  # Seconds between background gauge samples
+
+logger = logging.getLogger(__name__)
+
+
+def _bucket(duration: float) -> int:
+    if duration <= MIN_DURATION:
+        return 0
+    return min(int(math.ceil(math.log(duration / MIN_DURATION) / _LOG_GROWTH)), BUCKETS - 1)
+
+
+def bucket_upper_bound(i: int) -> float:
+    """Largest duration (seconds) counted in bucket i"""
+    return math.inf if i == BUCKETS - 1 else MIN_DURATION * GROWTH ** i
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_families(families) -> str:
+    """Prometheus text format for [(name, type, help, [(sample_name, labels, value)])]"""
+    lines = []
+    for name, kind, help_text, samples in families:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for sample_name, labels, value in samples:
+            label_text = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+            lines.append(f"{sample_name}{{{label_text}}} {_format_value(value)}" if label_text
+                         else f"{sample_name} {_format_value(value)}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def histogram_samples(name: str, labels: dict, bounds, counts, total: float) -> list:
+    """Samples of one histogram from per-bucket counts (len(bounds) + 1, last is +Inf)"""
+    samples = []
+    cumulative = 0
+    for bound, count in zip(list(bounds) + [math.inf], counts):
+        cumulative += count
+        samples.append((f"{name}_bucket", {**labels, "le": _format_value(float(bound))}, cumulative))
+    samples.append((f"{name}_sum", labels, total))
+    samples.append((f"{name}_count", labels, cumulative))
+    return samples
+
+
+def _new_counts() -> array:
+    return array('Q', bytes(8 * (BUCKETS + 1)))
+
+
+def _quantile(counts, total: int, q: float) -> float:
+    """Duration (seconds) at quantile q: geometric middle of its bucket"""
+    rank = q * total
+    seen = 0
+    for i in range(BUCKETS):
+        seen += counts[i]
+        if seen >= rank and seen:
+            if i == 0:
+                return MIN_DURATION
+            return MIN_DURATION * GROWTH ** (i - 0.5)
+    return MAX_DURATION
+
+
+class _Ring:
+    """Per-slot histograms for the last len(slots) * width seconds"""
+
+    __slots__ = ("width", "epochs", "slots")
+
+    def __init__(self, width: int, size: int):
+        self.width = width
+        self.epochs = [-1] * size
+        self.slots = [None] * size
+
+    def add(self, now: float, bucket: int, error: bool):
+        epoch = int(now) // self.width
+        s = epoch % len(self.epochs)
+        slot = self.slots[s]
+        if self.epochs[s] != epoch:
+            # Fresh counts go in before the new epoch, so a reader never
+            # counts the old slot's data in the current window
+            slot = self.slots[s] = _new_counts()
+            self.epochs[s] = epoch
+        slot[bucket] += 1
+        if error:
+            slot[_ERRORS] += 1
+
+    def merge_into(self, out: array, now: float, seconds: int):
+        current = int(now) // self.width
+        oldest = current - (seconds + self.width - 1) // self.width + 1
+        for epoch, slot in zip(self.epochs, self.slots):
+            if slot is not None and oldest <= epoch <= current:
+                for i, count in enumerate(slot):
+                    if count:
+                        out[i] += count
+
+
+class _EndpointShard:
+    """One thread's counts for one endpoint (written only by that thread)"""
+
+    __slots__ = ("count", "errors", "total", "min", "max", "counts", "le_counts", "rings")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.counts = _new_counts()
+        self.le_counts = array('Q', bytes(8 * (len(PROMETHEUS_BUCKETS) + 1)))
+        self.rings = [_Ring(width, size) for width, size in _RINGS]
+
+    def record(self, duration: float, error: bool, now: float):
+        bucket = _bucket(duration)
+        self.count += 1
+        self.total += duration
+        if duration < self.min:
+            self.min = duration
+        if duration > self.max:
+            self.max = duration
+        self.counts[bucket] += 1
+        self.le_counts[bisect_left(PROMETHEUS_BUCKETS, duration)] += 1
+        if error:
+            self.errors += 1
+        for ring in self.rings:
+            ring.add(now, bucket, error)
+
+
+class _ThreadStats:
+    """Everything one thread records"""
+
+    def __init__(self):
+        self.endpoints = {}
+        self.security_operations = defaultdict(int)
+
 
 class MetricsCollector:
     """Collect and serve application metrics"""
 
     def __init__(self):
-        self.request_count = defaultdict(int)
-        self.request_duration = defaultdict(list)
-        self.error_count = defaultdict(int)
         self.start_time = datetime.utcnow()
-        self.security_operations = defaultdict(int)
+        self._local = threading.local()
+        self._lock = threading.Lock()   # Only for new threads and endpoints
+        self._threads = []
+        self._endpoints = set()
+        self._gauge_sources = []
+        self._line_prefixes = {}
+        self._system = None
+        self._gauge_text = ""
+        self._sampler = None
+        self._stop_sampler = threading.Event()
+
+    def _stats(self) -> _ThreadStats:
+        stats = getattr(self._local, "stats", None)
+        if stats is None:
+            stats = self._local.stats = _ThreadStats()
+            with self._lock:
+                self._threads.append(stats)
+        return stats
+
+    def _shard(self, stats: _ThreadStats, key: str) -> _EndpointShard:
+        with self._lock:
+            if key not in self._endpoints and len(self._endpoints) >= MAX_ENDPOINTS:
+                # Not cached under key, so stats.endpoints stays bounded too
+                shard = stats.endpoints.get(OTHER_ENDPOINT)
+                if shard is None:
+                    shard = stats.endpoints[OTHER_ENDPOINT] = _EndpointShard()
+                return shard
+            self._endpoints.add(key)
+        shard = stats.endpoints[key] = _EndpointShard()
+        return shard
 
     def record_request(self, endpoint: str, method: str, duration: float, status_code: int):
         """Record API request metrics"""
         key = f"{method}:{endpoint}"
-        self.request_count[key] += 1
-        self.request_duration[key].append(duration)
-
-        if status_code >= 400:
-            self.error_count[key] += 1
+        stats = self._stats()
+        shard = stats.endpoints.get(key)
+        if shard is None:
+            shard = self._shard(stats, key)
+        shard.record(duration, status_code >= 400, time.time())
 
     def record_security_op(self, operation: str, success: bool):
         """Record security operation"""
         key = f"{operation}:{'success' if success else 'failure'}"
-        self.security_operations[key] += 1
+        self._stats().security_operations[key] += 1
 
-    def get_system_metrics(self) -> dict:
-        """Get current system resource metrics"""
+    def _merged_endpoints(self) -> dict:
+        """{endpoint: [shards]} across all threads"""
+        with self._lock:
+            threads = list(self._threads)
+        merged = defaultdict(list)
+        for stats in threads:
+            for key, shard in stats.endpoints.copy().items():
+                merged[key].append(shard)
+        return merged
+
+    @staticmethod
+    def _sample_system() -> dict:
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage('/')
         return {
-            "cpu_percent": psutil.cpu_percent(interval=0.1),
+            # CPU use since the previous call, without blocking
+            "cpu_percent": psutil.cpu_percent(interval=None),
             "memory": {
-                "total_mb": round(psutil.virtual_memory().total / 1024 / 1024),
-                "used_mb": round(psutil.virtual_memory().used / 1024 / 1024),
-                "percent": psutil.virtual_memory().percent
+                "total_mb": round(memory.total / 1024 / 1024),
+                "used_mb": round(memory.used / 1024 / 1024),
+                "percent": memory.percent
             },
             "disk": {
-                "total_gb": round(psutil.disk_usage('/').total / 1024 / 1024 / 1024, 1),
-                "used_gb": round(psutil.disk_usage('/').used / 1024 / 1024 / 1024, 1),
-                "percent": psutil.disk_usage('/').percent
+                "total_gb": round(disk.total / 1024 / 1024 / 1024, 1),
+                "used_gb": round(disk.used / 1024 / 1024 / 1024, 1),
+                "percent": disk.percent
             }
         }
 
+    def get_system_metrics(self) -> dict:
+        """Get system resource metrics (latest background sample)"""
+        if self._system is None:
+            self._system = self._sample_system()
+        return self._system
+
+    def add_gauge_source(self, source):
+        """Register a callable returning metric families for each background sample
+
+        Families are (name, type, help, [(sample_name, labels, value)]) tuples,
+        as taken by render_families().
+        """
+        self._gauge_sources.append(source)
+
+    def sample_gauges(self):
+        """Sample system gauges and gauge sources into the cached /metrics text"""
+        system = self._sample_system()
+        families = [
+            ("system_cpu_percent", "gauge", "System CPU utilisation",
+             [("system_cpu_percent", {}, system["cpu_percent"])]),
+            ("system_memory_percent", "gauge", "System memory utilisation",
+             [("system_memory_percent", {}, system["memory"]["percent"])]),
+            ("system_disk_percent", "gauge", "Root filesystem utilisation",
+             [("system_disk_percent", {}, system["disk"]["percent"])]),
+        ]
+        for source in self._gauge_sources:
+            try:
+                families.extend(source())
+            except Exception as e:
+                logger.warning(f"Gauge source {getattr(source, '__name__', source)} failed: {e}")
+        self._system = system
+        self._gauge_text = render_families(families)
+
+    def _sample_loop(self, interval: float):
+        while True:
+            self.sample_gauges()
+            if self._stop_sampler.wait(interval):
+                return
+
+    def start_sampler(self, interval: float = SAMPLE_INTERVAL):
+        """Sample gauges every `interval` seconds on a daemon thread"""
+        if self._sampler is not None and self._sampler.is_alive():
+            return
+        psutil.cpu_percent(interval=None)  # Prime the non-blocking CPU reading
+        self._stop_sampler.clear()
+        self._sampler = threading.Thread(
+            target=self._sample_loop, args=(interval,), name="metrics-sampler", daemon=True
+        )
+        self._sampler.start()
+
+    def stop_sampler(self):
+        """Stop the background sampler"""
+        self._stop_sampler.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+
+    @staticmethod
+    def _quantiles_ms(counts, total: int, low: float = 0.0, high: float = math.inf) -> dict:
+        return {
+            f"p{int(q * 100)}_ms": round(min(max(_quantile(counts, total, q), low), high) * 1000, 2)
+            for q in QUANTILES
+        }
+
+    def _window_metrics(self, shards, now: float = None) -> dict:
+        """Requests, errors and quantiles per sliding window for one endpoint"""
+        now = time.time() if now is None else now
+        windows = {}
+        for name, seconds in WINDOWS.items():
+            ring_index = next(i for i, (width, size) in enumerate(_RINGS) if width * size >= seconds)
+            counts = _new_counts()
+            for shard in shards:
+                shard.rings[ring_index].merge_into(counts, now, seconds)
+            requests = sum(counts[:BUCKETS])
+            windows[name] = {"requests": requests, "errors": counts[_ERRORS]}
+            if requests:
+                windows[name].update(self._quantiles_ms(counts, requests))
+        return windows
+
     def get_api_metrics(self) -> dict:
         """Get API performance metrics"""
         metrics = {}
-        for endpoint, durations in self.request_duration.items():
-            if durations:
-                metrics[endpoint] = {
-                    "total_requests": self.request_count[endpoint],
-                    "avg_duration_ms": round(sum(durations) / len(durations) * 1000, 2),
-                    "min_duration_ms": round(min(durations) * 1000, 2),
-                    "max_duration_ms": round(max(durations) * 1000, 2),
-                    "errors": self.error_count.get(endpoint, 0)
-                }
+        now = time.time()
+        for endpoint, shards in self._merged_endpoints().items():
+            count = sum(s.count for s in shards)
+            if not count:
+                continue
+            counts = _new_counts()
+            for shard in shards:
+                for i, c in enumerate(shard.counts):
+                    counts[i] += c
+            low = min(s.min for s in shards)
+            high = max(s.max for s in shards)
+            metrics[endpoint] = {
+                "total_requests": count,
+                "avg_duration_ms": round(sum(s.total for s in shards) / count * 1000, 2),
+                "min_duration_ms": round(low * 1000, 2),
+                "max_duration_ms": round(high * 1000, 2),
+                **self._quantiles_ms(counts, count, low, high),
+                "errors": sum(s.errors for s in shards),
+                "windows": self._window_metrics(shards, now),
+            }
         return metrics
 
     def get_security_metrics(self) -> dict:
         """Get security operations summary"""
-        return dict(self.security_operations)
+        with self._lock:
+            threads = list(self._threads)
+        totals = defaultdict(int)
+        for stats in threads:
+            for key, count in stats.security_operations.copy().items():
+                totals[key] += count
+        return dict(totals)
+
+    def _prefixes(self, key: str) -> tuple:
+        """Sample name and labels of each request line for an endpoint, built once"""
+        prefixes = self._line_prefixes.get(key)
+        if prefixes is None:
+            method, sep, endpoint = key.partition(":")
+            if not sep:
+                method, endpoint = "", key
+            labels = f'method="{_escape(method)}",endpoint="{_escape(endpoint)}"'
+            prefixes = self._line_prefixes[key] = (
+                f"api_requests_total{{{labels}}} ",
+                f"api_request_errors_total{{{labels}}} ",
+                [f'api_request_duration_seconds_bucket{{{labels},le="{_format_value(float(b))}"}} '
+                 for b in PROMETHEUS_BUCKETS + (math.inf,)],
+                f"api_request_duration_seconds_sum{{{labels}}} ",
+                f"api_request_duration_seconds_count{{{labels}}} ",
+            )
+        return prefixes
+
+    def render_prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        requests = ["# HELP api_requests_total HTTP requests by route",
+                    "# TYPE api_requests_total counter"]
+        errors = ["# HELP api_request_errors_total HTTP requests answered with status >= 400",
+                  "# TYPE api_request_errors_total counter"]
+        latency = ["# HELP api_request_duration_seconds HTTP request latency",
+                   "# TYPE api_request_duration_seconds histogram"]
+        for key, shards in sorted(self._merged_endpoints().items()):
+            requests_prefix, errors_prefix, bucket_prefixes, sum_prefix, count_prefix = self._prefixes(key)
+            counts = [0] * (len(PROMETHEUS_BUCKETS) + 1)
+            for shard in shards:
+                for i, c in enumerate(shard.le_counts):
+                    counts[i] += c
+            count = sum(s.count for s in shards)
+            requests.append(requests_prefix + str(count))
+            errors.append(errors_prefix + str(sum(s.errors for s in shards)))
+            cumulative = 0
+            for prefix, c in zip(bucket_prefixes, counts):
+                cumulative += c
+                latency.append(prefix + str(cumulative))
+            latency.append(sum_prefix + repr(sum(s.total for s in shards)))
+            latency.append(count_prefix + str(cumulative))
+
+        security = []
+        for key, count in sorted(self.get_security_metrics().items()):
+            operation, _, result = key.rpartition(":")
+            security.append(("security_operations_total", {"operation": operation, "result": result}, count))
+
+        uptime = (datetime.utcnow() - self.start_time).total_seconds()
+        return "\n".join(requests + errors + latency) + "\n" + render_families([
+            ("api_uptime_seconds", "gauge", "Seconds since the API started",
+             [("api_uptime_seconds", {}, round(uptime, 3))]),
+            ("security_operations_total", "counter", "Security skill operations", security),
+        ]) + self._gauge_text
 
     def get_uptime(self) -> str:
         """Get application uptime"""
@@ -77,8 +442,9 @@ class MetricsCollector:
 
     def get_dashboard_data(self) -> dict:
         """Get all metrics for dashboard"""
-        total_requests = sum(self.request_count.values())
-        total_errors = sum(self.error_count.values())
+        api_metrics = self.get_api_metrics()
+        total_requests = sum(m["total_requests"] for m in api_metrics.values())
+        total_errors = sum(m["errors"] for m in api_metrics.values())
         error_rate = (total_errors / total_requests * 100) if total_requests > 0 else 0
 
         return {
@@ -88,7 +454,7 @@ class MetricsCollector:
             "total_errors": total_errors,
             "error_rate_percent": round(error_rate, 2),
             "system": self.get_system_metrics(),
-            "api_endpoints": self.get_api_metrics(),
+            "api_endpoints": api_metrics,
             "security_operations": self.get_security_metrics()
         }
 
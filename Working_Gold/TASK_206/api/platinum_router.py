@@ -13,6 +13,10 @@ Endpoints:
     GET    /api/v1/platinum/agents          - Agent heartbeat status
     POST   /api/v1/platinum/demo           - Run demo workflow
     GET    /api/v1/platinum/audit           - Audit log
+
+platinum_gauges() is registered with the metrics sampler: queue and draft
+counts from the vault, task counts by status and sync cycle timings
+(from the sync daemon's sync_status.json) for /metrics.
 """
 
 import os
@@ -23,11 +27,13 @@ from typing import Optional, List
 
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from api.database import (
-    get_db, PlatinumTask, AgentStatus, PlatinumAuditLog
+    get_db, SessionLocal, PlatinumTask, AgentStatus, PlatinumAuditLog
 )
+from api.monitoring import histogram_samples
 
 router = APIRouter(prefix="/api/v1/platinum", tags=["Platinum"])
 
@@ -232,16 +238,21 @@ async def get_agent_status(db: Session = Depends(get_db)):
     """Get agent heartbeat status."""
     agents = db.query(AgentStatus).all()
 
-    # Also check file-based heartbeats
-    updates_dir = VAULT_PATH / "Platinum" / "Updates"
-    file_agents = []
-    if updates_dir.exists():
-        for f in updates_dir.glob("*_heartbeat.json"):
-            try:
-                data = json.loads(f.read_text(encoding="utf-8"))
-                file_agents.append(data)
-            except (json.JSONDecodeError, OSError):
-                pass
+    # Also check vault heartbeats (local store + copies published by the other agent)
+    try:
+        from Platinum.src.agent_heartbeat import AgentHeartbeat
+        file_agents = list(AgentHeartbeat.read_all(str(VAULT_PATH)).values())
+    except ImportError:
+        # Fallback if Platinum modules not available
+        updates_dir = VAULT_PATH / "Platinum" / "Updates"
+        file_agents = []
+        if updates_dir.exists():
+            for f in updates_dir.glob("*_heartbeat.json"):
+                try:
+                    data = json.loads(f.read_text(encoding="utf-8"))
+                    file_agents.append(data)
+                except (json.JSONDecodeError, OSError):
+                    pass
 
     return {
         "database_agents": [
@@ -341,17 +352,31 @@ async def get_audit_log(limit: int = 50, db: Session = Depends(get_db)):
     ]
 
 
-@router.get("/health")
-async def get_health_status():
-    """Get system health status from HealthMonitor."""
-    try:
+_health_cache = None
+
+
+def _get_health_cache():
+    """Process-wide HealthSnapshotCache, created on first use."""
+    global _health_cache
+    if _health_cache is None:
         from Platinum.src.config import get_settings
-        from Platinum.src.health_monitor import HealthMonitor
+        from Platinum.src.health_monitor import HealthSnapshotCache
 
-        settings = get_settings(VAULT_PATH=str(VAULT_PATH))
-        monitor = HealthMonitor(settings)
-        status = monitor.run_checks()
-        return monitor.get_status_dict(status)
+        _health_cache = HealthSnapshotCache(get_settings(VAULT_PATH=str(VAULT_PATH)))
+    return _health_cache
+
+
+@router.get("/health")
+def get_health_status():
+    """Get system health status from HealthMonitor.
+
+    Serves the last snapshot written by HealthMonitorDaemon from memory. A
+    stale snapshot triggers one shared background refresh, which never
+    creates alerts. Declared sync so FastAPI runs it in its threadpool: the
+    very first call may wait for that refresh.
+    """
+    try:
+        return _get_health_cache().get()
     except ImportError:
         # Fallback if Platinum modules not available
         return {
@@ -368,3 +393,84 @@ async def get_health_status():
             "alerts": [f"Health check error: {str(e)}"],
             "timestamp": datetime.utcnow().isoformat(),
         }
+
+
+# ========== METRICS ==========
+
+# (vault directory, metric, label, help): one sample per subdirectory
+_VAULT_QUEUES = (
+    ("Needs_Action", "platinum_tasks_waiting", "domain", "Task files waiting to be claimed"),
+    ("In_Progress", "platinum_claims", "agent", "Task files claimed by each agent"),
+    ("Plans", "platinum_drafts", "domain", "Drafts not yet submitted for approval"),
+    ("Pending_Approval", "platinum_drafts_pending_approval", "domain", "Drafts awaiting approval"),
+)
+
+
+def _count_files(directory: Path) -> dict:
+    """{subdirectory name: number of files directly in it}"""
+    counts = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    with os.scandir(entry.path) as files:
+                        counts[entry.name] = sum(1 for f in files if f.is_file())
+    except OSError:
+        pass
+    return counts
+
+
+_draft_index = None
+
+
+def _get_draft_index():
+    """Process-wide DraftIndex for the metrics sampler, created on first use."""
+    global _draft_index
+    if _draft_index is None:
+        from Platinum.src.draft_index import DraftIndex
+
+        _draft_index = DraftIndex(VAULT_PATH / "Platinum")
+    return _draft_index
+
+
+def platinum_gauges() -> list:
+    """Metric families for the Platinum agents (runs on the metrics sampler thread)."""
+    platinum_dir = VAULT_PATH / "Platinum"
+    families = []
+    for dirname, name, label, help_text in _VAULT_QUEUES:
+        counts = _count_files(platinum_dir / dirname)
+        families.append((name, "gauge", help_text,
+                         [(name, {label: key}, n) for key, n in sorted(counts.items())]))
+
+    # Approved drafts are archived by date (and compacted) in Done/; the
+    # draft index counts them without walking the archive
+    try:
+        approved = _get_draft_index().count("Done")
+    except ImportError:
+        approved = None
+    if approved is not None:
+        families.append(("platinum_drafts_approved", "gauge", "Approved drafts archived in Done/",
+                         [("platinum_drafts_approved", {}, approved)]))
+
+    db = SessionLocal()
+    try:
+        rows = db.query(PlatinumTask.status, func.count()).group_by(PlatinumTask.status).all()
+    finally:
+        db.close()
+    # status is nullable: NULL rows are reported as "unknown"
+    by_status = {}
+    for status, n in rows:
+        by_status[status or "unknown"] = by_status.get(status or "unknown", 0) + n
+    families.append(("platinum_api_tasks", "gauge", "Platinum tasks in the API database by status",
+                     [("platinum_api_tasks", {"status": status}, n) for status, n in sorted(by_status.items())]))
+
+    status_file = platinum_dir / "Updates" / "sync_status.json"
+    try:
+        durations = json.loads(status_file.read_text(encoding="utf-8")).get("durations")
+    except (OSError, json.JSONDecodeError):
+        durations = None
+    if durations:
+        families.append(("platinum_sync_duration_seconds", "histogram", "Sync daemon pull+push cycle time",
+                         histogram_samples("platinum_sync_duration_seconds", {}, durations["bounds"],
+                                           durations["buckets"], durations["sum"])))
+    return families
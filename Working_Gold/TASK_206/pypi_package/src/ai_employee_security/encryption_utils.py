@@ -5,13 +5,26 @@ CRITICAL-2 Fix: Unencrypted Backups (CVSS 8.0)
 Created: 2026-01-27 for TASK_204
 Purpose: Encrypt and compress archives with AES-256-GCM + ZSTD
 Bonus: 70% disk reduction from compression
+Encryption streams in 1 MiB authenticated chunks (format v2), so memory
+use stays constant regardless of archive size; legacy v1 files still decrypt.
+Archives are built and extracted in a single tar -> ZSTD -> AES-GCM stream,
+with no intermediate files on disk. Files are hashed as they are read into
+the tar, and the archive metadata records their Merkle root (the same
+root integrity_checker.py computes for the source directory).
 """
 
 import os
 import sys
 import json
+import hashlib
+import shutil
+import struct
 import tarfile
 import argparse
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -33,13 +46,217 @@ except ImportError:
     print("[WARN] zstandard package not installed")
     print("[WARN] Install with: pip install zstandard")
 
+# Merkle tree shared with the integrity checker
+try:
+    from integrity_checker import build_merkle_tree
+except ImportError:
+    # If running standalone, import from same directory
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from integrity_checker import build_merkle_tree
+
+
+# Chunked encryption format (version 2)
+#
+#   header : magic "AEVS" | version (1 byte) | chunk size (u32 BE) | nonce prefix (7 bytes)
+#   chunks : AES-GCM(chunk) + 16-byte tag, repeated
+#
+# Every chunk but the last holds exactly `chunk size` plaintext bytes. The
+# nonce of chunk i is nonce prefix | i (u32 BE) | final flag (1 byte), and
+# the header is the associated data of every chunk, so reordered, dropped,
+# truncated or re-headered chunks all fail authentication.
+#
+# Version 1 (legacy) files are a 12-byte nonce followed by one AES-GCM
+# ciphertext of the whole input; they still decrypt.
+STREAM_MAGIC = b"AEVS"
+STREAM_VERSION = 2
+CHUNK_SIZE = 1024 * 1024  # 1 MiB plaintext per chunk
+MIN_CHUNK_SIZE = 4 * 1024
+MAX_CHUNK_SIZE = 64 * 1024 * 1024
+TAG_SIZE = 16
+_HEADER = struct.Struct(">4sBI7s")
+
+
+def _chunk_nonce(prefix, index, final):
+    """Per-chunk nonce: 7-byte random prefix + chunk counter + final flag"""
+    if index > 0xFFFFFFFF:
+        raise ValueError("Too many chunks for one stream")
+    return prefix + struct.pack(">IB", index, 1 if final else 0)
+
+
+def _read_full(f, size):
+    """Read exactly `size` bytes unless EOF comes first"""
+    data = f.read(size)
+    while len(data) < size:
+        more = f.read(size - len(data))
+        if not more:
+            break
+        data += more
+    return data
+
+
+class _HashingReader:
+    """Read-only file wrapper that SHA-256 hashes everything read through it"""
+
+    def __init__(self, f):
+        self._f = f
+        self._sha256 = hashlib.sha256()
+
+    def read(self, size=-1):
+        data = self._f.read(size)
+        self._sha256.update(data)
+        return data
+
+    def hexdigest(self):
+        return self._sha256.hexdigest()
+
+
+class _ChunkEncryptWriter:
+    """Write-only file object that encrypts into the chunked format
+
+    Buffers at most two chunks: a full chunk is only sealed once more data
+    arrives, so the last one can carry the final flag on close().
+
+    With threads > 1, chunks are sealed on a thread pool (AES-GCM runs in
+    C) and written back in order; at most 2 * threads chunks are in flight.
+    """
+
+    def __init__(self, cipher, f_out, chunk_size=CHUNK_SIZE, threads=1):
+        if not MIN_CHUNK_SIZE <= chunk_size <= MAX_CHUNK_SIZE:
+            raise ValueError(f"chunk_size must be between {MIN_CHUNK_SIZE} and {MAX_CHUNK_SIZE}")
+        self.cipher = cipher
+        self.f_out = f_out
+        self.chunk_size = chunk_size
+        self._pool = ThreadPoolExecutor(max_workers=threads) if threads > 1 else None
+        self._max_pending = 2 * threads
+        self._pending = deque()
+        self.prefix = os.urandom(7)
+        self.header = _HEADER.pack(STREAM_MAGIC, STREAM_VERSION, chunk_size, self.prefix)
+        self.index = 0
+        self.total = 0
+        self.closed = False
+        self._buffer = bytearray()
+        f_out.write(self.header)
+
+    def _seal(self, chunk, final):
+        nonce = _chunk_nonce(self.prefix, self.index, final)
+        self.index += 1
+        if self._pool is None:
+            self.f_out.write(self.cipher.encrypt(nonce, bytes(chunk), self.header))
+            return
+        self._pending.append(self._pool.submit(self.cipher.encrypt, nonce, bytes(chunk), self.header))
+        while len(self._pending) > self._max_pending:
+            self.f_out.write(self._pending.popleft().result())
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._buffer += data
+        self.total += len(data)
+        # Keep at least one byte back: the chunk holding it may be the last
+        while len(self._buffer) > self.chunk_size:
+            self._seal(self._buffer[:self.chunk_size], final=False)
+            del self._buffer[:self.chunk_size]
+        return len(data)
+
+    def flush(self):
+        self.f_out.flush()
+
+    def close(self):
+        """Seal the final chunk (does not close the underlying file)"""
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self._seal(self._buffer, final=True)
+            self._buffer = bytearray()
+            while self._pending:
+                self.f_out.write(self._pending.popleft().result())
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+
+
+class _ChunkDecryptReader:
+    """Read-only file object over a chunked or legacy encrypted stream
+
+    Each chunk is authenticated before any of its plaintext is returned.
+    """
+
+    def __init__(self, cipher, f_in):
+        self.cipher = cipher
+        self.f_in = f_in
+        self.index = 0
+        self._plain = b""
+        self._pos = 0
+        self._done = False
+
+        header = _read_full(f_in, _HEADER.size)
+        magic, version, chunk_size, prefix = (
+            _HEADER.unpack(header) if len(header) == _HEADER.size else (None, None, None, None)
+        )
+        if magic != STREAM_MAGIC or version != STREAM_VERSION:
+            # Legacy single-shot file: 12-byte nonce + ciphertext
+            data = header + f_in.read()
+            self._plain = cipher.decrypt(data[:12], data[12:], None)
+            self._done = True
+            self.legacy = True
+            return
+        if not MIN_CHUNK_SIZE <= chunk_size <= MAX_CHUNK_SIZE:
+            raise ValueError(f"Invalid chunk size in header: {chunk_size}")
+        self.legacy = False
+        self.header = header
+        self.prefix = prefix
+        self.block_size = chunk_size + TAG_SIZE
+        self._next_block = _read_full(f_in, self.block_size)
+
+    def _open_next(self):
+        block = self._next_block
+        # A full block followed by more data is never the final chunk
+        self._next_block = _read_full(self.f_in, self.block_size) if len(block) == self.block_size else b""
+        final = not self._next_block
+        nonce = _chunk_nonce(self.prefix, self.index, final)
+        self._plain = self.cipher.decrypt(nonce, block, self.header)
+        self._pos = 0
+        self.index += 1
+        self._done = final
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        parts = []
+        wanted = size if size is not None and size >= 0 else None
+        while wanted is None or wanted > 0:
+            if self._pos >= len(self._plain):
+                if self._done:
+                    break
+                self._open_next()
+                continue
+            end = len(self._plain) if wanted is None else min(len(self._plain), self._pos + wanted)
+            piece = self._plain[self._pos:end]
+            self._pos = end
+            parts.append(piece)
+            if wanted is not None:
+                wanted -= len(piece)
+        return b"".join(parts)
+
+    def close(self):
+        pass
+
 
 class ArchiveEncryption:
     """Handle encryption and compression for archives"""
 
-    def __init__(self, key_file=None, verbose=True):
-        """Initialize with encryption key"""
+    def __init__(self, key_file=None, verbose=True, threads=1):
+        """Initialize with encryption key
+
+        Args:
+            threads: Worker threads for ZSTD compression and chunk
+                encryption (1 = single-threaded, 0 = all cores).
+        """
         self.verbose = verbose
+        self.threads = threads if threads > 0 else (os.cpu_count() or 1)
 
         if not CRYPTO_AVAILABLE:
             raise RuntimeError("cryptography package required. Install: pip install cryptography")
@@ -83,37 +300,64 @@ class ArchiveEncryption:
         except Exception as e:
             self._log(f"[WARN] Could not set permissions: {e}")
 
+    def _add_tree(self, tar, source_path, checksums=None):
+        """Add every file under source_path, named relative to its parent
+
+        If checksums is a dict, it is filled with {path relative to
+        source_path: sha256} for each file, hashed from the bytes tarred.
+        """
+        for item in sorted(source_path.rglob('*')):
+            if item.is_file():
+                arcname = str(item.relative_to(source_path.parent))
+                tarinfo = tar.gettarinfo(item, arcname=arcname)
+                if tarinfo.isreg():
+                    with open(item, 'rb') as f:
+                        reader = _HashingReader(f)
+                        tar.addfile(tarinfo, reader)
+                    checksum = reader.hexdigest()
+                else:
+                    # Symlink to a file: tar stores the link, the checksum
+                    # covers the target, as integrity_checker.py does
+                    tar.addfile(tarinfo)
+                    checksum = None
+                    if checksums is not None:
+                        with open(item, 'rb') as f:
+                            reader = _HashingReader(f)
+                            while reader.read(CHUNK_SIZE):
+                                pass
+                        checksum = reader.hexdigest()
+                if checksums is not None:
+                    checksums[str(item.relative_to(source_path))] = checksum
+                self._log(f"  [OK] Added: {arcname}")
+
     def create_tar_archive(self, source_dir, output_file):
         """Create tar archive from directory"""
         self._log(f"[TAR] Creating tar archive: {output_file}")
 
         with tarfile.open(output_file, 'w') as tar:
-            source_path = Path(source_dir)
-
-            for item in sorted(source_path.rglob('*')):
-                if item.is_file():
-                    arcname = str(item.relative_to(source_path.parent))
-                    tar.add(item, arcname=arcname)
-                    self._log(f"  [OK] Added: {arcname}")
+            self._add_tree(tar, Path(source_dir))
 
         size_mb = Path(output_file).stat().st_size / (1024 * 1024)
         self._log(f"[OK] Tar archive created: {size_mb:.2f} MB")
         return output_file
 
+    def _compressor(self, level):
+        """ZSTD compressor; multi-threaded (native zstd workers) when threads > 1"""
+        return zstd.ZstdCompressor(level=level, threads=self.threads if self.threads > 1 else 0)
+
     def compress_file(self, input_file, output_file, level=3):
         """Compress file using ZSTD"""
         if not ZSTD_AVAILABLE:
             self._log("[WARN] ZSTD not available, skipping compression")
             # Copy file without compression
-            import shutil
             shutil.copy2(input_file, output_file)
             return output_file
 
-        self._log(f"[COMPRESS] Compressing with ZSTD level {level}")
+        self._log(f"[COMPRESS] Compressing with ZSTD level {level} ({self.threads} threads)")
 
         original_size = Path(input_file).stat().st_size
 
-        cctx = zstd.ZstdCompressor(level=level)
+        cctx = self._compressor(level)
 
         with open(input_file, 'rb') as f_in:
             with open(output_file, 'wb') as f_out:
@@ -131,7 +375,6 @@ class ArchiveEncryption:
         """Decompress ZSTD file"""
         if not ZSTD_AVAILABLE:
             self._log("[WARN] ZSTD not available, assuming uncompressed")
-            import shutil
             shutil.copy2(input_file, output_file)
             return output_file
 
@@ -148,23 +391,44 @@ class ArchiveEncryption:
 
         return output_file
 
-    def encrypt_file(self, input_file, output_file):
-        """Encrypt file using AES-256-GCM"""
-        self._log(f"[ENCRYPT] Encrypting with AES-256-GCM")
-
-        # Generate random 12-byte nonce (recommended for AES-GCM)
-        nonce = os.urandom(12)
+    def encrypt_stream(self, f_in, f_out, chunk_size=CHUNK_SIZE):
+        """Encrypt a binary stream into the chunked format, in constant memory
 
-        with open(input_file, 'rb') as f:
-            plaintext = f.read()
-
-        # Encrypt with authenticated encryption (provides integrity)
-        ciphertext = self.cipher.encrypt(nonce, plaintext, None)
-
-        # Write: nonce (12 bytes) + ciphertext
-        with open(output_file, 'wb') as f:
-            f.write(nonce)
-            f.write(ciphertext)
+        Returns:
+            Number of plaintext bytes encrypted.
+        """
+        writer = _ChunkEncryptWriter(self.cipher, f_out, chunk_size, self.threads)
+        try:
+            shutil.copyfileobj(f_in, writer, chunk_size)
+        finally:
+            writer.close()
+        return writer.total
+
+    def decrypt_stream(self, f_in, f_out):
+        """Decrypt a chunked or legacy stream
+
+        Chunks are verified one at a time, so on a tampered or truncated
+        stream some verified plaintext may already have been written before
+        the error is raised.
+
+        Returns:
+            Number of plaintext bytes written.
+        """
+        reader = _ChunkDecryptReader(self.cipher, f_in)
+        total = 0
+        while True:
+            data = reader.read(CHUNK_SIZE)
+            if not data:
+                return total
+            f_out.write(data)
+            total += len(data)
+
+    def encrypt_file(self, input_file, output_file, chunk_size=CHUNK_SIZE):
+        """Encrypt file using AES-256-GCM, streamed in chunks"""
+        self._log(f"[ENCRYPT] Encrypting with AES-256-GCM ({chunk_size // 1024} KiB chunks)")
+
+        with open(input_file, 'rb') as f_in, open(output_file, 'wb') as f_out:
+            self.encrypt_stream(f_in, f_out, chunk_size)
 
         encrypted_size = Path(output_file).stat().st_size
         self._log(f"[OK] Encrypted: {encrypted_size / (1024*1024):.2f} MB")
@@ -172,19 +436,13 @@ class ArchiveEncryption:
         return output_file
 
     def decrypt_file(self, input_file, output_file):
-        """Decrypt file using AES-256-GCM"""
+        """Decrypt file using AES-256-GCM (chunked or legacy format)"""
         self._log(f"[DECRYPT] Decrypting with AES-256-GCM")
 
-        with open(input_file, 'rb') as f:
-            nonce = f.read(12)
-            ciphertext = f.read()
-
         try:
             # Decrypt and verify authenticity
-            plaintext = self.cipher.decrypt(nonce, ciphertext, None)
-
-            with open(output_file, 'wb') as f:
-                f.write(plaintext)
+            with open(input_file, 'rb') as f_in, open(output_file, 'wb') as f_out:
+                self.decrypt_stream(f_in, f_out)
 
             decrypted_size = Path(output_file).stat().st_size
             self._log(f"[OK] Decrypted: {decrypted_size / (1024*1024):.2f} MB")
@@ -192,12 +450,14 @@ class ArchiveEncryption:
             return output_file
 
         except Exception as e:
+            # Never leave partially verified plaintext behind
+            Path(output_file).unlink(missing_ok=True)
             self._log(f"[ERR] Decryption failed: {e}")
             self._log(f"[ERR] Possible causes: wrong key, corrupted file, tampered data")
             raise
 
     def create_encrypted_archive(self, source_dir, output_file, compression_level=3):
-        """Full workflow: tar + compress + encrypt"""
+        """Full workflow: tar + compress + encrypt, streamed in one pass"""
         self._log("\n" + "=" * 60)
         self._log(f"[START] Creating encrypted archive")
         self._log(f"  Source: {source_dir}")
@@ -207,53 +467,71 @@ class ArchiveEncryption:
         source_path = Path(source_dir)
         output_path = Path(output_file)
 
-        # Create temp directory for intermediate files
-        temp_dir = output_path.parent / f".temp_{output_path.stem}"
-        temp_dir.mkdir(exist_ok=True)
-
+        # One pass, no intermediate files:
+        # tar (stream mode) -> ZSTD stream writer -> chunked AES-GCM -> output
         try:
-            # Step 1: Create tar archive
-            tar_file = temp_dir / f"{source_path.name}.tar"
-            self.create_tar_archive(source_dir, tar_file)
-
-            # Step 2: Compress with ZSTD
-            compressed_file = temp_dir / f"{source_path.name}.tar.zst"
-            self.compress_file(tar_file, compressed_file, level=compression_level)
-
-            # Step 3: Encrypt with AES-256-GCM
-            self.encrypt_file(compressed_file, output_path)
-
-            # Step 4: Create metadata file
-            metadata = {
-                'version': '1.0',
-                'created': datetime.now().isoformat(),
-                'source_dir': str(source_path.name),
-                'encryption': 'AES-256-GCM',
-                'compression': 'ZSTD',
-                'compression_level': compression_level
-            }
-
-            metadata_file = output_path.with_suffix('.json')
-            with open(metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
-
-            self._log("\n" + "=" * 60)
-            self._log(f"[SUCCESS] Encrypted archive created")
-            self._log(f"  Archive: {output_path}")
-            self._log(f"  Metadata: {metadata_file}")
-            self._log("=" * 60)
-
-            return output_path
+            with open(output_path, 'wb') as f_out:
+                encryptor = _ChunkEncryptWriter(self.cipher, f_out, threads=self.threads)
+                try:
+                    compressor = None
+                    sink = encryptor
+                    if ZSTD_AVAILABLE:
+                        compressor = self._compressor(compression_level).stream_writer(
+                            encryptor, closefd=False
+                        )
+                        sink = compressor
+                    else:
+                        self._log("[WARN] ZSTD not available, skipping compression")
+
+                    self._log(f"[TAR] Streaming tar archive of {source_path} ({self.threads} threads)")
+                    checksums = {}
+                    with tarfile.open(fileobj=sink, mode='w|') as tar:
+                        self._add_tree(tar, source_path, checksums)
+                    if compressor is not None:
+                        compressor.close()
+                finally:
+                    encryptor.close()
+        except BaseException:
+            output_path.unlink(missing_ok=True)
+            raise
 
-        finally:
-            # Clean up temp files
-            import shutil
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir)
-                self._log("[OK] Cleaned up temporary files")
+        encrypted_size = output_path.stat().st_size
+        self._log(f"[OK] Encrypted: {encrypted_size / (1024*1024):.2f} MB")
+
+        # integrity.json is not part of its own tree
+        checksums.pop('integrity.json', None)
+        merkle_root = build_merkle_tree(checksums)['.']
+        self._log(f"[OK] Merkle root: {merkle_root[:16]}...")
+
+        # Create metadata file
+        metadata = {
+            'version': '1.0',
+            'created': datetime.now().isoformat(),
+            'source_dir': str(source_path.name),
+            'encryption': 'AES-256-GCM',
+            'encryption_format': STREAM_VERSION,
+            'chunk_size': CHUNK_SIZE,
+            'compression': 'ZSTD' if ZSTD_AVAILABLE else 'none',
+            'compression_level': compression_level,
+            'threads': self.threads,
+            'file_count': len(checksums),
+            'merkle_root': merkle_root
+        }
+
+        metadata_file = output_path.with_suffix('.json')
+        with open(metadata_file, 'w') as f:
+            json.dump(metadata, f, indent=2)
+
+        self._log("\n" + "=" * 60)
+        self._log(f"[SUCCESS] Encrypted archive created")
+        self._log(f"  Archive: {output_path}")
+        self._log(f"  Metadata: {metadata_file}")
+        self._log("=" * 60)
+
+        return output_path
 
     def extract_encrypted_archive(self, encrypted_file, output_dir):
-        """Full workflow: decrypt + decompress + extract"""
+        """Full workflow: decrypt + decompress + extract, streamed in one pass"""
         self._log("\n" + "=" * 60)
         self._log(f"[START] Extracting encrypted archive")
         self._log(f"  Archive: {encrypted_file}")
@@ -264,37 +542,91 @@ class ArchiveEncryption:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        # Create temp directory
-        temp_dir = output_path / f".temp_extract"
-        temp_dir.mkdir(exist_ok=True)
-
+        # Mirror of create: output <- tar (stream mode) <- ZSTD <- AES-GCM <- file.
+        # Files land in a staging directory and are moved into place only
+        # once every chunk, including the final one, has been authenticated.
+        staging = Path(tempfile.mkdtemp(prefix='.extract_', dir=output_path))
         try:
-            # Step 1: Decrypt
-            compressed_file = temp_dir / "archive.tar.zst"
-            self.decrypt_file(encrypted_path, compressed_file)
+            with open(encrypted_path, 'rb') as f_in:
+                reader = _ChunkDecryptReader(self.cipher, f_in)
+                source = reader
+                if ZSTD_AVAILABLE:
+                    source = zstd.ZstdDecompressor().stream_reader(reader, closefd=False)
+                else:
+                    self._log("[WARN] ZSTD not available, assuming uncompressed")
+
+                self._log(f"[EXTRACT] Extracting tar archive")
+                with tarfile.open(fileobj=source, mode='r|') as tar:
+                    tar.extractall(staging)
+                # tar stops at its end marker; authenticate whatever follows
+                while reader.read(CHUNK_SIZE):
+                    pass
+        except Exception as e:
+            # Never leave partially verified plaintext behind
+            shutil.rmtree(staging, ignore_errors=True)
+            self._log(f"[ERR] Decryption failed: {e}")
+            self._log(f"[ERR] Possible causes: wrong key, corrupted file, tampered data")
+            raise
 
-            # Step 2: Decompress
-            tar_file = temp_dir / "archive.tar"
-            self.decompress_file(compressed_file, tar_file)
+        _move_into(staging, output_path)
 
-            # Step 3: Extract tar
-            self._log(f"[EXTRACT] Extracting tar archive")
-            with tarfile.open(tar_file, 'r') as tar:
-                tar.extractall(output_path)
+        self._log("\n" + "=" * 60)
+        self._log(f"[SUCCESS] Archive extracted")
+        self._log(f"  Location: {output_path}")
+        self._log("=" * 60)
 
-            self._log("\n" + "=" * 60)
-            self._log(f"[SUCCESS] Archive extracted")
-            self._log(f"  Location: {output_path}")
-            self._log("=" * 60)
+        return output_path
 
-            return output_path
 
-        finally:
-            # Clean up temp files
-            import shutil
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir)
-                self._log("[OK] Cleaned up temporary files")
+def _move_into(src, dst):
+    """Move the contents of directory src into dst, merging directories, then remove src"""
+    for entry in src.iterdir():
+        target = dst / entry.name
+        if entry.is_dir() and not entry.is_symlink() and target.is_dir() and not target.is_symlink():
+            _move_into(entry, target)
+        else:
+            if target.is_dir() and not target.is_symlink():
+                shutil.rmtree(target)
+            os.replace(entry, target)
+    src.rmdir()
+
+
+def _benchmark_source(directory, size_mb):
+    """Write `size_mb` of half-compressible test data (log-like text + random bytes)"""
+    directory.mkdir(parents=True, exist_ok=True)
+    line = b"2026-01-27T10:00:00 INFO task=TASK_204 step=archive status=ok detail=%06d\n"
+    for i in range(size_mb):
+        text = b"".join(line % (i * 1000 + j) for j in range(6700))[:512 * 1024]
+        (directory / f"part_{i:04d}.bin").write_bytes(text + os.urandom(1024 * 1024 - len(text)))
+
+
+def benchmark_throughput(size_mb=256, thread_counts=(1, 2, 4, 8), level=3):
+    """Time create_encrypted_archive on synthetic data for each thread count
+
+    Returns:
+        List of {"threads", "seconds", "mb_per_sec", "archive_mb"} dicts.
+    """
+    results = []
+    with tempfile.TemporaryDirectory(prefix="archive_bench_") as tmp:
+        tmp = Path(tmp)
+        source = tmp / "source"
+        _benchmark_source(source, size_mb)
+        key = AESGCM.generate_key(bit_length=256)
+        for threads in thread_counts:
+            encryptor = ArchiveEncryption(verbose=False, threads=threads)
+            encryptor.key, encryptor.cipher = key, AESGCM(key)
+            output = tmp / f"bench_{threads}.enc"
+            start = time.perf_counter()
+            encryptor.create_encrypted_archive(source, output, compression_level=level)
+            elapsed = time.perf_counter() - start
+            results.append({
+                "threads": threads,
+                "seconds": round(elapsed, 3),
+                "mb_per_sec": round(size_mb / elapsed, 1),
+                "archive_mb": round(output.stat().st_size / (1024 * 1024), 1),
+            })
+            output.unlink()
+    return results
 
 
 def main():
@@ -302,7 +634,7 @@ def main():
         description='AI Employee Vault - Archive Encryption (CRITICAL-2 Fix)'
     )
 
-    parser.add_argument('action', choices=['create', 'extract', 'test'],
+    parser.add_argument('action', choices=['create', 'extract', 'test', 'benchmark'],
                         help='Action to perform')
 
     parser.add_argument('source', nargs='?',
@@ -317,6 +649,13 @@ def main():
     parser.add_argument('--level', type=int, default=3,
                         help='Compression level (1-22, default: 3)')
 
+    parser.add_argument('--threads', type=int, default=1,
+                        help='Worker threads for ZSTD and encryption (default: 1, 0 = all cores); '
+                             'benchmark runs 1, 2, 4, ... up to this count')
+
+    parser.add_argument('--size-mb', type=int, default=256,
+                        help='Benchmark data size in MB (default: 256)')
+
     parser.add_argument('-q', '--quiet', action='store_true',
                         help='Quiet mode')
 
@@ -351,7 +690,7 @@ def main():
                 print("[ERR] Create requires source and output arguments")
                 sys.exit(1)
 
-            encryptor = ArchiveEncryption(key_file, verbose=not args.quiet)
+            encryptor = ArchiveEncryption(key_file, verbose=not args.quiet, threads=args.threads)
             encryptor.create_encrypted_archive(args.source, args.output, args.level)
 
         elif args.action == 'extract':
@@ -359,9 +698,23 @@ def main():
                 print("[ERR] Extract requires source and output arguments")
                 sys.exit(1)
 
-            encryptor = ArchiveEncryption(key_file, verbose=not args.quiet)
+            encryptor = ArchiveEncryption(key_file, verbose=not args.quiet, threads=args.threads)
             encryptor.extract_encrypted_archive(args.source, args.output)
 
+        elif args.action == 'benchmark':
+            max_threads = args.threads if args.threads > 0 else (os.cpu_count() or 1)
+            counts = [1]
+            while counts[-1] * 2 <= max_threads:
+                counts.append(counts[-1] * 2)
+            if counts[-1] != max_threads:
+                counts.append(max_threads)
+
+            print(f"\nArchive throughput: {args.size_mb} MB, ZSTD level {args.level}, "
+                  f"{os.cpu_count()} CPUs")
+            print(f"{'threads':>8} {'seconds':>9} {'MB/s':>9} {'archive MB':>11}")
+            for r in benchmark_throughput(args.size_mb, counts, args.level):
+                print(f"{r['threads']:>8} {r['seconds']:>9.2f} {r['mb_per_sec']:>9.1f} {r['archive_mb']:>11.1f}")
+
         sys.exit(0)
 
     except Exception as e:
@@ -288,63 +288,210 @@ class InputValidator:
         Sanitize log message to remove sensitive data
         CRITICAL-8 Fix: Sensitive Data in Logs
 
+        Each pattern has a cheap guard (a substring it cannot match
+        without, such as '@' or "AKIA", or any digit). Only patterns whose
+        guard is present are scanned: the two key=value patterns one after
+        the other, then all value patterns together as one precompiled
+        alternation. A message with no guard present is returned without
+        any regex scan.
+
+        Unlike one re.sub pass per pattern, value patterns that overlap
+        are resolved in a single left-to-right scan: in "555.123.4567 4111
+        1111 1111 1111" the phone number and the card number are each
+        redacted whole, where the card pass used to take "4567 4111 1111
+        1111" and leave digits of both. Such messages redact more than
+        the sequential passes did, so their output differs.
+
         Args:
             message: Log message to sanitize
 
         Returns:
             Sanitized message
         """
-        # Patterns to redact (pattern, replacement)
-        patterns = [
-            # Generic secrets
-            (r'(password|passwd|pwd)(\s*[:=]\s*)["\']?([^"\'\s]+)["\']?',
-             r'\1\2***', re.IGNORECASE),
-
-            (r'(api[_-]?key|secret|token)(\s*[:=]\s*)["\']?([^"\'\s]+)["\']?',
-             r'\1\2***', re.IGNORECASE),
-
-            # Email addresses
-            (r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-             '***@***.***', 0),
-
-            # Credit card numbers
-            (r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b',
-             '****-****-****-****', 0),
-
-            # AWS access keys
-            (r'AKIA[0-9A-Z]{16}',
-             'AKIA****************', 0),
-
-            # GitHub tokens
-            (r'ghp_[A-Za-z0-9]{36}',
-             'ghp_***', 0),
-
-            # OpenAI API keys
-            (r'sk-[A-Za-z0-9]{48}',
-             'sk-***', 0),
-
-            # JWT tokens (base64 strings with dots)
-            (r'eyJ[A-Za-z0-9_-]*\.eyJ[A-Za-z0-9_-]*\.[A-Za-z0-9_-]*',
-             'eyJ***.eyJ***.***', 0),
-
-            # IP addresses (optional - may want to keep for debugging)
-            # (r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b', '***.***.***.***.***', 0),
-
-            # Social Security Numbers (US)
-            (r'\b\d{3}-\d{2}-\d{4}\b',
-             '***-**-****', 0),
-
-            # Phone numbers (simple pattern)
-            (r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
-             '***-***-****', 0),
+        for stage in _LOG_STAGES:
+            message = stage.sub(message)
+        return message
+
+
+_has_digit = re.compile(r'[0-9]').search
+_has_assignment = re.compile(r'[:=]').search
+
+# Patterns to redact: (name, pattern, replacement, case-insensitive, guard).
+# The guard is a substring, or a search function, that every match needs.
+LOG_REDACTIONS = [
+    # Generic secrets
+    ('password', r'(password|passwd|pwd)(\s*[:=]\s*)["\']?([^"\'\s]+)["\']?',
+     r'\1\2***', True, _has_assignment),
+
+    ('api_key', r'(api[_-]?key|secret|token)(\s*[:=]\s*)["\']?([^"\'\s]+)["\']?',
+     r'\1\2***', True, _has_assignment),
+
+    # Email addresses
+    ('email', r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
+     '***@***.***', False, '@'),
+
+    # Credit card numbers
+    ('credit_card', r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b',
+     '****-****-****-****', False, _has_digit),
+
+    # AWS access keys
+    ('aws_key', r'AKIA[0-9A-Z]{16}',
+     'AKIA****************', False, 'AKIA'),
+
+    # GitHub tokens
+    ('github_token', r'ghp_[A-Za-z0-9]{36}',
+     'ghp_***', False, 'ghp_'),
+
+    # OpenAI API keys
+    ('openai_key', r'sk-[A-Za-z0-9]{48}',
+     'sk-***', False, 'sk-'),
+
+    # JWT tokens (base64 strings with dots)
+    ('jwt', r'eyJ[A-Za-z0-9_-]*\.eyJ[A-Za-z0-9_-]*\.[A-Za-z0-9_-]*',
+     'eyJ***.eyJ***.***', False, 'eyJ'),
+
+    # IP addresses (optional - may want to keep for debugging)
+    # ('ip', r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b', '***.***.***.***', False, _has_digit),
+
+    # Social Security Numbers (US)
+    ('ssn', r'\b\d{3}-\d{2}-\d{4}\b',
+     '***-**-****', False, _has_digit),
+
+    # Phone numbers (simple pattern)
+    ('phone', r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
+     '***-***-****', False, _has_digit),
+]
+
+
+def _template_replacer(template, offset):
+    """Replacement function for a "\\1\\2***" template whose groups are
+    numbered from `offset` inside a larger pattern
+
+    Match.expand would re-parse the template on every match.
+    """
+    pieces = re.split(r'\\(\d+)', template)
+    literals = pieces[0::2]
+    groups = [offset + int(n) for n in pieces[1::2]]
+
+    def replace(match):
+        return literals[0] + ''.join(
+            (match.group(g) or '') + lit for g, lit in zip(groups, literals[1:])
+        )
+    return replace
+
+
+class _RedactionStage:
+    """Redaction patterns scanned together as one alternation of named groups
+
+    The alternation is compiled (and cached) per set of patterns whose
+    guard is present. List order is priority: where two patterns match at
+    the same position the earlier one wins, as it did when each pattern
+    ran as its own re.sub pass.
+    """
+
+    def __init__(self, redactions):
+        self.redactions = redactions
+        # Each distinct guard is checked once, setting the bits of every
+        # pattern that shares it
+        guards = {}
+        for bit, redaction in enumerate(redactions):
+            guard = redaction[4]
+            guards[guard] = guards.get(guard, 0) | (1 << bit)
+        self._guards = [
+            (guard if callable(guard) else (lambda m, g=guard: g in m), bits)
+            for guard, bits in guards.items()
         ]
-
-        sanitized = message
-
-        for pattern, replacement, flags in patterns:
-            sanitized = re.sub(pattern, replacement, sanitized, flags=flags)
-
-        return sanitized
+        self._compiled = {}
+
+    def sub(self, message):
+        mask = 0
+        for present, bits in self._guards:
+            if present(message):
+                mask |= bits
+        if not mask:
+            return message
+        compiled = self._compiled.get(mask) or self._compile(mask)
+        return compiled[0](compiled[1], message)
+
+    def _compile(self, mask):
+        alternatives = []
+        dispatch = {}
+        group = 0
+        for bit, (name, pattern, replacement, ignore_case, _) in enumerate(self.redactions):
+            if not mask & (1 << bit):
+                continue
+            wrapper = group + 1
+            body = f'(?i:{pattern})' if ignore_case else pattern
+            alternatives.append(f'(?P<{name}>{body})')
+            if '\\' in replacement:
+                dispatch[name] = _template_replacer(replacement, wrapper)
+            else:
+                dispatch[name] = lambda m, r=replacement: r
+            group = wrapper + re.compile(pattern).groups
+
+        # The outer named group closes last, so lastgroup names the pattern
+        compiled = (re.compile('|'.join(alternatives)).sub,
+                    lambda m: dispatch[m.lastgroup](m))
+        self._compiled[mask] = compiled
+        return compiled
+
+
+# Each key=value pattern is scanned on its own, in order, before the value
+# patterns: in one alternation an earlier-starting match could swallow a
+# key ("a@b.copassword: x", "token = password : x") and leave its value
+# unredacted
+_LOG_STAGES = [
+    _RedactionStage(LOG_REDACTIONS[0:1]),
+    _RedactionStage(LOG_REDACTIONS[1:2]),
+    _RedactionStage(LOG_REDACTIONS[2:]),
+]
+
+
+def _sanitize_sequential(message: str) -> str:
+    """Reference implementation: one re.sub pass per pattern"""
+    for _, pattern, replacement, ignore_case, _ in LOG_REDACTIONS:
+        message = re.sub(pattern, replacement, message,
+                         flags=re.IGNORECASE if ignore_case else 0)
+    return message
+
+
+_BENCHMARK_MESSAGES = [
+    "Task processing started for workflow",
+    "Moved task file from Needs_Action to In_Progress",
+    "2026-01-27 10:00:00.123 INFO TASK_204 step 3 of 7 completed in 0.42s",
+    "Approval request created, waiting for human review",
+    "Login for user@example.com from 10.0.0.12 succeeded",
+    "Retrying request attempt=2 status=503",
+    "Config loaded: api_key=abc123xyz timeout=30",
+    "Payment card 4111-1111-1111-1111 declined, call 555-123-4567",
+]
+
+
+def benchmark_sanitizer(records: int = 200_000) -> Dict[str, float]:
+    """Time sanitize_log_message against the one-pass-per-pattern version
+
+    Returns:
+        {"records": int, "sequential_per_sec": float, "combined_per_sec": float,
+         "differences": int} where differences counts records whose output
+        differs (overlapping value patterns, see sanitize_log_message)
+    """
+    import time
+
+    messages = [_BENCHMARK_MESSAGES[i % len(_BENCHMARK_MESSAGES)] + f" #{i}" * (i % 3 == 0)
+                for i in range(records)]
+    timings = {}
+    for name, sanitize in (('sequential', _sanitize_sequential),
+                           ('combined', InputValidator.sanitize_log_message)):
+        start = time.perf_counter()
+        results = [sanitize(m) for m in messages]
+        timings[name] = (time.perf_counter() - start, results)
+
+    return {
+        'records': records,
+        'sequential_per_sec': round(records / max(timings['sequential'][0], 1e-9), 1),
+        'combined_per_sec': round(records / max(timings['combined'][0], 1e-9), 1),
+        'differences': sum(a != b for a, b in zip(timings['sequential'][1], timings['combined'][1])),
+    }
 
 
 class ValidationError(Exception):
@@ -362,11 +509,11 @@ def main():
 
     parser.add_argument('action',
                         choices=['test', 'validate-task-id', 'validate-timestamp',
-                                 'validate-filename', 'sanitize-log'],
+                                 'validate-filename', 'sanitize-log', 'benchmark-sanitize'],
                         help='Action to perform')
 
     parser.add_argument('value', nargs='?',
-                        help='Value to validate or sanitize')
+                        help='Value to validate or sanitize (benchmark-sanitize: record count)')
 
     args = parser.parse_args()
 
@@ -540,6 +687,14 @@ def main():
         print(f"[OUTPUT] {sanitized}")
         sys.exit(0)
 
+    elif args.action == 'benchmark-sanitize':
+        result = benchmark_sanitizer(int(args.value) if args.value else 200_000)
+        print(f"[BENCH] {result['records']:,} log records")
+        print(f"  one re.sub per pattern : {result['sequential_per_sec']:>10,.0f} records/s")
+        print(f"  sanitize_log_message   : {result['combined_per_sec']:>10,.0f} records/s")
+        print(f"  differing outputs      : {result['differences']:>10,}")
+        sys.exit(0)
+
 
 if __name__ == '__main__':
     main()